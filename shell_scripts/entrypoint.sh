@@ -21,6 +21,10 @@ if [[ "${SNOW_SCHEDULER,,}" =~ ^(yes|true|1)$ ]]; then
     # Initiating supervisord to manage cron as a service (default config + conf.d)
     /usr/bin/supervisord -c /etc/supervisor/supervisord.conf
 
+elif [[ "${SNOW_WATCHER,,}" =~ ^(yes|true|1)$ ]]; then
+    # Watch MODIS and run the script in-process when a new month is complete
+    exec python -m snow_ipa.watch
+
 else
     # Run the python script named main.py and redirect output to Docker's logging driver
     exec python -m snow_ipa.main
@@ -1,7 +1,6 @@
 import argparse
 import os
-from snow_ipa.core.configs import DEFAULT_CONFIG
-
+from snow_ipa.core.configs import DEFAULT_CONFIG, EXPORT
 
 # NOTE: Some arguments are required but not forcing it since they can also be read from environment variables
 
@@ -53,6 +52,15 @@ def set_argument_parser() -> argparse.ArgumentParser:
         help="GEE asset path where images will be saved",
     )
 
+    # Inventory of the GEE Asset folder - OPTIONAL
+    parser.add_argument(
+        "--gee-inventory-path",
+        dest="gee_inventory_path",
+        default=os.getenv("SNOW_GEE_INVENTORY_PATH"),
+        type=str,
+        help="JSON file where the inventory of the GEE asset folder is kept and only refreshed when the folder changes",
+    )
+
     # Google Drive Path where images will be saved - CONDITIONALLY REQUIRED
     parser.add_argument(
         "-d",
@@ -63,6 +71,58 @@ def set_argument_parser() -> argparse.ArgumentParser:
         help="Google Drive path where images will be saved",
     )
 
+    # Shared drive where the Google Drive path is resolved - OPTIONAL
+    parser.add_argument(
+        "--gdrive-shared-drive-id",
+        dest="gdrive_shared_drive_id",
+        default=os.getenv("SNOW_GDRIVE_SHARED_DRIVE_ID"),
+        type=str,
+        help="ID of the shared drive that contains the Google Drive path. Paths are resolved from My Drive if not set",
+    )
+
+    # Google Drive folder ID cache - OPTIONAL
+    parser.add_argument(
+        "--gdrive-cache-path",
+        dest="gdrive_cache_path",
+        default=os.getenv("SNOW_GDRIVE_CACHE_PATH"),
+        type=str,
+        help="JSON file where Google Drive folder IDs are cached across runs",
+    )
+
+    parser.add_argument(
+        "--gdrive-cache-ttl",
+        dest="gdrive_cache_ttl",
+        default=os.getenv("SNOW_GDRIVE_CACHE_TTL"),
+        type=int,
+        help=f"Seconds a cached Google Drive folder ID is valid for (Default={DEFAULT_CONFIG['gdrive_cache_ttl']})",
+    )
+
+    # Incremental inventory of the Google Drive folder - OPTIONAL
+    parser.add_argument(
+        "--gdrive-inventory-path",
+        dest="gdrive_inventory_path",
+        default=os.getenv("SNOW_GDRIVE_INVENTORY_PATH"),
+        type=str,
+        help="JSON file where the inventory of the Google Drive folder is kept and updated incrementally with the Drive Changes API",
+    )
+
+    # Local path where small images will be downloaded directly - OPTIONAL
+    parser.add_argument(
+        "--local-assets-path",
+        dest="local_assets_path",
+        default=os.getenv("SNOW_LOCAL_ASSETS_PATH"),
+        type=str,
+        help="Local folder where images small enough are downloaded directly without export tasks",
+    )
+
+    parser.add_argument(
+        "--direct-download-max-bytes",
+        dest="direct_download_max_bytes",
+        default=os.getenv("SNOW_DIRECT_DOWNLOAD_MAX_BYTES"),
+        type=int,
+        help=f"Maximum estimated image size in bytes to download directly to the local folder (Default={DEFAULT_CONFIG['direct_download_max_bytes']})",
+    )
+
     # GEE Asset Path for reading regions FeatureCollection - REQUIRED
     parser.add_argument(
         "-r",
@@ -73,6 +133,39 @@ def set_argument_parser() -> argparse.ArgumentParser:
         help="GEE asset path for reading regions FeatureCollection",
     )
 
+    # Option to export one image per region - OPTIONAL default is False
+    parser.add_argument(
+        "--export-by-region",
+        dest="export_by_region",
+        default=(
+            os.getenv("SNOW_EXPORT_BY_REGION", "False").lower().strip("'\"")
+            in ("true", "1", "yes")
+        ),
+        action="store_true",
+        help="Export one image per feature in the regions FeatureCollection instead of a single image",
+    )
+
+    # Feature property used to name per-region images - OPTIONAL
+    parser.add_argument(
+        "--regions-name-property",
+        dest="regions_name_property",
+        default=os.getenv("SNOW_REGIONS_NAME_PROPERTY"),
+        type=str,
+        help=f"Property of the regions FeatureCollection used to name per-region images (Default={DEFAULT_CONFIG['regions_name_property']})",
+    )
+
+    # Option to export a table with statistics per region - OPTIONAL default is False
+    parser.add_argument(
+        "--export-region-stats",
+        dest="export_region_stats",
+        default=(
+            os.getenv("SNOW_EXPORT_REGION_STATS", "False").lower().strip("'\"")
+            in ("true", "1", "yes")
+        ),
+        action="store_true",
+        help="Export a table with the mean SCI and CCI per region for each month",
+    )
+
     # Option to export images to GEE - OPTIONAL default is False
     parser.add_argument(
         "--export-to-gee",
@@ -109,6 +202,142 @@ def set_argument_parser() -> argparse.ArgumentParser:
         help="Comma-separated list of months to export in the format 'YYYY-MM-DD, YYYY-MM-DD'. Default is to export the last fully available month in MODIS.",
     )
 
+    # Oversized exports - OPTIONAL
+    parser.add_argument(
+        "--max-pixels",
+        dest="max_pixels",
+        default=os.getenv("SNOW_MAX_PIXELS"),
+        type=float,
+        help=f"Maximum number of pixels per export task (Default={DEFAULT_CONFIG['max_pixels']:.0e})",
+    )
+
+    parser.add_argument(
+        "--oversized-exports",
+        dest="oversized_exports",
+        default=os.getenv("SNOW_OVERSIZED_EXPORTS"),
+        choices=EXPORT["oversized_options"],
+        type=str,
+        help=f"What to do with exports estimated above max-pixels. Valid options are: {', '.join(EXPORT['oversized_options'])} (Default={DEFAULT_CONFIG['oversized_exports']})",
+    )
+
+    # State of the last run - OPTIONAL
+    parser.add_argument(
+        "--state-path",
+        dest="state_path",
+        default=os.getenv("SNOW_STATE_PATH"),
+        type=str,
+        help="JSON file where the outcome of each run is saved. Runs exit early if MODIS has no new complete month since the last run",
+    )
+
+    # Option to ignore the state of the last run - OPTIONAL default is False
+    parser.add_argument(
+        "--force-full-check",
+        dest="force_full_check",
+        default=(
+            os.getenv("SNOW_FORCE_FULL_CHECK", "False").lower().strip("'\"")
+            in ("true", "1", "yes")
+        ),
+        action="store_true",
+        help="Check MODIS and all targets even if the state file says there is nothing to do",
+    )
+
+    # Cache of the MODIS catalog - OPTIONAL
+    parser.add_argument(
+        "--modis-catalog-path",
+        dest="modis_catalog_path",
+        default=os.getenv("SNOW_MODIS_CATALOG_PATH"),
+        type=str,
+        help="JSON file where the days with MODIS images are cached. Each run only scans the images added since the last run",
+    )
+
+    parser.add_argument(
+        "--modis-catalog-revalidate-days",
+        dest="modis_catalog_revalidate_days",
+        default=os.getenv("SNOW_MODIS_CATALOG_REVALIDATE_DAYS"),
+        type=float,
+        help=f"Days after which the whole MODIS catalog is scanned again to catch reprocessed images (Default={DEFAULT_CONFIG['modis_catalog_revalidate_days']})",
+    )
+
+    # Fingerprints of the exported months - OPTIONAL
+    parser.add_argument(
+        "--fingerprints-path",
+        dest="fingerprints_path",
+        default=os.getenv("SNOW_FINGERPRINTS_PATH"),
+        type=str,
+        help="JSON file where the fingerprint of the MODIS images used by each exported asset is saved. Assets of months reprocessed in MODIS are exported again",
+    )
+
+    # Trailing window of months to check again - OPTIONAL
+    parser.add_argument(
+        "--refresh-months",
+        dest="refresh_months",
+        default=os.getenv("SNOW_REFRESH_MONTHS"),
+        type=int,
+        help="Number of last complete months to check again for new MODIS images. Months with more images than when they were exported are exported again. Requires --fingerprints-path (Default=0)",
+    )
+
+    # Provisional product of the current month - OPTIONAL default is False
+    parser.add_argument(
+        "--provisional",
+        dest="provisional",
+        default=(
+            os.getenv("SNOW_PROVISIONAL", "False").lower().strip("'\"")
+            in ("true", "1", "yes")
+        ),
+        action="store_true",
+        help="Keep a provisional product of the current month in GEE Assets, updated with the new MODIS images of each run",
+    )
+
+    # Monthly intermediates - OPTIONAL default is False
+    parser.add_argument(
+        "--export-intermediates",
+        dest="export_intermediates",
+        default=(
+            os.getenv("SNOW_EXPORT_INTERMEDIATES", "False").lower().strip("'\"")
+            in ("true", "1", "yes")
+        ),
+        action="store_true",
+        help="Save the monthly sums and counts of SCI and CCI in GEE Assets to aggregate longer periods",
+    )
+
+    # Climatology and anomalies - OPTIONAL default is False
+    parser.add_argument(
+        "--export-climatology",
+        dest="export_climatology",
+        default=(
+            os.getenv("SNOW_EXPORT_CLIMATOLOGY", "False").lower().strip("'\"")
+            in ("true", "1", "yes")
+        ),
+        action="store_true",
+        help="Update the climatology of each calendar month and save the anomaly of each month exported in GEE Assets",
+    )
+
+    # Extra monthly statistics - OPTIONAL default is the mean only
+    parser.add_argument(
+        "--monthly-statistics",
+        dest="monthly_statistics",
+        default=os.getenv("SNOW_MONTHLY_STATISTICS"),
+        type=parse_list_arg,
+        help=f"Comma-separated list of statistics exported as extra bands of each monthly image, calculated with the mean in a single reduction. Valid options are: {', '.join(EXPORT['statistics_options'])}",
+    )
+
+    # Watcher options - OPTIONAL. Only used by snow_ipa.watch
+    parser.add_argument(
+        "--watch-interval",
+        dest="watch_interval",
+        default=os.getenv("SNOW_WATCH_INTERVAL"),
+        type=float,
+        help=f"Minutes between checks for new MODIS images in watcher mode (Default={DEFAULT_CONFIG['watch_interval']})",
+    )
+
+    parser.add_argument(
+        "--watch-quiet-hours",
+        dest="watch_quiet_hours",
+        default=os.getenv("SNOW_WATCH_QUIET_HOURS"),
+        type=str,
+        help="Range of hours HH:MM-HH:MM when the watcher doesn't check MODIS. e.g. 22:00-06:00",
+    )
+
     # Logging arguments - OPTIONAL
     # Set default log level
     valid_log_levels = ["DEBUG", "INFO", "WARNING", "ERROR"]
@@ -12,10 +12,20 @@ DEFAULT_CONFIG = {
     "service_credentials_file": None,
     "export_to_gee": False,
     "export_to_gdrive": False,
+    "local_assets_path": None,
+    "direct_download_max_bytes": 256 * 2**20,
     # "export_to": "toAsset",
     "gee_assets_path": None,
+    "gee_inventory_path": None,
     "gdrive_assets_path": None,
+    "gdrive_shared_drive_id": None,
+    "gdrive_cache_path": None,
+    "gdrive_cache_ttl": 7 * 24 * 60 * 60,
+    "gdrive_inventory_path": None,
     "regions_asset_path": None,
+    "export_by_region": False,
+    "regions_name_property": "REGION",
+    "export_region_stats": False,
     "months_list": None,
     "enable_email": False,
     "smtp_server": None,
@@ -32,7 +42,21 @@ DEFAULT_CONFIG = {
     "log_date_format": DEFAULT_LOGGING_CONFIG["date_format"],
     "status_check_wait": 30,
     "max_exports": 10,
+    "max_pixels": 1e8,
+    "oversized_exports": "split",
     "modis_min_month": "2000-03",
+    "modis_catalog_path": None,
+    "modis_catalog_revalidate_days": 30,
+    "fingerprints_path": None,
+    "refresh_months": 0,
+    "provisional": False,
+    "export_intermediates": False,
+    "export_climatology": False,
+    "monthly_statistics": None,
+    "state_path": None,
+    "force_full_check": False,
+    "watch_interval": 60,
+    "watch_quiet_hours": None,
 }
 
 PRIVATE_CONFIGS = ["smtp_password"]
@@ -56,3 +80,16 @@ MODIS = {
     "path": "MODIS/061/MOD10A1",
     "min_month": "2000-03",
 }
+
+EXPORT = {
+    "scale": 500,
+    "bands": ["SCI", "CCI"],
+    "bytes_per_band": 8,  # Monthly means are exported as Float64
+    "oversized_options": ["split", "reject"],
+    "statistics_options": ["count", "stdDev", "min", "max"],
+    "stats_suffix": "STATS",
+    "accumulator_suffix": "ACC",
+    "climatology_suffix": "CLIM",
+    "anomaly_suffix": "ANOM",
+    "stats_columns": ["region", "month", "sci_mean", "cci_mean", "valid_pixel_count"],
+}
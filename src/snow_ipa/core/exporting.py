@@ -1,4 +1,6 @@
+import re
 from snow_ipa.services.gee.exports import ExportList
+from snow_ipa.core.configs import EXPORT
 from snow_ipa.utils import dates
 from typing import Any
 from colorama import Fore, Style
@@ -12,6 +14,7 @@ class ExportManager:
     # Upstream asset lists
     modis_status: dict[str, Any]
     modis_distinct_months: list[str]
+    regions_asset: dict[str, Any]
 
     def __init__(
         self,
@@ -21,6 +24,17 @@ class ExportManager:
         gdrive_asset_path: str = "",
         months_to_save: list = [],
         image_prefix: str = "",
+        export_by_region: bool = False,
+        regions_name_property: str = "",
+        max_pixels: float = 1e8,
+        oversized_exports: str = "split",
+        export_region_stats: bool = False,
+        local_assets_path: str = "",
+        direct_download_max_bytes: int = 256 * 2**20,
+        provisional: bool = False,
+        export_intermediates: bool = False,
+        export_climatology: bool = False,
+        monthly_statistics: list[str] | None = None,
     ) -> None:
 
         # General Export Plan - If no explicit request, save last month
@@ -33,12 +47,36 @@ class ExportManager:
             months_to_save = [prev_month]
         self.export_plan["planned"] = months_to_save
 
+        # Statistics calculated with the monthly mean and exported as extra bands
+        self.monthly_statistics: list[str] = monthly_statistics or []
+
+        # Per-region exports. regions maps the asset-safe region name to the
+        # value of regions_name_property in the regions FeatureCollection
+        self.export_by_region: bool = export_by_region
+        self.regions_name_property: str = regions_name_property
+        self.regions: dict[str, Any] = {}
+
+        # Size estimates per region (None for the whole area). Regions above
+        # max_pixels are split in parts or rejected depending on oversized_exports
+        self.max_pixels: float = max_pixels
+        self.oversized_exports: str = oversized_exports
+        self.export_estimates: dict[str | None, dict] = {}
+        self.export_parts: dict[str, dict] = {}
+
+        # Regional statistics tables. One table per month
+        self.export_region_stats: bool = export_region_stats
+        self.gee_saved_tables: list[str] = []
+        self.gee_tables_to_save: list[str] = []
+        self.gdrive_saved_tables: list[str] = []
+        self.gdrive_tables_to_save: list[str] = []
+
         # GEE Export Plan
         self.export_to_gee: bool = export_to_gee
         self.gee_assets_path: str = gee_asset_path
         self.gee_saved_assets: list[str] = []
         self.gee_saved_assets_months: list[str] = []
         self.gee_assets_to_save: list[str] = []
+        self.gee_regions_to_save: dict[str, list[str | None]] = {}
 
         # GDrive Export Plan
         self.export_to_gdrive: bool = export_to_gdrive
@@ -46,10 +84,305 @@ class ExportManager:
         self.gdrive_saved_assets: list[str] = []
         self.gdrive_saved_assets_months: list[str] = []
         self.gdrive_assets_to_save: list[str] = []
+        self.gdrive_regions_to_save: dict[str, list[str | None]] = {}
+
+        # Local Export Plan. Only images estimated below direct_download_max_bytes
+        # are downloaded directly
+        self.export_to_local: bool = bool(local_assets_path)
+        self.local_assets_path: str = local_assets_path
+        self.direct_download_max_bytes: int = direct_download_max_bytes
+        self.local_saved_assets: list[str] = []
+        self.local_assets_to_save: list[str] = []
+        self.local_regions_to_save: dict[str, list[str | None]] = {}
+
+        # Provisional product of the current month. Running sums and counts of each
+        # month are kept in GEE accumulator assets {month: {"id", "last_day"}}
+        self.provisional: bool = provisional
+        self.provisional_month: str | None = None
+        self.accumulators: dict[str, dict] = {}
+        self.gee_saved_accumulators: list[str] = []
+
+        # Monthly intermediates. Accumulators of complete months saved to aggregate
+        # longer periods
+        self.export_intermediates: bool = export_intermediates
+        self.intermediates_to_save: list[str] = []
+
+        # Climatology of each calendar month and anomalies, updated with the months
+        # exported in each run
+        self.export_climatology: bool = export_climatology
+
+        # Reprocessing detection. Fingerprints and number of MODIS images of each
+        # month and of the months used by each saved asset
+        # {target: {asset_name: value}}. Saved assets whose month changed are
+        # exported again
+        self.modis_fingerprints: dict[str, str] = {}
+        self.modis_image_counts: dict[str, int] = {}
+        self.saved_fingerprints: dict[str, dict[str, str]] = {}
+        self.saved_image_counts: dict[str, dict[str, int]] = {}
+        self.assets_to_overwrite: dict[str, set[str]] = {
+            target: set() for target in ["gee", "gdrive", "local"]
+        }
 
         # Exclusion details. Can include duplicates if the image is being saved to both GEE and GDrive
         self.assets_excluded: dict = {}  #! No longer used
 
+    @property
+    def image_bands(self) -> list[str]:
+        """
+        Returns the bands of the monthly images. The mean of each band, named as the
+        band, followed by the extra statistics named <band>_<statistic>.
+        """
+        return EXPORT["bands"] + [
+            f"{band}_{statistic}"
+            for statistic in self.monthly_statistics
+            for band in EXPORT["bands"]
+        ]
+
+    @property
+    def export_regions(self) -> list[str | None]:
+        """
+        Returns the regions to export for each month. A single None is returned
+        when exporting one image for the whole area.
+        """
+        if self.export_by_region and self.regions:
+            regions: list[str | None] = list(self.regions.keys())
+        else:
+            regions = [None]
+
+        # Replace regions that were split with their parts
+        export_regions: list[str | None] = []
+        for region in regions:
+            parts = self.export_estimates.get(region, {}).get("parts", [])
+            export_regions.extend(parts if parts else [region])
+        return export_regions
+
+    def base_region(self, region: str | None) -> str | None:
+        """
+        Returns the region a part belongs to, or the same region if it's not a part.
+        """
+        if region in self.export_parts:
+            return self.export_parts[region]["region"]
+        return region
+
+    def is_rejected(self, region: str | None) -> bool:
+        """
+        Returns True if the export of a region was rejected for being too large.
+        """
+        return self.export_estimates.get(region, {}).get("rejected", False)
+
+    def export_bounds(self, region: str | None) -> list | None:
+        """
+        Returns the bounding box [xmin, ymin, xmax, ymax] of a region or part.
+        """
+        if region in self.export_parts:
+            return self.export_parts[region]["bounds"]
+        return self.export_estimates.get(region, {}).get("bounds")
+
+    def estimated_bytes(self, region: str | None) -> float | None:
+        """
+        Returns the estimated size in bytes of the image of a region or part.
+        None if there is no estimate for the region.
+        """
+        estimate = self.export_estimates.get(self.base_region(region))
+        if not estimate:
+            return None
+        return estimate["bytes"] / len(estimate.get("parts") or [None])
+
+    def fits_direct_download(self, region: str | None) -> bool:
+        """
+        Returns True if the image of a region or part is small enough to be
+        downloaded directly. Only used by the local target, GEE and Drive exports
+        always run as batch tasks.
+        """
+        estimated_bytes = self.estimated_bytes(region)
+        if estimated_bytes is None:
+            return False
+        return estimated_bytes <= self.direct_download_max_bytes
+
+    def image_name(self, month: str, region: str | None = None) -> str:
+        """
+        Returns the name of the image to export for a month and, optionally, a region.
+
+        Args:
+            month (str): Month in the format YYYY-MM-DD.
+            region (str): Asset-safe region name. None for the whole area.
+
+        Returns:
+            str: <prefix>_<YYYY-MM> or <prefix>_<region>_<YYYY-MM>
+        """
+        if region:
+            return f"{self.image_prefix}_{region}_{month[:7]}"
+        return f"{self.image_prefix}_{month[:7]}"
+
+    def table_name(self, month: str) -> str:
+        """
+        Returns the name of the regional statistics table of a month.
+
+        Args:
+            month (str): Month in the format YYYY-MM-DD.
+
+        Returns:
+            str: <prefix>_STATS_<YYYY-MM>
+        """
+        return f"{self.image_prefix}_{EXPORT['stats_suffix']}_{month[:7]}"
+
+    def is_reprocessed(self, target: str, asset_name: str, month: str) -> bool:
+        """
+        Returns True if the MODIS images of a month changed since a saved asset was
+        exported. Saved assets without a recorded fingerprint take the current one.
+
+        Args:
+            target (str): "gee", "gdrive" or "local"
+            asset_name (str): Name of the saved image or table.
+            month (str): Month in the format YYYY-MM-DD.
+        """
+        fingerprint = self.modis_fingerprints.get(month)
+        if not fingerprint:
+            return False
+        saved = self.saved_fingerprints.setdefault(target, {})
+        if asset_name not in saved:
+            saved[asset_name] = fingerprint
+            return False
+        return saved[asset_name] != fingerprint
+
+    def has_new_images(self, target: str, asset_name: str, month: str) -> bool:
+        """
+        Returns True if MODIS has more images for a month than when a saved asset
+        was exported. Saved assets without a recorded count take the current one.
+
+        Args:
+            target (str): "gee", "gdrive" or "local"
+            asset_name (str): Name of the saved image or table.
+            month (str): Month in the format YYYY-MM-DD.
+        """
+        image_count = self.modis_image_counts.get(month)
+        if image_count is None:
+            return False
+        saved = self.saved_image_counts.setdefault(target, {})
+        if asset_name not in saved:
+            saved[asset_name] = image_count
+            return False
+        return image_count > saved[asset_name]
+
+    def needs_update(self, target: str, asset_name: str, month: str) -> bool:
+        """
+        Returns True if a saved asset has to be exported again because its month was
+        reprocessed or has new images in MODIS.
+        """
+        reprocessed = self.is_reprocessed(target, asset_name, month)
+        new_images = self.has_new_images(target, asset_name, month)
+        return reprocessed or new_images
+
+    @property
+    def recorded_months(self) -> list[str]:
+        """
+        Returns the months, YYYY-MM-01, of the saved assets with a recorded
+        fingerprint or number of images.
+        """
+        months = set()
+        for recorded in [self.saved_fingerprints, self.saved_image_counts]:
+            for assets in recorded.values():
+                for asset_name in assets:
+                    month = re.search(r"(\d{4}-\d{2})$", asset_name)
+                    if month:
+                        months.add(f"{month.group(1)}-01")
+        return sorted(months, reverse=True)
+
+    def reprocessed_months(self) -> list[str]:
+        """
+        Returns the months of the saved assets whose MODIS images were reprocessed,
+        or completed with new images, since they were exported.
+        """
+        months = set()
+        for target, assets in self.saved_fingerprints.items():
+            for asset_name, fingerprint in assets.items():
+                month = re.search(r"(\d{4}-\d{2})$", asset_name)
+                if not month:
+                    continue
+                current = self.modis_fingerprints.get(f"{month.group(1)}-01")
+                if current and current != fingerprint:
+                    months.add(f"{month.group(1)}-01")
+        for target, assets in self.saved_image_counts.items():
+            for asset_name, image_count in assets.items():
+                month = re.search(r"(\d{4}-\d{2})$", asset_name)
+                if not month:
+                    continue
+                current = self.modis_image_counts.get(f"{month.group(1)}-01")
+                if current is not None and current > image_count:
+                    months.add(f"{month.group(1)}-01")
+        return sorted(months, reverse=True)
+
+    def record_exported_months(self) -> None:
+        """
+        Records the fingerprint and number of images of the month of each completed
+        export task.
+        """
+        for task in self.export_tasks.export_tasks:
+            if task.status not in ["COMPLETED", "FINISHED"]:
+                continue
+            fingerprint = self.modis_fingerprints.get(task.date)
+            if fingerprint:
+                self.saved_fingerprints.setdefault(task.target, {})[
+                    task.image
+                ] = fingerprint
+            image_count = self.modis_image_counts.get(task.date)
+            if image_count is not None:
+                self.saved_image_counts.setdefault(task.target, {})[
+                    task.image
+                ] = image_count
+
+    @property
+    def saved_months(self) -> dict:
+        """
+        Returns the fingerprints and number of images recorded for the saved assets.
+        """
+        return {
+            "fingerprints": self.saved_fingerprints,
+            "image_counts": self.saved_image_counts,
+        }
+
+    @saved_months.setter
+    def saved_months(self, value: dict) -> None:
+        self.saved_fingerprints = value.get("fingerprints", {})
+        self.saved_image_counts = value.get("image_counts", {})
+
+    def accumulator_name(self, month: str) -> str:
+        """
+        Returns the name of the accumulator asset of a month.
+
+        Args:
+            month (str): Month in the format YYYY-MM-DD.
+
+        Returns:
+            str: <prefix>_ACC_<YYYY-MM>
+        """
+        return f"{self.image_prefix}_{EXPORT['accumulator_suffix']}_{month[:7]}"
+
+    def climatology_name(self, month: str) -> str:
+        """
+        Returns the name of the climatology of a calendar month.
+
+        Args:
+            month (str): Month in the format YYYY-MM-DD or the calendar month MM.
+
+        Returns:
+            str: <prefix>_CLIM_<MM>
+        """
+        calendar_month = month[5:7] if len(month) > 2 else month
+        return f"{self.image_prefix}_{EXPORT['climatology_suffix']}_{calendar_month}"
+
+    def anomaly_name(self, month: str) -> str:
+        """
+        Returns the name of the anomaly of a month.
+
+        Args:
+            month (str): Month in the format YYYY-MM-DD.
+
+        Returns:
+            str: <prefix>_ANOM_<YYYY-MM>
+        """
+        return f"{self.image_prefix}_{EXPORT['anomaly_suffix']}_{month[:7]}"
+
     # ! Method/Property might no longer be needed
     @property
     def final_assets_to_save(self) -> list:
@@ -85,6 +418,10 @@ class ExportManager:
         else:
             str_export_plan += "- No images to export"
 
+        if self.provisional_month:
+            str_export_plan += f"\n{Fore.GREEN}Provisional:{Style.RESET_ALL}\n"
+            str_export_plan += f"  |- {self.provisional_month}"
+
         if list(self.export_plan["excluded"].keys()):
             str_export_plan += f"\n{Fore.GREEN}Excluded:{Style.RESET_ALL}\n"
             str_excluded = [
@@ -93,6 +430,20 @@ class ExportManager:
             ]
             str_export_plan += "\n".join(str_excluded)
 
+        if self.export_estimates:
+            str_export_plan += (
+                f"\n{Fore.GREEN}Estimated size per image:{Style.RESET_ALL}\n"
+            )
+            str_estimates = []
+            for region, estimate in self.export_estimates.items():
+                str_estimate = f"  |- {region or 'all regions'}: {estimate['pixels']:,} pixels, {estimate['bytes'] / 2**20:,.1f} MB"
+                if estimate.get("rejected"):
+                    str_estimate += " - REJECTED (above max pixels)"
+                elif estimate.get("parts"):
+                    str_estimate += f" - split in {len(estimate['parts'])} parts"
+                str_estimates.append(str_estimate)
+            str_export_plan += "\n".join(str_estimates)
+
         return str_export_plan
 
     def print_export_status(self) -> str:
@@ -132,4 +483,13 @@ class ExportManager:
             ]
             str_export_status += "\n".join(gdrive_tasks)
 
+        if self.export_to_local:
+            if self.export_to_gee or self.export_to_gdrive:
+                str_export_status += f"\n"
+            str_export_status += f"{Fore.GREEN}Local Downloads:{Style.RESET_ALL} \n"
+            local_tasks = [
+                task["str"] for task in task_str if task["target"] == "local"
+            ]
+            str_export_status += "\n".join(local_tasks)
+
         return str_export_status
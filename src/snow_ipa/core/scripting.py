@@ -10,6 +10,7 @@ from snow_ipa.core.configs import (
     DEFAULT_CONFIG,
     PRIVATE_CONFIGS,
     REQUIRED_EMAIL_CONFIGS,
+    EXPORT,
 )
 from snow_ipa.core.command_line import set_argument_parser
 
@@ -33,10 +34,15 @@ class ScriptManager:
 
         self.update_config(new_config)
 
-        # if Export to GEE and GDRIVE are false default to GEE=TRUE
+        # if Export to GEE, GDRIVE and LOCAL are false default to GEE=TRUE
         self.export_to_gee: bool = self.config["export_to_gee"]
         self.export_to_gdrive: bool = self.config["export_to_gdrive"]
-        if not self.export_to_gee and not self.export_to_gdrive:
+        self.export_to_local: bool = bool(self.config["local_assets_path"])
+        if (
+            not self.export_to_gee
+            and not self.export_to_gdrive
+            and not self.export_to_local
+        ):
             self.export_to_gee = True
 
     def update_config(self, new_config: dict | None = None) -> dict:
@@ -94,6 +100,50 @@ class ScriptManager:
                     "One or more dates provided in months_list are not valid"
                 )
 
+        if self.config["oversized_exports"] not in EXPORT["oversized_options"]:
+            raise ValueError(
+                f"Invalid oversized_exports option. Valid options are: {', '.join(EXPORT['oversized_options'])}."
+            )
+
+        if float(self.config["max_pixels"]) <= 0:
+            raise ValueError("max_pixels must be greater than 0.")
+
+        if int(self.config["gdrive_cache_ttl"]) <= 0:
+            raise ValueError("gdrive_cache_ttl must be greater than 0.")
+
+        if float(self.config["modis_catalog_revalidate_days"]) <= 0:
+            raise ValueError("modis_catalog_revalidate_days must be greater than 0.")
+
+        if int(self.config["refresh_months"]) < 0:
+            raise ValueError("refresh_months can't be negative.")
+
+        if (
+            int(self.config["refresh_months"]) > 0
+            and not self.config["fingerprints_path"]
+        ):
+            raise ValueError("fingerprints_path is required to use refresh_months.")
+
+        if self.config["provisional"] and not self.export_to_gee:
+            raise ValueError("provisional requires exporting to GEE Assets.")
+
+        if self.config["export_intermediates"] and not self.export_to_gee:
+            raise ValueError("export_intermediates requires exporting to GEE Assets.")
+
+        if self.config["export_climatology"] and not self.export_to_gee:
+            raise ValueError("export_climatology requires exporting to GEE Assets.")
+
+        for statistic in self.config["monthly_statistics"] or []:
+            if statistic not in EXPORT["statistics_options"]:
+                raise ValueError(
+                    f"Invalid monthly statistic: {statistic}. Valid options are: {', '.join(EXPORT['statistics_options'])}."
+                )
+
+        if float(self.config["watch_interval"]) <= 0:
+            raise ValueError("watch_interval must be greater than 0.")
+
+        if self.config["watch_quiet_hours"]:
+            dates.parse_quiet_hours(self.config["watch_quiet_hours"])
+
         logger.debug("---Required configuration verified")
         return True
 
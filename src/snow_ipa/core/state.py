@@ -0,0 +1,169 @@
+import hashlib
+import json
+import logging
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from snow_ipa.services.gee.exports import GEE_TASK_STATUS
+
+logger = logging.getLogger(__name__)
+
+# Outcomes of a run that leave all targets up to date
+UP_TO_DATE_OUTCOMES = ["UP_TO_DATE", "COMPLETED"]
+
+# Task statuses that leave the exported asset saved or not needed. Cancelled tasks
+# are counted as completed by the export summary but saved nothing
+DONE_TASK_STATUSES = GEE_TASK_STATUS["EXCLUDED"] + ["COMPLETED", "FINISHED"]
+
+# Configuration that changes what a run would export
+PLAN_CONFIGS = [
+    "export_to_gee",
+    "export_to_gdrive",
+    "local_assets_path",
+    "gee_assets_path",
+    "gdrive_assets_path",
+    "regions_asset_path",
+    "export_by_region",
+    "regions_name_property",
+    "export_region_stats",
+    "max_pixels",
+    "oversized_exports",
+    "monthly_statistics",
+    "fingerprints_path",
+    "export_intermediates",
+    "export_climatology",
+]
+
+
+def read_state(state_path: str) -> dict:
+    """
+    Reads the state saved by the last run.
+
+    Args:
+        state_path (str): Path of the JSON state file.
+
+    Returns:
+        dict: The saved state or an empty dictionary if the file doesn't exist or
+        can't be read.
+    """
+    path = Path(state_path)
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        logger.warning(f"Can't read state file {state_path}: {e}")
+        return {}
+
+
+def write_state(state_path: str, state: dict) -> None:
+    """
+    Saves the state of the current run.
+
+    Args:
+        state_path (str): Path of the JSON state file.
+        state (dict): The state to save.
+    """
+    path = Path(state_path)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(state, indent=2), encoding="utf-8")
+    except OSError as e:
+        logger.warning(f"Can't write state file {state_path}: {e}")
+
+
+def plan_signature(config: dict) -> str:
+    """
+    Returns a hash of the configuration that changes what a run would export, so a
+    saved state is only reused with the same targets and options.
+
+    Args:
+        config (dict): The script configuration, with the export_to_* values
+            actually used by the run.
+    """
+    plan_config = {key: config.get(key) for key in PLAN_CONFIGS}
+    return hashlib.sha256(
+        json.dumps(plan_config, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+
+
+def latest_possible_complete_month(last_image: str) -> str:
+    """
+    Returns the latest month that can be complete given the date of the last image
+    available.
+
+    Args:
+        last_image (str): Date of the last image in the format YYYY-MM-DD.
+
+    Returns:
+        str: The month in the format YYYY-MM. e.g. "2024-10" for "2024-10-31" and
+        "2024-09" for "2024-10-30".
+    """
+    next_day = date.fromisoformat(last_image) + timedelta(days=1)
+    return (next_day.replace(day=1) - timedelta(days=1)).strftime("%Y-%m")
+
+
+def can_skip_run(state: dict, config: dict, last_image: str) -> bool:
+    """
+    Returns True if the last run left every target up to date with the same
+    configuration and MODIS has no newly completed month since then.
+
+    Runs with an explicit list of months, that check the last months again
+    (refresh_months), that update the provisional product or that detect
+    reprocessed MODIS months (fingerprints_path) are never skipped.
+
+    Args:
+        state (dict): The state saved by the last run.
+        config (dict): The script configuration of the current run.
+        last_image (str): Date of the last MODIS image available, YYYY-MM-DD.
+    """
+    if (
+        not state
+        or config.get("months_list")
+        or config.get("refresh_months")
+        or config.get("provisional")
+        or config.get("fingerprints_path")
+    ):
+        return False
+    if state.get("signature") != plan_signature(config):
+        logger.debug("Configuration changed since the last run")
+        return False
+    if state.get("outcome") not in UP_TO_DATE_OUTCOMES:
+        logger.debug(f"Last run outcome: {state.get('outcome')}")
+        return False
+    if not state.get("last_complete_month"):
+        return False
+    return latest_possible_complete_month(last_image) <= state["last_complete_month"]
+
+
+def run_outcome(task_statuses: list[str]) -> str:
+    """
+    Returns the outcome of a run from the statuses of its export tasks.
+
+    Args:
+        task_statuses (list): Status of each export task of the run.
+
+    Returns:
+        str: "COMPLETED" if every task saved its asset or wasn't needed,
+            "FAILED" otherwise, including cancelled tasks.
+    """
+    if all(status in DONE_TASK_STATUSES for status in task_statuses):
+        return "COMPLETED"
+    return "FAILED"
+
+
+def build_state(config: dict, modis_status: dict, outcome: str) -> dict:
+    """
+    Returns the state of the current run to save.
+
+    Args:
+        config (dict): The script configuration of the current run.
+        modis_status (dict): The MODIS status read by the run.
+        outcome (str): "UP_TO_DATE", "COMPLETED" or "FAILED".
+    """
+    return {
+        "signature": plan_signature(config),
+        "last_image": modis_status.get("last_image"),
+        "last_complete_month": modis_status.get("last_complete_month"),
+        "outcome": outcome,
+        "updated_at": datetime.now().isoformat(timespec="seconds"),
+    }
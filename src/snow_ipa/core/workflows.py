@@ -1,19 +1,31 @@
 import logging
+import math
 import re
+from datetime import date, timedelta
 from pathlib import Path
 import ee
+from ee import ee_date
+from ee.image import Image
 from ee.imagecollection import ImageCollection
 from ee.featurecollection import FeatureCollection
+from ee.geometry import Geometry
 from ee import batch
 
 from snow_ipa.core.exporting import ExportManager
+from snow_ipa.core.configs import EXPORT, MODIS
 from snow_ipa.services.gee import (
     assets as gee_assets,
     imagecollection as gee_imagecollection,
+    featurecollection as gee_featurecollection,
     exports,
     calculations,
+    download,
+    inventory as gee_inventory,
+)
+from snow_ipa.services.gdrive import (
+    assets as gdrive_assets,
+    inventory as gdrive_inventory,
 )
-from snow_ipa.services.gdrive import assets as gdrive_assets
 
 logger = logging.getLogger(__name__)
 
@@ -21,18 +33,272 @@ logger = logging.getLogger(__name__)
 # TODO: Set max number of exports
 
 
+def saved_assets_pattern(image_prefix: str) -> str:
+    """
+    Returns the regex used to recognize exported images by name.
+
+    Matches <prefix>_<YYYY-MM> and per-region images <prefix>_<region>_<YYYY-MM>.
+    Accumulators, anomalies, climatologies and statistics tables share the prefix
+    but are not monthly images, so their suffixes are never read as a region.
+
+    Args:
+        image_prefix (str): Prefix of the exported images. Any prefix if empty.
+
+    Returns:
+        str: A regex pattern to use with re.fullmatch
+    """
+    prefix = re.escape(image_prefix) if image_prefix else ".*"
+    reserved = "|".join(
+        EXPORT[suffix]
+        for suffix in [
+            "accumulator_suffix",
+            "anomaly_suffix",
+            "climatology_suffix",
+            "stats_suffix",
+        ]
+    )
+    return rf"^{prefix}_(?:(?!(?:{reserved})_)[A-Za-z0-9-]+_)?(\d{{4}})-(\d{{2}})"
+
+
+def saved_accumulators_pattern(image_prefix: str) -> str:
+    """
+    Returns the regex used to recognize accumulator assets by name.
+
+    Matches <prefix>_<accumulator_suffix>_<YYYY-MM>.
+
+    Args:
+        image_prefix (str): Prefix of the exported images. Any prefix if empty.
+
+    Returns:
+        str: A regex pattern to use with re.fullmatch
+    """
+    prefix = re.escape(image_prefix) if image_prefix else ".*"
+    return rf"^{prefix}_{EXPORT['accumulator_suffix']}_(\d{{4}})-(\d{{2}})"
+
+
+# Regions
+def get_regions(export_manager: ExportManager, ee_regions: FeatureCollection):
+    """
+    Updates ExportManager with the regions to export when exporting by region.
+
+    Region names are read from the `regions_name_property` of each feature and
+    converted to asset-safe names.
+
+    Args:
+        export_manager (ExportManager): The export manager instance.
+        ee_regions (FeatureCollection): The regions FeatureCollection.
+    """
+    logger.debug(f"--- Reading region names")
+    try:
+        region_values = gee_featurecollection.fc_get_distinct_values(
+            collection=ee_regions, property=export_manager.regions_name_property
+        )
+        regions = {}
+        for value in region_values:
+            region_name = gee_assets.to_asset_name(value)
+            if not region_name or region_name in regions:
+                raise ValueError(
+                    f"Can't create a unique image name for region '{value}'"
+                )
+            regions[region_name] = value
+
+        logger.debug(f"Regions to export: {list(regions.keys())}")
+        export_manager.regions = regions
+
+    except Exception as e:
+        logger.error(f"Error occurred while reading regions: {e}", exc_info=True)
+        raise e
+
+
+def get_export_geometry(
+    export_manager: ExportManager,
+    ee_regions: FeatureCollection,
+    region: str | None = None,
+):
+    """
+    Returns the geometry to export for a region, or the whole regions
+    FeatureCollection if region is None. Parts of split regions are returned
+    as rectangles.
+    """
+    if region in export_manager.export_parts:
+        return Geometry.Rectangle(
+            export_manager.export_parts[region]["bounds"], "EPSG:4326", False
+        )
+    if region is None:
+        return ee_regions.geometry()  # type: ignore
+    return gee_featurecollection.fc_get_feature_geometry(
+        collection=ee_regions,
+        property=export_manager.regions_name_property,
+        value=export_manager.regions[region],
+    )
+
+
+# Export size estimates
+def calculate_export_size(
+    bounds: list,
+    scale: float = EXPORT["scale"],
+    n_bands: int = len(EXPORT["bands"]),
+    bytes_per_band: int = EXPORT["bytes_per_band"],
+) -> dict:
+    """
+    Estimates the number of pixels and the output size of an image export.
+
+    Exports set no crs, so they run on an EPSG:4326 grid of scale / 111320 degrees.
+    Pixels are counted on that grid, where a pixel covers less than scale**2 m2
+    away from the equator.
+
+    Args:
+        bounds (list): Bounding box of the export region [xmin, ymin, xmax, ymax]
+            in degrees.
+        scale (float): Export scale in meters.
+        n_bands (int): Number of bands in the exported image.
+        bytes_per_band (int): Size of each pixel value in bytes.
+
+    Returns:
+        dict: {"pixels": int, "bytes": int}
+    """
+    grid = download.get_pixel_grid(bounds, scale / download.METERS_PER_DEGREE)
+    pixels = grid["width"] * grid["height"]
+    return {"pixels": pixels, "bytes": pixels * n_bands * bytes_per_band}
+
+
+def split_bounds(bounds: list, parts: int) -> list[list]:
+    """
+    Splits a bounding box in equal strips along its longest side.
+
+    Args:
+        bounds (list): [xmin, ymin, xmax, ymax]
+        parts (int): Number of strips.
+
+    Returns:
+        list: A list of bounding boxes [xmin, ymin, xmax, ymax]
+    """
+    xmin, ymin, xmax, ymax = bounds
+    split_bounds = []
+    if (ymax - ymin) >= (xmax - xmin):
+        step = (ymax - ymin) / parts
+        for i in range(parts):
+            split_bounds.append([xmin, ymin + i * step, xmax, ymin + (i + 1) * step])
+    else:
+        step = (xmax - xmin) / parts
+        for i in range(parts):
+            split_bounds.append([xmin + i * step, ymin, xmin + (i + 1) * step, ymax])
+    return split_bounds
+
+
+def estimate_exports(export_manager: ExportManager, ee_regions: FeatureCollection):
+    """
+    Updates ExportManager with the estimated size of the images to export.
+
+    Estimates are based on the pixel grid of the bounding box of each export
+    region, the export scale and the number of bands. Regions above `max_pixels` are split in
+    parts or rejected depending on `oversized_exports`.
+
+    Args:
+        export_manager (ExportManager): The export manager instance.
+        ee_regions (FeatureCollection): The regions FeatureCollection.
+    """
+    logger.debug(f"--- Estimating export sizes")
+    try:
+        if export_manager.export_by_region:
+            region_names = {
+                value: name for name, value in export_manager.regions.items()
+            }
+            bounds_info = gee_featurecollection.fc_get_bounds_info(
+                collection=ee_regions,
+                property=export_manager.regions_name_property,
+                values=list(region_names.keys()),
+            )
+            bounds_info = {
+                region_names[value]: info for value, info in bounds_info.items()
+            }
+        else:
+            bounds_info = gee_featurecollection.fc_get_bounds_info(ee_regions)
+
+        estimates: dict[str | None, dict] = {}
+        parts: dict[str, dict] = {}
+        for region, info in bounds_info.items():
+            estimate = calculate_export_size(
+                info["bounds"], n_bands=len(export_manager.image_bands)
+            )
+            estimate["bounds"] = info["bounds"]
+            if estimate["pixels"] > export_manager.max_pixels:
+                if export_manager.oversized_exports == "reject":
+                    estimate["rejected"] = True
+                    logger.warning(
+                        f"Export of {region or 'all regions'} rejected: {estimate['pixels']} pixels above max pixels"
+                    )
+                else:
+                    n_parts = math.ceil(estimate["pixels"] / export_manager.max_pixels)
+                    estimate["parts"] = []
+                    for i, part_bounds in enumerate(
+                        split_bounds(info["bounds"], n_parts), start=1
+                    ):
+                        part = f"{region}-part{i}" if region else f"part{i}"
+                        estimate["parts"].append(part)
+                        parts[part] = {"region": region, "bounds": part_bounds}
+                    logger.info(
+                        f"Export of {region or 'all regions'} split in {n_parts} parts: {estimate['pixels']} pixels above max pixels"
+                    )
+            estimates[region] = estimate
+
+        export_manager.export_estimates = estimates
+        export_manager.export_parts = parts
+
+    except Exception as e:
+        logger.error(
+            f"Error occurred while estimating export sizes: {e}", exc_info=True
+        )
+        raise e
+
+
 # GEE Assets
-def get_gee_saved_assets(export_manager: ExportManager, gee_asset_path: str):
+def list_gee_assets(
+    gee_asset_path: str,
+    asset_type: str,
+    name_prefix: str | None = None,
+    inventory: gee_inventory.GeeInventory | None = None,
+) -> list[str]:
+    """
+    Lists the assets in the GEE folder, from the inventory if set or listing the
+    folder otherwise.
+
+    Args:
+        gee_asset_path (str): The path to the GEE assets.
+        asset_type (str): "IMAGE" or "TABLE".
+        name_prefix (str): Only list assets whose name starts with name_prefix.
+        inventory (GeeInventory): Inventory of the folder, already synced.
+
+    Returns:
+        list: Full ID of the assets.
+    """
+    if inventory is not None:
+        return list(
+            inventory.iter_assets(asset_type=[asset_type], name_prefix=name_prefix)
+        )
+    return list(
+        gee_assets.get_asset_list(gee_asset_path, asset_type, name_prefix=name_prefix)
+    )
+
+
+def get_gee_saved_assets(
+    export_manager: ExportManager,
+    gee_asset_path: str,
+    inventory: gee_inventory.GeeInventory | None = None,
+):
     """
     Updates ExportManager with a list of saved assets in Google Earth Engine (GEE).
 
-    Adds two lists to the ExportManager:
+    Adds three lists to the ExportManager:
     - `gee_saved_assets`: List of assets with the full image name excluding path.
     - `gee_saved_assets_months`: List of months in the format YYYY-MM-DD
+    - `gee_saved_accumulators`: List of accumulator assets excluding path.
 
     Args:
         export_manager (ExportManager): The export manager instance.
         gee_asset_path (str): The path to the GEE assets.
+        inventory (GeeInventory): If set, assets are read from this inventory
+            instead of listing the folder.
 
     Returns:
         list: List of saved assets in GEE.
@@ -40,16 +306,28 @@ def get_gee_saved_assets(export_manager: ExportManager, gee_asset_path: str):
     logger.debug(f"--- Checking for images already saved to GEE")
     try:
 
-        gee_saved_assets = gee_assets.get_asset_list(gee_asset_path, "IMAGE")
+        gee_saved_assets = list_gee_assets(
+            gee_asset_path,
+            "IMAGE",
+            name_prefix=(
+                f"{export_manager.image_prefix}_"
+                if export_manager.image_prefix
+                else None
+            ),
+            inventory=inventory,
+        )
 
         # Remove the path from the asset names
         gee_saved_assets = [Path(asset).name for asset in gee_saved_assets]
 
+        # Accumulators share the prefix but are not monthly images
+        pattern = saved_accumulators_pattern(export_manager.image_prefix)
+        gee_saved_accumulators = [
+            image for image in gee_saved_assets if re.fullmatch(pattern, image)
+        ]
+
         # Keep only assets that start with the image prefix and end with YYYY-MM
-        if export_manager.image_prefix:
-            pattern = rf"^{export_manager.image_prefix}_(\d{{4}})-(\d{{2}})"
-        else:
-            pattern = r".*_(\d{4})-(\d{2})"
+        pattern = saved_assets_pattern(export_manager.image_prefix)
         gee_saved_assets = [
             image for image in gee_saved_assets if re.fullmatch(pattern, image)
         ]
@@ -68,6 +346,7 @@ def get_gee_saved_assets(export_manager: ExportManager, gee_asset_path: str):
 
         export_manager.gee_saved_assets = gee_saved_assets
         export_manager.gee_saved_assets_months = gee_saved_assets_months
+        export_manager.gee_saved_accumulators = gee_saved_accumulators
 
     except Exception as e:
         logger.error(
@@ -77,8 +356,48 @@ def get_gee_saved_assets(export_manager: ExportManager, gee_asset_path: str):
 
 
 # Google Drive
+def list_gdrive_assets(
+    gdrive_service,
+    gdrive_assets_path: str,
+    asset_type: str,
+    name_prefix: str | None = None,
+    inventory_path: str | None = None,
+) -> list[str]:
+    """
+    Lists the assets in the Google Drive folder, from the incremental inventory if
+    inventory_path is set or listing the folder otherwise.
+
+    Args:
+        gdrive_service (object): The Google Drive service instance.
+        gdrive_assets_path (str): The path to the Google Drive assets.
+        asset_type (str): "IMAGE" or "TABLE".
+        name_prefix (str): Only list assets whose name starts with name_prefix.
+        inventory_path (str): JSON file where the inventory of the folder is kept.
+
+    Returns:
+        list: Names of the assets without extension.
+    """
+    if inventory_path:
+        return gdrive_inventory.get_asset_list(
+            drive_service=gdrive_service,
+            path=gdrive_assets_path,
+            store_path=inventory_path,
+            asset_type=asset_type,
+            name_prefix=name_prefix,
+        )
+    return gdrive_assets.get_asset_list(
+        drive_service=gdrive_service,
+        path=gdrive_assets_path,
+        asset_type=asset_type,
+        name_prefix=name_prefix,
+    )
+
+
 def get_gdrive_saved_assets(
-    export_manager: ExportManager, gdrive_assets_path: str, gdrive_service
+    export_manager: ExportManager,
+    gdrive_assets_path: str,
+    gdrive_service,
+    inventory_path: str | None = None,
 ):
     """
     Get the list of saved assets in Google Drive.
@@ -87,23 +406,28 @@ def get_gdrive_saved_assets(
         export_manager (ExportManager): The export manager instance.
         gdrive_asset_path (str): The path to the Google Drive assets.
         gdrive_service (object): The Google Drive service instance.
+        inventory_path (str): If set, assets are read from an inventory kept in this
+            file and updated with the Drive Changes API instead of listing the folder.
     Returns:
         list: List of saved assets in Google Drive.
     """
     logger.debug(f"--- Checking for images already saved to Google Drive")
     try:
 
-        gdrive_saved_assets = gdrive_assets.get_asset_list(
-            drive_service=gdrive_service,
-            path=gdrive_assets_path,
+        gdrive_saved_assets = list_gdrive_assets(
+            gdrive_service=gdrive_service,
+            gdrive_assets_path=gdrive_assets_path,
             asset_type="IMAGE",
+            name_prefix=(
+                f"{export_manager.image_prefix}_"
+                if export_manager.image_prefix
+                else None
+            ),
+            inventory_path=inventory_path,
         )
 
         # Keep only assets that start with the image prefix and end with YYYY-MM
-        if export_manager.image_prefix:
-            pattern = rf"^{export_manager.image_prefix}_(\d{{4}})-(\d{{2}})"
-        else:
-            pattern = r".*_(\d{4})-(\d{2})"
+        pattern = saved_assets_pattern(export_manager.image_prefix)
         gdrive_saved_assets = [
             image for image in gdrive_saved_assets if re.fullmatch(pattern, image)
         ]
@@ -132,22 +456,155 @@ def get_gdrive_saved_assets(
         raise e
 
 
-def target_export_plan(
+# Local downloads
+def get_local_saved_assets(export_manager: ExportManager, local_assets_path: str):
+    """
+    Updates ExportManager with the list of images already downloaded to the local
+    folder. Images can be saved as a GeoTIFF (.tif) or a mosaic of chunks (.vrt).
+
+    Args:
+        export_manager (ExportManager): The export manager instance.
+        local_assets_path (str): The path to the local folder.
+    """
+    logger.debug(f"--- Checking for images already saved to local folder")
+    try:
+        local_path = Path(local_assets_path)
+        local_path.mkdir(parents=True, exist_ok=True)
+        local_saved_assets = [
+            file.stem
+            for file in local_path.iterdir()
+            if file.suffix in [".tif", ".vrt"]
+        ]
+        pattern = saved_assets_pattern(export_manager.image_prefix)
+        export_manager.local_saved_assets = [
+            image for image in local_saved_assets if re.fullmatch(pattern, image)
+        ]
+        logger.debug(
+            f"Total images saved in local folder: {len(export_manager.local_saved_assets)}"
+        )
+    except Exception as e:
+        logger.error(
+            f"Error occurred while checking saved local assets: {e}", exc_info=True
+        )
+        raise e
+
+
+# Regional statistics tables
+def get_gee_saved_tables(
+    export_manager: ExportManager,
+    gee_asset_path: str,
+    inventory: gee_inventory.GeeInventory | None = None,
+):
+    """
+    Updates ExportManager with the list of regional statistics tables saved in GEE.
+
+    Args:
+        export_manager (ExportManager): The export manager instance.
+        gee_asset_path (str): The path to the GEE assets.
+        inventory (GeeInventory): If set, tables are read from this inventory
+            instead of listing the folder.
+    """
+    logger.debug(f"--- Checking for tables already saved to GEE")
+    try:
+        gee_saved_tables = list_gee_assets(
+            gee_asset_path,
+            "TABLE",
+            name_prefix=export_manager.table_name(""),
+            inventory=inventory,
+        )
+        gee_saved_tables = [Path(asset).name for asset in gee_saved_tables]
+        export_manager.gee_saved_tables = filter_saved_tables(
+            export_manager, gee_saved_tables
+        )
+        logger.debug(
+            f"Total tables saved in GEE Asset folder: {len(export_manager.gee_saved_tables)}"
+        )
+    except Exception as e:
+        logger.error(
+            f"Error occurred while checking saved GEE tables: {e}", exc_info=True
+        )
+        raise e
+
+
+def get_gdrive_saved_tables(
+    export_manager: ExportManager,
+    gdrive_assets_path: str,
+    gdrive_service,
+    inventory_path: str | None = None,
+):
+    """
+    Updates ExportManager with the list of regional statistics tables saved in
+    Google Drive.
+
+    Args:
+        export_manager (ExportManager): The export manager instance.
+        gdrive_assets_path (str): The path to the Google Drive assets.
+        gdrive_service (object): The Google Drive service instance.
+        inventory_path (str): If set, tables are read from the Drive inventory kept
+            in this file.
+    """
+    logger.debug(f"--- Checking for tables already saved to Google Drive")
+    try:
+        gdrive_saved_tables = list_gdrive_assets(
+            gdrive_service=gdrive_service,
+            gdrive_assets_path=gdrive_assets_path,
+            asset_type="TABLE",
+            name_prefix=export_manager.table_name(""),
+            inventory_path=inventory_path,
+        )
+        export_manager.gdrive_saved_tables = filter_saved_tables(
+            export_manager, gdrive_saved_tables
+        )
+        logger.debug(
+            f"Total tables saved in Google Drive folder: {len(export_manager.gdrive_saved_tables)}"
+        )
+    except Exception as e:
+        logger.error(
+            f"Error occurred while checking saved GDrive tables: {e}", exc_info=True
+        )
+        raise e
+
+
+def filter_saved_tables(export_manager: ExportManager, tables: list) -> list:
+    """
+    Keeps only the names that match the regional statistics table name
+    <prefix>_STATS_<YYYY-MM>.
+    """
+    pattern = rf"^{re.escape(export_manager.table_name(''))}(\d{{4}})-(\d{{2}})"
+    return [table for table in tables if re.fullmatch(pattern, table)]
+
+
+def target_table_plan(
     export_manager: ExportManager,
     target: str,
     export_plan: list,
-    existing_imgs: list,
-    image_prefix: str,
+    existing_tables: list,
 ):
+    """
+    Determines the months pending to save as regional statistics tables in a target.
+    Tables that already exist are registered as ALREADY_EXISTS tasks, unless the
+    MODIS images of the month changed since they were saved.
+
+    Args:
+        export_manager (ExportManager): The export manager instance.
+        target (str): "gee" or "gdrive"
+        export_plan (list): Months to save in the format YYYY-MM-DD
+        existing_tables (list): Names of the tables already saved in the target.
+    """
     target_plan = []
-    excluded = []
+    existing = set(existing_tables)
     for month in export_plan:
-        image_name = f"{image_prefix}_{month[:7]}"
-        if month in existing_imgs:
-            excluded.append(month)
+        table_name = export_manager.table_name(month)
+        if table_name in existing and export_manager.needs_update(
+            target, table_name, month
+        ):
+            logger.info(f"MODIS images changed since {table_name} was saved")
+            export_manager.assets_to_overwrite[target].add(table_name)
+            target_plan.append(month)
+        elif table_name in existing:
             export_manager.export_tasks.add_task(
                 exports.ExportTask(
-                    image=image_name,
+                    image=table_name,
                     date=month,
                     target=target,
                     status="ALREADY_EXISTS",
@@ -156,16 +613,102 @@ def target_export_plan(
         else:
             target_plan.append(month)
 
-        if target == "gee":
-            export_manager.gee_assets_to_save = target_plan
-        elif target == "gdrive":
-            export_manager.gdrive_assets_to_save = target_plan
+    if target == "gee":
+        export_manager.gee_tables_to_save = target_plan
+    elif target == "gdrive":
+        export_manager.gdrive_tables_to_save = target_plan
+
+    message = f"Pending months to save as tables in {target.upper()}: {target_plan}"
+    logger.info(message)
+
+
+def target_export_plan(
+    export_manager: ExportManager,
+    target: str,
+    export_plan: list,
+    existing_imgs: list,
+    image_prefix: str,
+):
+    """
+    Determines the months and regions pending to save in a target.
+
+    A month is pending if at least one of its images (one per region when exporting
+    by region) is not in existing_imgs, or if the MODIS images of the month were
+    reprocessed or completed since it was saved. Images that already exist are registered as
+    ALREADY_EXISTS tasks and images rejected for their size as TOO_LARGE tasks.
+    Images above the direct download limit are also TOO_LARGE for the local target.
+
+    Args:
+        export_manager (ExportManager): The export manager instance.
+        target (str): "gee" or "gdrive"
+        export_plan (list): Months to save in the format YYYY-MM-DD
+        existing_imgs (list): Names of the images already saved in the target.
+        image_prefix (str): Prefix of the exported images.
+    """
+    target_plan = []
+    target_regions: dict[str, list[str | None]] = {}
+    excluded = []
+    reprocessed = []
+    existing = set(existing_imgs)
+    for month in export_plan:
+        pending_regions = []
+        for region in export_manager.export_regions:
+            image_name = export_manager.image_name(month, region)
+            if export_manager.is_rejected(region) or (
+                target == "local" and not export_manager.fits_direct_download(region)
+            ):
+                export_manager.export_tasks.add_task(
+                    exports.ExportTask(
+                        image=image_name,
+                        date=month,
+                        target=target,
+                        status="TOO_LARGE",
+                        region=region,
+                    )
+                )
+            elif image_name in existing and export_manager.needs_update(
+                target, image_name, month
+            ):
+                reprocessed.append(image_name)
+                export_manager.assets_to_overwrite[target].add(image_name)
+                pending_regions.append(region)
+            elif image_name in existing:
+                excluded.append(image_name)
+                export_manager.export_tasks.add_task(
+                    exports.ExportTask(
+                        image=image_name,
+                        date=month,
+                        target=target,
+                        status="ALREADY_EXISTS",
+                        region=region,
+                    )
+                )
+            else:
+                pending_regions.append(region)
+
+        if pending_regions:
+            target_plan.append(month)
+            target_regions[month] = pending_regions
+
+    if target == "gee":
+        export_manager.gee_assets_to_save = target_plan
+        export_manager.gee_regions_to_save = target_regions
+    elif target == "gdrive":
+        export_manager.gdrive_assets_to_save = target_plan
+        export_manager.gdrive_regions_to_save = target_regions
+    elif target == "local":
+        export_manager.local_assets_to_save = target_plan
+        export_manager.local_regions_to_save = target_regions
 
     if len(excluded) >= 1:
-        message = f"Months already saved in {target.upper()} assets: {excluded}"
+        message = f"Images already saved in {target.upper()} assets: {excluded}"
         # print(message)
         logger.info(message)
 
+    if reprocessed:
+        message = f"Images in {target.upper()} to export again, MODIS images changed: {reprocessed}"
+        logger.info(message)
+
     message = f"Pending months to save in {target.upper()} Assets: {target_plan}"
     # print(message)
     logger.info(message)
@@ -204,9 +747,16 @@ def determine_export_plan(export_manager: ExportManager):
             export_manager=export_manager,
             target="gee",
             export_plan=final_plan,
-            existing_imgs=export_manager.gee_saved_assets_months,
+            existing_imgs=export_manager.gee_saved_assets,
             image_prefix=export_manager.image_prefix,
         )
+        if export_manager.export_region_stats:
+            target_table_plan(
+                export_manager=export_manager,
+                target="gee",
+                export_plan=final_plan,
+                existing_tables=export_manager.gee_saved_tables,
+            )
 
     # Google Drive Export Plan
     if export_manager.export_to_gdrive:
@@ -214,16 +764,191 @@ def determine_export_plan(export_manager: ExportManager):
             export_manager=export_manager,
             target="gdrive",
             export_plan=final_plan,
-            existing_imgs=export_manager.gdrive_saved_assets_months,
+            existing_imgs=export_manager.gdrive_saved_assets,
             image_prefix=export_manager.image_prefix,
         )
+        if export_manager.export_region_stats:
+            target_table_plan(
+                export_manager=export_manager,
+                target="gdrive",
+                export_plan=final_plan,
+                existing_tables=export_manager.gdrive_saved_tables,
+            )
+
+    # Local Export Plan
+    if export_manager.export_to_local:
+        target_export_plan(
+            export_manager=export_manager,
+            target="local",
+            export_plan=final_plan,
+            existing_imgs=export_manager.local_saved_assets,
+            image_prefix=export_manager.image_prefix,
+        )
+
+
+def next_month(month: str) -> str:
+    """
+    Returns the first day of the month after a month. e.g. "2024-01-15" -> "2024-02-01"
+    """
+    first_day = date.fromisoformat(f"{month[:7]}-01")
+    return (first_day + timedelta(days=32)).replace(day=1).isoformat()
+
+
+def read_accumulator(export_manager: ExportManager, month: str) -> dict | None:
+    """
+    Returns the accumulator asset of a month if it exists.
+
+    Returns:
+        dict: {"id", "last_day"} where last_day is the date of the last image added
+        to the accumulator, or None if there's no accumulator for the month.
+    """
+    asset_id = Path(
+        export_manager.gee_assets_path, export_manager.accumulator_name(month)
+    ).as_posix()
+    properties = gee_assets.get_asset_properties(asset_id)
+    if not properties or not properties.get("last_day"):
+        return None
+    return {"id": asset_id, "last_day": properties["last_day"]}
+
+
+def read_saved_accumulators(export_manager: ExportManager):
+    """
+    Reads the accumulators of the complete months to save. Only assets already
+    listed in the GEE folder are read.
+    """
+    for month in export_manager.export_plan["final_plan"]:
+        if month in export_manager.accumulators:
+            continue
+        if (
+            export_manager.accumulator_name(month)
+            in export_manager.gee_saved_accumulators
+        ):
+            accumulator = read_accumulator(export_manager, month)
+            if accumulator:
+                export_manager.accumulators[month] = accumulator
+
+
+def plan_intermediates(export_manager: ExportManager):
+    """
+    Determines the months to save as monthly intermediates in GEE. Intermediates
+    are the accumulator assets of complete months, with the sums and counts of SCI
+    and CCI up to the last day of the month.
+
+    A month is saved if it has no accumulator, if its accumulator doesn't include
+    the last day of the month or if its MODIS images changed since it was saved.
+    """
+    logger.debug(f"--- Determining intermediates plan")
+    read_saved_accumulators(export_manager)
+
+    intermediates_to_save = []
+    for month in export_manager.export_plan["final_plan"]:
+        intermediate_name = export_manager.accumulator_name(month)
+        accumulator = export_manager.accumulators.get(month)
+        last_day = (
+            date.fromisoformat(next_month(month)) - timedelta(days=1)
+        ).isoformat()
+        if accumulator and accumulator["last_day"] >= last_day:
+            if not export_manager.needs_update("gee", intermediate_name, month):
+                continue
+            # Reprocessed months are accumulated again from scratch
+            del export_manager.accumulators[month]
+        if intermediate_name in export_manager.gee_saved_accumulators:
+            export_manager.assets_to_overwrite["gee"].add(intermediate_name)
+        intermediates_to_save.append(month)
+
+    export_manager.intermediates_to_save = intermediates_to_save
+    logger.info(f"Pending months to save as intermediates: {intermediates_to_save}")
+
+
+def plan_provisional(export_manager: ExportManager):
+    """
+    Determines if the provisional product of the current, incomplete, month has to
+    be updated and reads the accumulators of the months to save.
+
+    The current month is the month of the last MODIS image. It's updated if it has
+    no accumulator or if its accumulator doesn't include the last image.
+    """
+    logger.debug(f"--- Determining provisional plan")
+    read_saved_accumulators(export_manager)
+
+    last_image = export_manager.modis_status["last_image"]
+    month = f"{last_image[:7]}-01"
+    if month in export_manager.modis_distinct_months:
+        logger.debug(f"Month of the last image is complete: {month}")
+        return
+
+    accumulator = read_accumulator(export_manager, month)
+    if accumulator and accumulator["last_day"] >= last_image:
+        logger.info(f"Provisional product up to date: {accumulator['last_day']}")
+        return
+
+    export_manager.provisional_month = month
+    if accumulator:
+        export_manager.accumulators[month] = accumulator
+        export_manager.assets_to_overwrite["gee"].add(
+            export_manager.accumulator_name(month)
+        )
+    logger.info(f"Provisional product to update: {month} up to {last_image}")
+
+
+def accumulate_month(accumulator: dict | None, month: str, until: str) -> Image:
+    """
+    Returns the sums and counts of SCI and CCI of a month up to a date, adding only
+    the MODIS images after the last day of the accumulator.
+
+    Args:
+        accumulator: Accumulator of the month returned by read_accumulator or None.
+        month: Month in the format YYYY-MM-DD.
+        until: Date of the first image not included in the format YYYY-MM-DD.
+
+    Returns:
+        An Image with the bands returned by gee_imagecollection.ic_sum_count.
+    """
+    sum_count_bands = [f"{band}_sum" for band in EXPORT["bands"]] + [
+        f"{band}_count" for band in EXPORT["bands"]
+    ]
+    since = f"{month[:7]}-01"
+    if accumulator:
+        since = (
+            date.fromisoformat(accumulator["last_day"]) + timedelta(days=1)
+        ).isoformat()
+        if since >= until:
+            return Image(accumulator["id"]).select(sum_count_bands)  # type: ignore
+
+    ee_new_images = (
+        ImageCollection(MODIS["path"])
+        .filterDate(since, until)
+        .map(calculations.snow_cloud_mask)
+    )
+    ee_increment = gee_imagecollection.ic_sum_count(ee_new_images, EXPORT["bands"])
+    if accumulator is None:
+        return ee_increment
+    return Image(accumulator["id"]).select(sum_count_bands).add(ee_increment)  # type: ignore
 
 
 def calculate_sci_cci(
-    ee_MODIS_collection: ImageCollection, all_months_to_save: list
+    ee_MODIS_collection: ImageCollection,
+    all_months_to_save: list,
+    accumulators: dict[str, dict] | None = None,
+    statistics: list[str] | None = None,
 ) -> ImageCollection:
+    """
+    Calculates the monthly mean SCI and CCI of the months to save, and the extra
+    statistics in the same reduction. Months with an accumulator are calculated from
+    it, only adding the images not accumulated yet.
+    """
     # ## ------ SCI, CCI CALCULATIONS ---------
     logger.debug(f"--- Calculating SCI, CCI")
+    statistics = statistics or []
+    accumulators = {
+        month: accumulator
+        for month, accumulator in (accumulators or {}).items()
+        if month in all_months_to_save
+    }
+    # Accumulators only keep sums and counts
+    if accumulators and set(statistics) - {"count"}:
+        logger.debug(f"Not using accumulators to calculate {', '.join(statistics)}")
+        accumulators = {}
 
     try:
         # Calculate SCI, CCI for all images in the collection
@@ -232,12 +957,34 @@ def calculate_sci_cci(
             calculations.snow_cloud_mask
         ).select("SCI", "CCI")
 
-        # Reduce to monthly images (mean)
+        # Reduce to monthly images (mean and extra statistics)
         # Only calculating for the months that will be saved.
         ee_monthly_snow_cloud_collection = gee_imagecollection.ic_monthly_mean(
-            months=all_months_to_save, imagecollection=ee_snow_cloud_collection
+            months=[month for month in all_months_to_save if month not in accumulators],
+            imagecollection=ee_snow_cloud_collection,
+            statistics=statistics,
+            bands=EXPORT["bands"],
         )
 
+        # Months with an accumulator
+        for month, accumulator in accumulators.items():
+            logger.debug(f"Calculating {month} from its accumulator")
+            ee_month = ee_date.Date(month)
+            ee_sum_count = accumulate_month(accumulator, month, next_month(month))
+            ee_image = gee_imagecollection.sum_count_mean(ee_sum_count, EXPORT["bands"])
+            if statistics:
+                ee_image = ee_image.addBands(  # type: ignore
+                    ee_sum_count.select(
+                        [f"{band}_count" for band in EXPORT["bands"]]
+                    ).toDouble()  # type: ignore
+                )
+            ee_image = ee_image.set("month", ee_month.get("month"))  # type: ignore
+            ee_image = ee_image.set("year", ee_month.get("year"))  # type: ignore
+            ee_image = ee_image.set("system:time_start", ee_month.format("YYYY-MM"))  # type: ignore
+            ee_monthly_snow_cloud_collection = ee_monthly_snow_cloud_collection.merge(
+                ImageCollection([ee_image])
+            )
+
         logger.debug(
             f"Total images in SCI-CCI collection: {ee_monthly_snow_cloud_collection.size().getInfo()}"
         )
@@ -249,31 +996,217 @@ def calculate_sci_cci(
         raise e
 
 
+def export_asset_id(export_manager: ExportManager, asset_name: str) -> str:
+    """
+    Returns the ID of the GEE asset an image or table is exported to. Assets that
+    replace an existing asset are exported to a temporary asset first, so a failed
+    export doesn't affect the existing asset.
+    """
+    asset_id = Path(export_manager.gee_assets_path, asset_name).as_posix()
+    if asset_name in export_manager.assets_to_overwrite["gee"]:
+        return gee_assets.temporary_asset_id(asset_id)
+    return asset_id
+
+
+def replace_gee_assets(export_manager: ExportManager):
+    """
+    Replaces the GEE assets exported again with the temporary assets of the
+    completed exports.
+    """
+    for task in export_manager.export_tasks.export_tasks:
+        if (
+            task.target != "gee"
+            or task.image not in export_manager.assets_to_overwrite["gee"]
+            or task.status not in ["COMPLETED", "FINISHED"]
+        ):
+            continue
+        asset_id = Path(export_manager.gee_assets_path, task.image).as_posix()
+        # Each temporary asset is only swapped once
+        export_manager.assets_to_overwrite["gee"].discard(task.image)
+        try:
+            gee_assets.replace_asset(gee_assets.temporary_asset_id(asset_id), asset_id)
+        except Exception as e:
+            logger.error(f"Couldn't replace {task.image}: {e}")
+            task.status = "FAILED"
+            task.error = f"Couldn't replace the existing asset: {e}"
+
+
+def record_gee_exports(
+    export_manager: ExportManager, inventory: gee_inventory.GeeInventory
+):
+    """
+    Adds the images and tables exported to GEE by the completed tasks to the
+    inventory of the folder and saves it.
+
+    If any task was submitted, the inventory is marked as stale so the next run
+    lists the folder again and finds the assets of exports still running and the
+    temporary assets replaced.
+    """
+    submitted = False
+    for task in export_manager.export_tasks.export_tasks:
+        if task.target != "gee":
+            continue
+        if task.export_status in ["PENDING", "COMPLETED", "UNKNOWN"]:
+            submitted = True
+        if task.status not in ["COMPLETED", "FINISHED"]:
+            continue
+        asset_type = (
+            "TABLE" if task.image == export_manager.table_name(task.date) else "IMAGE"
+        )
+        inventory.add_asset(task.image, asset_type)
+    if submitted:
+        inventory.mark_stale()
+    inventory.save()
+
+
 def create_export_tasks_to_gee(
     export_manager: ExportManager,
     ee_monthly_snow_cloud_collection: ImageCollection,
     ee_regions: FeatureCollection,
 ):
 
-    # TODO: Move scale and other constant to config file
     gee_assets_path = export_manager.gee_assets_path
     image_name = ""
-    # Create one export task per image
+    # Create one export task per image (and region if exporting by region)
     for month in export_manager.gee_assets_to_save:
-        image_name = f"{export_manager.image_prefix}_{month[:7]}"
-        logger.debug(f"Creating export task for GEE: {image_name}")
+        for region in export_manager.gee_regions_to_save.get(month, [None]):
+            image_name = export_manager.image_name(month, region)
+            logger.debug(f"Creating export task for GEE: {image_name}")
+            try:
+                ee_image = ee_monthly_snow_cloud_collection.filterDate(month).first()
+                ee_geometry = get_export_geometry(export_manager, ee_regions, region)
+                base_region = export_manager.base_region(region)
+                if base_region is not None:
+                    ee_image = ee_image.clip(  # type: ignore
+                        get_export_geometry(export_manager, ee_regions, base_region)
+                    )
+                task = batch.Export.image.toAsset(
+                    **{
+                        "image": ee_image,
+                        "description": image_name,
+                        "assetId": export_asset_id(export_manager, image_name),
+                        "scale": EXPORT["scale"],
+                        "region": ee_geometry,
+                        "maxPixels": export_manager.max_pixels,
+                        "overwrite": image_name
+                        in export_manager.assets_to_overwrite["gee"],
+                    }
+                )
+                # task = None
+                export_manager.export_tasks.add_task(
+                    exports.ExportTask(
+                        image=image_name,
+                        date=month,
+                        target="gee",
+                        status="CREATED",
+                        task=task,
+                        region=region,
+                    )
+                )
+            except Exception as e:
+                logger.error(f"Export task to GEE for {image_name} failed: {e}")
+                export_manager.export_tasks.add_task(
+                    exports.ExportTask(
+                        image=image_name,
+                        date=month,
+                        target="gee",
+                        status="FAILED_TO_CREATE",
+                        task=None,
+                        region=region,
+                    )
+                )
+                continue
+
+
+def create_provisional_task(
+    export_manager: ExportManager,
+    ee_regions: FeatureCollection,
+):
+    """
+    Creates the export task that updates the accumulator of the current month with
+    the images added since its last day. The accumulator is exported to GEE with
+    the provisional mean SCI and CCI and the sum and count bands used to update it.
+    """
+    month = export_manager.provisional_month
+    if month is None:
+        return
+    last_image = export_manager.modis_status["last_image"]
+    image_name = export_manager.accumulator_name(month)
+    logger.debug(f"Creating provisional export task for GEE: {image_name}")
+    try:
+        ee_sum_count = accumulate_month(
+            export_manager.accumulators.get(month),
+            month,
+            (date.fromisoformat(last_image) + timedelta(days=1)).isoformat(),
+        )
+        ee_image = (
+            gee_imagecollection.sum_count_mean(ee_sum_count, EXPORT["bands"])
+            .addBands(ee_sum_count)
+            .set({"last_day": last_image, "provisional": 1})
+        )
+        task = batch.Export.image.toAsset(
+            **{
+                "image": ee_image,
+                "description": image_name,
+                "assetId": export_asset_id(export_manager, image_name),
+                "scale": EXPORT["scale"],
+                "region": get_export_geometry(export_manager, ee_regions, None),
+                "maxPixels": export_manager.max_pixels,
+                "overwrite": image_name in export_manager.assets_to_overwrite["gee"],
+            }
+        )
+        export_manager.export_tasks.add_task(
+            exports.ExportTask(
+                image=image_name,
+                date=month,
+                target="gee",
+                status="CREATED",
+                task=task,
+            )
+        )
+    except Exception as e:
+        logger.error(f"Provisional export task for {image_name} failed: {e}")
+        export_manager.export_tasks.add_task(
+            exports.ExportTask(
+                image=image_name,
+                date=month,
+                target="gee",
+                status="FAILED_TO_CREATE",
+                task=None,
+            )
+        )
+
+
+def create_intermediate_tasks(
+    export_manager: ExportManager, ee_regions: FeatureCollection
+):
+    """
+    Creates one export task per month with the monthly sums and counts of SCI and
+    CCI as integer bands. Longer periods can be aggregated from these assets with
+    gee_imagecollection.ic_period_mean without reading the daily images again.
+    """
+    for month in export_manager.intermediates_to_save:
+        image_name = export_manager.accumulator_name(month)
+        last_day = (
+            date.fromisoformat(next_month(month)) - timedelta(days=1)
+        ).isoformat()
+        logger.debug(f"Creating intermediate export task for GEE: {image_name}")
         try:
-            ee_image = ee_monthly_snow_cloud_collection.filterDate(month).first()
+            ee_image = accumulate_month(
+                export_manager.accumulators.get(month), month, next_month(month)
+            ).set({"last_day": last_day, "provisional": 0})
             task = batch.Export.image.toAsset(
                 **{
                     "image": ee_image,
                     "description": image_name,
-                    "assetId": Path(gee_assets_path, image_name).as_posix(),
-                    "scale": 500,
-                    "region": ee_regions.geometry(),  # type:ignore
+                    "assetId": export_asset_id(export_manager, image_name),
+                    "scale": EXPORT["scale"],
+                    "region": get_export_geometry(export_manager, ee_regions, None),
+                    "maxPixels": export_manager.max_pixels,
+                    "overwrite": image_name
+                    in export_manager.assets_to_overwrite["gee"],
                 }
             )
-            # task = None
             export_manager.export_tasks.add_task(
                 exports.ExportTask(
                     image=image_name,
@@ -284,7 +1217,7 @@ def create_export_tasks_to_gee(
                 )
             )
         except Exception as e:
-            logger.error(f"Export task to GEE for {image_name} failed: {e}")
+            logger.error(f"Intermediate export task for {image_name} failed: {e}")
             export_manager.export_tasks.add_task(
                 exports.ExportTask(
                     image=image_name,
@@ -294,62 +1227,352 @@ def create_export_tasks_to_gee(
                     task=None,
                 )
             )
+
+
+def exported_months(export_manager: ExportManager) -> dict[str, str | None]:
+    """
+    Returns the months with a monthly image exported in this run or already saved
+    in GEE, and where to read the image of each month from.
+
+    Returns:
+        dict: {YYYY-MM-DD: None} for months exported in this run, which are in the
+        monthly collection, and {YYYY-MM-DD: asset ID} for months not calculated in
+        this run whose image of the whole area is already saved in GEE.
+    """
+    months: dict[str, str | None] = {}
+    for task in export_manager.export_tasks.export_tasks:
+        if task.image != export_manager.image_name(task.date, task.region):
             continue
+        if task.status in ["COMPLETED", "FINISHED"]:
+            months[task.date] = None
+        elif (
+            task.status == "ALREADY_EXISTS"
+            and task.target == "gee"
+            and task.region is None
+        ):
+            months.setdefault(
+                task.date,
+                Path(export_manager.gee_assets_path, task.image).as_posix(),
+            )
+    return dict(sorted(months.items()))
 
 
-def create_export_tasks_to_gdrive(
+def create_climatology_tasks(
     export_manager: ExportManager,
     ee_monthly_snow_cloud_collection: ImageCollection,
     ee_regions: FeatureCollection,
 ):
+    """
+    Creates the export tasks that add the exported months to the climatology of
+    their calendar month, and the anomaly of each month added.
 
-    gdrive_assets_path = Path(export_manager.gdrive_assets_path).as_posix()
-    image_name = ""
-    for month in export_manager.gdrive_assets_to_save:
-        image_name = f"{export_manager.image_prefix}_{month[:7]}"
-        logger.debug(f"Preparing to export image to GDrive: {image_name}")
+    Climatologies are saved as <prefix>_CLIM_<MM> with the running mean and number
+    of months of each band. The months already included are saved in the "months"
+    property, so each month is only added once. Anomalies are saved as
+    <prefix>_ANOM_<YYYY-MM>, the monthly mean minus the updated climatology.
+    """
+    month_images = exported_months(export_manager)
+    months_by_calendar_month: dict[str, list[str]] = {}
+    for month in month_images:
+        months_by_calendar_month.setdefault(month[5:7], []).append(month)
+
+    def _month_image(month: str) -> Image:
+        if month_images[month] is None:
+            return ee_monthly_snow_cloud_collection.filterDate(month).first()  # type: ignore
+        return Image(month_images[month])
+
+    for calendar_month, months in months_by_calendar_month.items():
+        climatology_name = export_manager.climatology_name(calendar_month)
+        climatology_id = Path(
+            export_manager.gee_assets_path, climatology_name
+        ).as_posix()
+        logger.debug(f"Creating climatology export task for GEE: {climatology_name}")
         try:
-            ee_image = ee_monthly_snow_cloud_collection.filterDate(month).first()
+            properties = gee_assets.get_asset_properties(climatology_id)
+            included = set(
+                filter(None, (properties or {}).get("months", "").split(","))
+            )
+            new_months = [month for month in months if month[:7] not in included]
+            if not new_months:
+                logger.debug(f"Months already in {climatology_name}: {months}")
+                continue
 
-            task = batch.Export.image.toDrive(
+            ee_climatology = Image(climatology_id) if properties else None
+            for month in new_months:
+                ee_climatology = gee_imagecollection.running_mean_add(
+                    ee_climatology, _month_image(month), EXPORT["bands"]
+                )
+            included.update(month[:7] for month in new_months)
+            ee_climatology = ee_climatology.set(  # type: ignore
+                {"months": ",".join(sorted(included)), "month_count": len(included)}
+            )
+            if properties:
+                export_manager.assets_to_overwrite["gee"].add(climatology_name)
+            image_tasks = [(climatology_name, calendar_month, ee_climatology)]
+            for month in new_months:
+                ee_anomaly = (
+                    _month_image(month)
+                    .select(EXPORT["bands"])  # type: ignore
+                    .subtract(ee_climatology.select(EXPORT["bands"]))  # type: ignore
+                )
+                image_tasks.append(
+                    (export_manager.anomaly_name(month), month, ee_anomaly)
+                )
+        except Exception as e:
+            logger.error(f"Climatology export task for {climatology_name} failed: {e}")
+            export_manager.export_tasks.add_task(
+                exports.ExportTask(
+                    image=climatology_name,
+                    date=months[0],
+                    target="gee",
+                    status="FAILED_TO_CREATE",
+                    task=None,
+                )
+            )
+            continue
+
+        for image_name, month, ee_image in image_tasks:
+            task = batch.Export.image.toAsset(
                 **{
                     "image": ee_image,
                     "description": image_name,
-                    "folder": gdrive_assets_path,
-                    "region": ee_regions.geometry(),  # type:ignore
-                    "scale": 500,
-                    "maxPixels": 1e8,  # Default value is 1e8
+                    "assetId": export_asset_id(export_manager, image_name),
+                    "scale": EXPORT["scale"],
+                    "region": get_export_geometry(export_manager, ee_regions, None),
+                    "maxPixels": export_manager.max_pixels,
+                    "overwrite": image_name
+                    in export_manager.assets_to_overwrite["gee"],
                 }
             )
-            # task = None
             export_manager.export_tasks.add_task(
                 exports.ExportTask(
                     image=image_name,
                     date=month,
-                    target="gdrive",
+                    target="gee",
                     status="CREATED",
                     task=task,
                 )
             )
 
-        except Exception as e:
-            logger.error(f"Export task to GDrive for {image_name} failed: {e}")
-            export_manager.export_tasks.add_task(
-                exports.ExportTask(
-                    image=image_name,
-                    date=month,
-                    target="gdrive",
-                    status="FAILED_TO_CREATE",
-                    task=None,
+
+def create_export_tasks_to_gdrive(
+    export_manager: ExportManager,
+    ee_monthly_snow_cloud_collection: ImageCollection,
+    ee_regions: FeatureCollection,
+):
+
+    gdrive_assets_path = Path(export_manager.gdrive_assets_path).as_posix()
+    image_name = ""
+    for month in export_manager.gdrive_assets_to_save:
+        for region in export_manager.gdrive_regions_to_save.get(month, [None]):
+            image_name = export_manager.image_name(month, region)
+            logger.debug(f"Preparing to export image to GDrive: {image_name}")
+            try:
+                ee_image = ee_monthly_snow_cloud_collection.filterDate(month).first()
+                ee_geometry = get_export_geometry(export_manager, ee_regions, region)
+                base_region = export_manager.base_region(region)
+                if base_region is not None:
+                    ee_image = ee_image.clip(  # type: ignore
+                        get_export_geometry(export_manager, ee_regions, base_region)
+                    )
+
+                task = batch.Export.image.toDrive(
+                    **{
+                        "image": ee_image,
+                        "description": image_name,
+                        "folder": gdrive_assets_path,
+                        "region": ee_geometry,
+                        "scale": EXPORT["scale"],
+                        "maxPixels": export_manager.max_pixels,
+                    }
+                )
+                # task = None
+                export_manager.export_tasks.add_task(
+                    exports.ExportTask(
+                        image=image_name,
+                        date=month,
+                        target="gdrive",
+                        status="CREATED",
+                        task=task,
+                        region=region,
+                    )
+                )
+
+            except Exception as e:
+                logger.error(f"Export task to GDrive for {image_name} failed: {e}")
+                export_manager.export_tasks.add_task(
+                    exports.ExportTask(
+                        image=image_name,
+                        date=month,
+                        target="gdrive",
+                        status="FAILED_TO_CREATE",
+                        task=None,
+                        region=region,
+                    )
                 )
+                continue
+
+
+def create_export_tasks_to_local(
+    export_manager: ExportManager,
+    ee_monthly_snow_cloud_collection: ImageCollection,
+    ee_regions: FeatureCollection,
+):
+    """
+    Creates one direct download task per image to the local folder. Downloads run
+    when tasks are started and are tracked like export tasks.
+    """
+    for month in export_manager.local_assets_to_save:
+        for region in export_manager.local_regions_to_save.get(month, [None]):
+            image_name = export_manager.image_name(month, region)
+            logger.debug(f"Preparing to download image: {image_name}")
+            try:
+                ee_image = ee_monthly_snow_cloud_collection.filterDate(month).first()
+                base_region = export_manager.base_region(region)
+                if base_region is not None:
+                    ee_image = ee_image.clip(  # type: ignore
+                        get_export_geometry(export_manager, ee_regions, base_region)
+                    )
+                task = download.DirectDownloadTask(
+                    image=ee_image,  # type: ignore
+                    bounds=export_manager.export_bounds(region),  # type: ignore
+                    path=Path(export_manager.local_assets_path, image_name).as_posix(),
+                    scale=EXPORT["scale"],
+                    bands=export_manager.image_bands,
+                    bytes_per_band=EXPORT["bytes_per_band"],
+                )
+                export_manager.export_tasks.add_task(
+                    exports.ExportTask(
+                        image=image_name,
+                        date=month,
+                        target="local",
+                        status="CREATED",
+                        task=task,  # type: ignore
+                        region=region,
+                    )
+                )
+            except Exception as e:
+                logger.error(f"Download task for {image_name} failed: {e}")
+                export_manager.export_tasks.add_task(
+                    exports.ExportTask(
+                        image=image_name,
+                        date=month,
+                        target="local",
+                        status="FAILED_TO_CREATE",
+                        task=None,
+                        region=region,
+                    )
+                )
+
+
+def create_table_export_tasks(
+    export_manager: ExportManager,
+    ee_monthly_snow_cloud_collection: ImageCollection,
+    ee_regions: FeatureCollection,
+):
+    """
+    Creates one export task per month with the mean SCI, mean CCI and number of
+    valid pixels of each region. Statistics are calculated with a single
+    reduceRegions pass per month and exported as a table to GEE and/or Google Drive.
+    """
+    targets = {
+        "gee": (
+            export_manager.gee_tables_to_save if export_manager.export_to_gee else []
+        ),
+        "gdrive": (
+            export_manager.gdrive_tables_to_save
+            if export_manager.export_to_gdrive
+            else []
+        ),
+    }
+    gdrive_assets_path = Path(export_manager.gdrive_assets_path).as_posix()
+    ee_stats_by_month: dict[str, FeatureCollection] = {}
+    for target, months in targets.items():
+        for month in months:
+            table_name = export_manager.table_name(month)
+            logger.debug(
+                f"Creating table export task for {target.upper()}: {table_name}"
             )
+            try:
+                if month not in ee_stats_by_month:
+                    ee_image = ee_monthly_snow_cloud_collection.filterDate(
+                        month
+                    ).first()
+                    ee_stats_by_month[month] = calculations.region_stats(
+                        image=ee_image,  # type: ignore
+                        regions=ee_regions,
+                        name_property=export_manager.regions_name_property,
+                        month=month,
+                        scale=EXPORT["scale"],
+                    )
+                if target == "gee":
+                    task = batch.Export.table.toAsset(
+                        collection=ee_stats_by_month[month],
+                        description=table_name,
+                        assetId=export_asset_id(export_manager, table_name),
+                        overwrite=table_name
+                        in export_manager.assets_to_overwrite["gee"],
+                    )
+                else:
+                    task = batch.Export.table.toDrive(
+                        collection=ee_stats_by_month[month],
+                        description=table_name,
+                        folder=gdrive_assets_path,
+                        fileFormat="CSV",
+                        selectors=EXPORT["stats_columns"],
+                    )
+                export_manager.export_tasks.add_task(
+                    exports.ExportTask(
+                        image=table_name,
+                        date=month,
+                        target=target,
+                        status="CREATED",
+                        task=task,
+                    )
+                )
+            except Exception as e:
+                logger.error(
+                    f"Table export task to {target.upper()} for {table_name} failed: {e}"
+                )
+                export_manager.export_tasks.add_task(
+                    exports.ExportTask(
+                        image=table_name,
+                        date=month,
+                        target=target,
+                        status="FAILED_TO_CREATE",
+                        task=None,
+                    )
+                )
+
+
+def trash_replaced_gdrive_files(export_manager: ExportManager, gdrive_service):
+    """
+    Moves to the trash the previous copies of the files exported again to Google
+    Drive. Files are only replaced once the new export has completed.
+    """
+    gdrive_assets_path = Path(export_manager.gdrive_assets_path).as_posix()
+    for task in export_manager.export_tasks.export_tasks:
+        if (
+            task.target != "gdrive"
+            or task.image not in export_manager.assets_to_overwrite["gdrive"]
+            or task.status not in ["COMPLETED", "FINISHED"]
+        ):
             continue
+        try:
+            gdrive_assets.trash_older_files(
+                drive_service=gdrive_service,
+                path=gdrive_assets_path,
+                name=task.image,
+            )
+        except Exception as e:
+            logger.error(f"Couldn't remove replaced copies of {task.image}: {e}")
 
 
 def create_export_tasks(
     export_manager: ExportManager,
     ee_monthly_snow_cloud_collection: ImageCollection,
     ee_regions: FeatureCollection,
+    gdrive_service=None,
 ) -> None:
     ## ------ EXPORT TASKS ---------
     logger.debug(f"--- Creating Image Export Tasks")
@@ -366,6 +1589,28 @@ def create_export_tasks(
             ee_monthly_snow_cloud_collection=ee_monthly_snow_cloud_collection,
             ee_regions=ee_regions,
         )
+    if export_manager.export_to_local:
+        create_export_tasks_to_local(
+            export_manager=export_manager,
+            ee_monthly_snow_cloud_collection=ee_monthly_snow_cloud_collection,
+            ee_regions=ee_regions,
+        )
+    if export_manager.intermediates_to_save:
+        create_intermediate_tasks(
+            export_manager=export_manager,
+            ee_regions=ee_regions,
+        )
+    if export_manager.provisional_month:
+        create_provisional_task(
+            export_manager=export_manager,
+            ee_regions=ee_regions,
+        )
+    if export_manager.export_region_stats:
+        create_table_export_tasks(
+            export_manager=export_manager,
+            ee_monthly_snow_cloud_collection=ee_monthly_snow_cloud_collection,
+            ee_regions=ee_regions,
+        )
 
     # Start Exports
     start_results = export_manager.export_tasks.start_exports()
@@ -374,3 +1619,22 @@ def create_export_tasks(
     # Track Exports
     track_results = export_manager.export_tasks.track_exports()
     logger.debug(f"Track export results: {track_results}")
+
+    if export_manager.assets_to_overwrite["gee"]:
+        replace_gee_assets(export_manager)
+    if gdrive_service and export_manager.assets_to_overwrite["gdrive"]:
+        trash_replaced_gdrive_files(export_manager, gdrive_service)
+
+    # Climatologies are updated with the months just exported
+    if export_manager.export_climatology:
+        logger.debug(f"--- Creating Climatology Export Tasks")
+        create_climatology_tasks(
+            export_manager=export_manager,
+            ee_monthly_snow_cloud_collection=ee_monthly_snow_cloud_collection,
+            ee_regions=ee_regions,
+        )
+        export_manager.export_tasks.start_exports()
+        track_results = export_manager.export_tasks.track_exports()
+        logger.debug(f"Track climatology export results: {track_results}")
+        if export_manager.assets_to_overwrite["gee"]:
+            replace_gee_assets(export_manager)
@@ -12,20 +12,22 @@ This script uses the following conventions:
 
 # libraries
 import sys
+from datetime import timedelta
 from typing import Any
 import ee
 import ee.imagecollection as ee_imagecollection
 
-from snow_ipa.core import workflows
+from snow_ipa.core import workflows, state
 from snow_ipa.core.scripting import init_script_config, error_message
 from snow_ipa.core.exporting import ExportManager
 from snow_ipa.core.configs import MODIS
 from snow_ipa.utils import logs, dates
 from snow_ipa.services import connections
 from snow_ipa.services.messaging import send_report_message
+from snow_ipa.services.gdrive import assets as gdrive_assets
 from snow_ipa.services.gee import (
-    imagecollection as gee_imagecollection,
-    dates as gee_dates,
+    catalog as gee_catalog,
+    inventory as gee_inventory,
 )
 
 
@@ -44,7 +46,30 @@ def main():
             gdrive_asset_path=script_manager.config["gdrive_assets_path"],
             months_to_save=script_manager.config["months_list"],
             image_prefix="MOD10A1_SCI_CCI",
+            export_by_region=script_manager.config["export_by_region"],
+            regions_name_property=script_manager.config["regions_name_property"],
+            max_pixels=float(script_manager.config["max_pixels"]),
+            oversized_exports=script_manager.config["oversized_exports"],
+            export_region_stats=script_manager.config["export_region_stats"],
+            local_assets_path=script_manager.config["local_assets_path"] or "",
+            direct_download_max_bytes=int(
+                script_manager.config["direct_download_max_bytes"]
+            ),
+            provisional=bool(script_manager.config["provisional"])
+            and script_manager.export_to_gee,
+            export_intermediates=bool(script_manager.config["export_intermediates"])
+            and script_manager.export_to_gee,
+            export_climatology=bool(script_manager.config["export_climatology"])
+            and script_manager.export_to_gee,
+            monthly_statistics=script_manager.config["monthly_statistics"],
         )
+        # State of the last run. Used to skip runs with nothing to do
+        state_path = script_manager.config["state_path"]
+        plan_config = {
+            **script_manager.config,
+            "export_to_gee": script_manager.export_to_gee,
+            "export_to_gdrive": script_manager.export_to_gdrive,
+        }
     except Exception as e:
         logger.exception(e)
         error_message(e, script_manager)
@@ -58,18 +83,40 @@ def main():
         )
         connections.connect_to_gee(runtime_service_account)
 
+        # Fast no-op path: nothing to do if MODIS has no newly completed month
+        if state_path and not script_manager.config["force_full_check"]:
+            saved_state = state.read_state(state_path)
+            last_image_dt = gee_catalog.poll_latest_image_date(
+                MODIS["path"], last_known=saved_state.get("last_image")
+            )
+            if last_image_dt and state.can_skip_run(
+                saved_state, plan_config, last_image_dt
+            ):
+                logger.info(
+                    f"No new complete month in MODIS since the last run (last image: {last_image_dt}). Nothing to do."
+                )
+                logger.info("------ FINISHING SCRIPT ------")
+                return export_manager
+
         if script_manager.export_to_gee:
             connections.check_gee_asset_path(script_manager.config["gee_assets_path"])
 
         gdrive_service = None
         if script_manager.export_to_gdrive:
             gdrive_service = connections.connect_to_gdrive(runtime_service_account)
+            gdrive_assets.set_shared_drive_id(
+                script_manager.config["gdrive_shared_drive_id"]
+            )
+            gdrive_assets.set_folder_id_cache(
+                cache_path=script_manager.config["gdrive_cache_path"],
+                ttl=int(script_manager.config["gdrive_cache_ttl"]),
+            )
             connections.check_gdrive_path(
                 asset_path=script_manager.config["gdrive_assets_path"],
                 gdrive_service=gdrive_service,
             )
 
-        connections.check_regions(
+        export_manager.regions_asset = connections.check_regions(
             asset_path=script_manager.config["regions_asset_path"],
         )
 
@@ -88,32 +135,46 @@ def main():
         modis_status: dict[str, Any] = {"collection": MODIS["path"]}
         ee_MODIS_collection = ee_imagecollection.ImageCollection(MODIS["path"])
 
+        # Days with images and fingerprint of the images of each month, read from
+        # the catalog metadata
+        modis_coverage, modis_fingerprints = gee_catalog.get_month_catalog(
+            MODIS["path"],
+            start=f"{MODIS['min_month']}-01",
+            store_path=script_manager.config["modis_catalog_path"],
+            revalidate_days=float(
+                script_manager.config["modis_catalog_revalidate_days"]
+            ),
+        )
+
         # Total images available
-        total_images = ee_MODIS_collection.size().getInfo()  # type: ignore
+        total_images = gee_catalog.count_images(modis_coverage)
         modis_status["total_images"] = total_images
         logger.debug(f"Total images in {MODIS['path']}: {total_images}")
 
         # Last image available
-        last_image_dt = ee_MODIS_collection.aggregate_max("system:time_start").getInfo()  # type: ignore
-        if not last_image_dt:
+        last_image = gee_catalog.last_covered_date(modis_coverage)
+        if not last_image:
             logger.debug("No images available in MODIS collection.")
             raise ValueError("No images available in MODIS collection.")
-        last_image_dt = gee_dates.eedate_to_datetime(last_image_dt).strftime("%Y-%m-%d")
+        last_image_dt = last_image.isoformat()
         modis_status["last_image"] = last_image_dt
         logger.debug(f"Last image in {MODIS['path']}: {last_image_dt}")
 
         # Last month available
-        ee_MODIS_collection = ee_MODIS_collection.filterDate(
-            MODIS["min_month"], dates.current_year_month()
+        last_complete_dt = gee_catalog.last_complete_month(
+            modis_coverage, dates.prev_month_last_date()
         )
-
-        ee_MODIS_collection = gee_imagecollection.ic_rm_incomplete_months(
-            ee_MODIS_collection
-        )
-
-        export_manager.modis_distinct_months = (
-            gee_imagecollection.ic_get_distinct_months(ee_MODIS_collection)
+        export_manager.modis_distinct_months = gee_catalog.available_months(
+            modis_coverage, last_complete_dt
         )
+        if last_complete_dt:
+            ee_MODIS_collection = ee_MODIS_collection.filterDate(
+                MODIS["min_month"], (last_complete_dt + timedelta(days=1)).isoformat()
+            )
+        else:
+            ee_MODIS_collection = ee_MODIS_collection.filterDate(
+                MODIS["min_month"], MODIS["min_month"]
+            )
         try:
             modis_status["last_complete_month"] = export_manager.modis_distinct_months[
                 0
@@ -123,23 +184,81 @@ def main():
 
         export_manager.modis_status = modis_status
 
+        # Trailing window. The last complete months are checked again for images
+        # that arrived late
+        refresh_months = int(script_manager.config["refresh_months"])
+        if refresh_months > 0:
+            refresh_window = export_manager.modis_distinct_months[:refresh_months]
+            logger.debug(f"Months to check again: {refresh_window}")
+            export_manager.export_plan["planned"] = sorted(
+                set(export_manager.export_plan["planned"]) | set(refresh_window),
+                reverse=True,
+            )
+
+        # Fingerprints and number of images of the months to save and of every
+        # month already saved, to detect reprocessed or completed months. Saved
+        # months that changed are planned again. Fingerprints come from the catalog
+        # scan, so older months are only checked when the catalog is revalidated
+        fingerprints_path = script_manager.config["fingerprints_path"]
+        if fingerprints_path:
+            export_manager.saved_months = state.read_state(fingerprints_path)
+            months_to_check = [
+                month
+                for month in set(export_manager.export_plan["planned"])
+                | set(export_manager.recorded_months)
+                if month in export_manager.modis_distinct_months
+            ]
+            export_manager.modis_fingerprints = {
+                month: modis_fingerprints[month[:7]]
+                for month in months_to_check
+                if month[:7] in modis_fingerprints
+            }
+            export_manager.modis_image_counts = {
+                month: sum(modis_coverage[month[:7]]) for month in months_to_check
+            }
+            reprocessed = export_manager.reprocessed_months()
+            if reprocessed:
+                logger.debug(f"Saved months changed in MODIS: {reprocessed}")
+                export_manager.export_plan["planned"] = sorted(
+                    set(export_manager.export_plan["planned"]) | set(reprocessed),
+                    reverse=True,
+                )
+
     except Exception as e:
         error_message(e, script_manager)
         raise e
 
     logger.debug("------ READING ASSETS --------")
+    gee_asset_inventory = None
     try:
         logger.debug(f"--- Reading Regions")
         ee_regions = ee.featurecollection.FeatureCollection(
             script_manager.config["regions_asset_path"]
         )
+        if export_manager.export_by_region:
+            workflows.get_regions(export_manager=export_manager, ee_regions=ee_regions)
+        workflows.estimate_exports(export_manager=export_manager, ee_regions=ee_regions)
 
         if export_manager.export_to_gee:
             logger.debug(f"--- Reading GEE Assets")
+            # Images and tables are read from the same inventory, synced once
+            if script_manager.config["gee_inventory_path"]:
+                gee_asset_inventory = gee_inventory.GeeInventory(
+                    script_manager.config["gee_assets_path"],
+                    store_path=script_manager.config["gee_inventory_path"],
+                )
+                gee_asset_inventory.sync()
             workflows.get_gee_saved_assets(
                 export_manager=export_manager,
                 gee_asset_path=script_manager.config["gee_assets_path"],
+                inventory=gee_asset_inventory,
             )
+            if export_manager.export_region_stats:
+                workflows.get_gee_saved_tables(
+                    export_manager=export_manager,
+                    gee_asset_path=script_manager.config["gee_assets_path"],
+                    inventory=gee_asset_inventory,
+                )
 
         if export_manager.export_to_gdrive:
             logger.debug(f"--- Reading GDrive Assets")
@@ -147,9 +266,28 @@ def main():
                 export_manager=export_manager,
                 gdrive_assets_path=script_manager.config["gdrive_assets_path"],
                 gdrive_service=gdrive_service,
+                inventory_path=script_manager.config["gdrive_inventory_path"],
+            )
+            if export_manager.export_region_stats:
+                workflows.get_gdrive_saved_tables(
+                    export_manager=export_manager,
+                    gdrive_assets_path=script_manager.config["gdrive_assets_path"],
+                    gdrive_service=gdrive_service,
+                    inventory_path=script_manager.config["gdrive_inventory_path"],
+                )
+
+        if export_manager.export_to_local:
+            logger.debug(f"--- Reading Local Assets")
+            workflows.get_local_saved_assets(
+                export_manager=export_manager,
+                local_assets_path=script_manager.config["local_assets_path"],
             )
 
         workflows.determine_export_plan(export_manager)
+        if export_manager.export_intermediates:
+            workflows.plan_intermediates(export_manager)
+        if export_manager.provisional:
+            workflows.plan_provisional(export_manager)
         str_export_plan = export_manager.print_export_plan()
         print(str_export_plan)
         logger.info(str_export_plan)
@@ -160,9 +298,21 @@ def main():
 
     # TODO: Place below in Try/Except block
     # workflows.determine_export_plan(export_manager)
-    if len(export_manager.export_plan["final_plan"]) == 0:
+    if (
+        len(export_manager.export_plan["final_plan"]) == 0
+        and not export_manager.provisional_month
+    ):
         message = "No new images to save."
         logger.info(message)
+        if fingerprints_path:
+            state.write_state(fingerprints_path, export_manager.saved_months)
+        if state_path:
+            state.write_state(
+                state_path,
+                state.build_state(
+                    plan_config, export_manager.modis_status, "UP_TO_DATE"
+                ),
+            )
         # Print and send results
         if script_manager.email_service:
             logger.debug("------ SENDING REPORT EMAIL --------")
@@ -180,6 +330,8 @@ def main():
     ee_monthly_snow_cloud_collection = workflows.calculate_sci_cci(
         ee_MODIS_collection=ee_MODIS_collection,
         all_months_to_save=export_manager.export_plan["final_plan"],
+        accumulators=export_manager.accumulators,
+        statistics=export_manager.monthly_statistics,
     )
 
     # Create, start and track Export tasks
@@ -187,10 +339,19 @@ def main():
         export_manager=export_manager,
         ee_monthly_snow_cloud_collection=ee_monthly_snow_cloud_collection,
         ee_regions=ee_regions,
+        gdrive_service=gdrive_service,
     )
 
+    # Add the new assets to the inventory for the next run
+    if gee_asset_inventory is not None:
+        workflows.record_gee_exports(export_manager, gee_asset_inventory)
+
+    if fingerprints_path:
+        export_manager.record_exported_months()
+        state.write_state(fingerprints_path, export_manager.saved_months)
+
     # Print Export Results
-    if export_manager.export_plan["final_plan"]:
+    if export_manager.export_tasks.export_tasks:
         str_export_status = export_manager.print_export_status()
 
     else:
@@ -200,6 +361,15 @@ def main():
     print(str_export_status)
     logger.info(str_export_status)
 
+    if state_path:
+        outcome = state.run_outcome(
+            [task.status for task in export_manager.export_tasks.export_tasks]
+        )
+        state.write_state(
+            state_path,
+            state.build_state(plan_config, export_manager.modis_status, outcome),
+        )
+
     # Send Export Results
     if script_manager.email_service:
         logger.debug("------ SENDING EMAIL REPORT--------")
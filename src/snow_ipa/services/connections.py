@@ -131,11 +131,22 @@ def check_gdrive_path(asset_path: str, gdrive_service: object):
         raise ValueError(e_message)
 
 
-def check_regions(asset_path: str):
-    # Check if feature collection exists else stop script
+def check_regions(asset_path: str) -> dict:
+    """
+    Check if the regions Feature Collection exists, else stop script.
+
+    Args:
+        asset_path (str): The path to the regions asset in GEE.
+
+    Returns:
+        dict: The type, size and last update time of the regions asset.
+    """
     # NOTE: This is very specific to this project and might not translate to other uses.
     logger.debug("--- Checking regions path")
-    if not gee_assets.check_asset_exists(asset_path, "TABLE"):
+    regions_asset = gee_assets.get_asset_info(asset_path)
+    if regions_asset is None or regions_asset["type"] != "TABLE":
         e_message = f"Regions Asset not found: {asset_path}"
         logger.error(e_message)
         raise ValueError(e_message)
+    logger.debug(f"Regions asset last updated: {regions_asset['update_time']}")
+    return regions_asset
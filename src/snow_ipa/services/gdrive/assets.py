@@ -1,12 +1,143 @@
 # cSpell:enableCompoundWords
 
 from pathlib import Path
-from typing import Optional, List
+from typing import Iterator, Optional, List
 import logging
 from googleapiclient.errors import HttpError
+from snow_ipa.services.gdrive import batch, cache
 
 logger = logging.getLogger(__name__)
 
+FOLDER_MIME_TYPE = "application/vnd.google-apps.folder"
+DRIVE_MAX_PAGE_SIZE = 1000
+DRIVE_LIST_FIELDS = "nextPageToken, files(id, name, mimeType)"
+
+# Folder IDs by path. Replaced by set_folder_id_cache to keep it across runs
+folder_id_cache = cache.FolderIdCache()
+# Shared drive where paths are resolved. Set with set_shared_drive_id
+shared_drive_id: Optional[str] = None
+
+# Google Drive MIME types equivalent to GEE asset types
+DRIVE_MIME_TYPES = {
+    "IMAGE": "image/tiff",
+    "TABLE": "text/csv",
+}
+
+
+def set_folder_id_cache(
+    cache_path: Optional[str] = None, ttl: float = cache.DEFAULT_TTL
+) -> cache.FolderIdCache:
+    """
+    Replaces the cache used to resolve folder paths to folder IDs.
+
+    Args:
+        cache_path: JSON file to keep the cache across runs. If None, the cache is
+            only kept in memory.
+        ttl: Seconds a cached folder ID is valid for.
+
+    Returns:
+        The new cache.
+    """
+    global folder_id_cache
+    folder_id_cache = cache.FolderIdCache(cache_path=cache_path, ttl=ttl)
+    return folder_id_cache
+
+
+def is_not_found(error: HttpError) -> bool:
+    """
+    Returns True if a Google Drive API error is caused by a file or folder that
+    doesn't exist.
+    """
+    return getattr(error.resp, "status", None) == 404
+
+
+def set_shared_drive_id(drive_id: Optional[str] = None) -> None:
+    """
+    Sets the shared drive where paths are resolved and files are listed. If None,
+    paths are resolved from the root of the service account's My Drive.
+
+    Args:
+        drive_id: ID of the shared drive.
+    """
+    global shared_drive_id
+    shared_drive_id = drive_id
+
+
+def list_options() -> dict:
+    """
+    Returns the extra files().list parameters needed to query the shared drive set
+    with set_shared_drive_id, or an empty dictionary if none is set.
+    """
+    if not shared_drive_id:
+        return {}
+    return {
+        "corpora": "drive",
+        "driveId": shared_drive_id,
+        "includeItemsFromAllDrives": True,
+        "supportsAllDrives": True,
+    }
+
+
+def find_child_folder(
+    drive_service, name: str, parent: Optional[str] = None
+) -> Optional[str]:
+    """
+    Returns the ID of the folder with the given name inside a parent folder, or None
+    if it doesn't exist.
+
+    Searches are always scoped to the parent folder, so each call is a single query
+    no matter how many folders the account can see. If parent is None, the folder
+    is searched in the root of the shared drive set with set_shared_drive_id or in
+    the root of My Drive. Folders shared with the service account are not in its
+    root, so they are searched by name as a fallback.
+
+    Args:
+        drive_service: An instance of the Google Drive API service.
+        name: The name of the folder.
+        parent: The ID of the parent folder. If None, the folder is searched in root.
+
+    Returns:
+        The ID of the folder, or None if it doesn't exist.
+
+    Raises:
+        HttpError: An error occurred while communicating with the Google Drive API.
+    """
+    # Build query string
+    query = f"mimeType = '{FOLDER_MIME_TYPE}'"
+    query = query + " " + f"and name = '{escape_query_value(name)}'"
+    query = query + " " + "and trashed = false"
+    scope = f"'{parent or shared_drive_id or 'root'}' in parents"
+
+    # Call the Drive v3 API
+    results = (
+        drive_service.files()
+        .list(
+            q=query + " and " + scope,
+            pageSize=1,
+            fields="files(id)",
+            **list_options(),
+        )
+        .execute()
+    )
+    items = results.get("files", [])
+
+    if not items and parent is None and not shared_drive_id:
+        results = (
+            drive_service.files()
+            .list(
+                q=query + " and sharedWithMe = true",
+                pageSize=1,
+                fields="files(id)",
+            )
+            .execute()
+        )
+        items = results.get("files", [])
+
+    # Error control in case we end up with an empty list
+    if len(items) >= 1:
+        return items[0]["id"]
+    return None
+
 
 def get_folder_id(
     drive_service, path: str, parent: Optional[str] = None
@@ -14,6 +145,11 @@ def get_folder_id(
     """
     Returns the ID of the folder at the given path, or None if it doesn't exist.
 
+    Folder IDs are read from folder_id_cache when possible, so only the path
+    segments that are not cached are queried. If a folder is not found under a
+    cached folder, the cached entries are invalidated and the path is resolved
+    again from the API.
+
     Args:
         drive_service: An instance of the Google Drive API service.
         path: The path of the folder to get the ID for.
@@ -25,63 +161,66 @@ def get_folder_id(
     Raises:
         HttpError: An error occurred while communicating with the Google Drive API.
     """
+    try:
+        return resolve_folder_id(drive_service, path, parent)
+    finally:
+        # Write the changes to the cache once the whole path is resolved
+        folder_id_cache.save()
+
+
+def resolve_folder_id(
+    drive_service, path: str, parent: Optional[str] = None
+) -> Optional[str]:
+    """
+    Resolves a folder path to its ID segment by segment for get_folder_id, updating
+    folder_id_cache in memory.
+    """
     # Parse path
     path_tuple = Path(path).parts
-    current_folder = path_tuple[0]
 
-    # Build query string
-    query = "mimeType = 'application/vnd.google-apps.folder'"
-    query = query + " " + f"and name = '{current_folder}'"
-    if parent:
-        query = query + " " + f"and '{parent}' in parents"
+    # Paths in a shared drive are resolved from the root of the drive
+    if parent is None and shared_drive_id:
+        parent = shared_drive_id
+
+    # Start from the deepest folder of the path found in cache
+    current_folder_id = parent
+    cached_depth = 0
+    for depth in range(len(path_tuple), 0, -1):
+        cached_id = folder_id_cache.get("/".join(path_tuple[:depth]), parent)
+        if cached_id:
+            current_folder_id = cached_id
+            cached_depth = depth
+            break
+
+    for depth in range(cached_depth, len(path_tuple)):
+        sub_path = "/".join(path_tuple[: depth + 1])
+        try:
+            current_folder_id = find_child_folder(
+                drive_service=drive_service,
+                name=path_tuple[depth],
+                parent=current_folder_id,
+            )
+        except HttpError as error:
+            if cached_depth and is_not_found(error):
+                current_folder_id = None
+            else:
+                # Log the error and return None
+                logger.warning(error)
+                return None
 
-    # Call the Drive v3 API
-    try:
-        items = []
-        page_token = None
-        while True:
-            results = (
-                drive_service.files()
-                .list(
-                    q=query,
-                    pageSize=100,
-                    pageToken=page_token,
-                    fields="nextPageToken, files(id, name, parents)",
+        if current_folder_id is None:
+            folder_id_cache.invalidate(sub_path, parent)
+            if cached_depth:
+                # A cached folder might have been moved or deleted, resolve again
+                folder_id_cache.invalidate("/".join(path_tuple[:cached_depth]), parent)
+                return resolve_folder_id(
+                    drive_service=drive_service, path=path, parent=parent
                 )
-                .execute()
-            )
-            items.extend(results.get("files", []))
-            page_token = results.get("nextPageToken", None)
-            if page_token is None:
-                break
-        if len(items) > 1 and parent is None:
-            # This should only happen when searching for folders in root.
-            # because we haven't found a way to specify root as parent
-            items = [item for item in items if "parents" not in item.keys()]
-
-        # Error control in case we end up with an empty list
-        if len(items) >= 1:
-            current_folder_id = items[0]["id"]
-        else:
-            # Stop and return
             return None
 
-    except HttpError as error:
-        # Log the error and return None
-        logger.warning(error)
-        return None
-
-    target_folder_id = current_folder_id
-
-    # Recursive call if path if not yet in target folder
-    if len(path_tuple) > 1 and current_folder_id:
-        target_folder_id = get_folder_id(
-            drive_service=drive_service,
-            path="/".join(path_tuple[1:]),
-            parent=current_folder_id,
-        )
+        folder_id_cache.set(sub_path, current_folder_id, parent)
 
-    return target_folder_id
+    return current_folder_id
 
 
 def drive_list_files(
@@ -90,6 +229,8 @@ def drive_list_files(
     folder_id: Optional[str] = None,
     asset_type=None,
     recursive: bool = False,
+    max_depth: Optional[int] = None,
+    name_contains: Optional[str] = None,
 ) -> Optional[list]:
     """
     List all files and folders in Google Drive given a path or folder ID.
@@ -99,7 +240,9 @@ def drive_list_files(
         path: Path in Google Drive.
         folder_id: Unique ID of a folder in Google Drive. If both path and folder_id are set, the ID of the given path must match the given folder_id.
         asset_type: List or single string indicating the type of files to consider.
-        recursive: If True, will also list files in sub-folders.
+        recursive: If True, will also list files in sub-folders. Sub-folders are listed in batches, level by level.
+        max_depth: Maximum number of sub-folder levels to list when recursive. None lists all levels.
+        name_contains: Only list files with a name that contains this string. Drive matches it as a prefix of the name or of any word in it.
 
     Returns:
         A list with the names of the files found in the given path or folder ID.
@@ -130,8 +273,12 @@ def drive_list_files(
             return None
     elif folder_id:
         try:
-            item = drive_service.files().get(fileId=folder_id).execute()
-            if item["mimeType"] != "application/vnd.google-apps.folder":
+            item = (
+                drive_service.files()
+                .get(fileId=folder_id, supportsAllDrives=bool(shared_drive_id))
+                .execute()
+            )
+            if item["mimeType"] != FOLDER_MIME_TYPE:
                 print("Error: not a folder")
                 return None
         except HttpError as e:
@@ -149,61 +296,386 @@ def drive_list_files(
         # if folder_id and path are None, list everything from root folder
         folder_id = None
 
-    # build query string
+    try:
+        asset_list = list(
+            iter_drive_files(
+                drive_service=drive_service,
+                folder_id=folder_id,
+                asset_type=asset_type,
+                recursive=recursive,
+                max_depth=max_depth,
+                name_contains=name_contains,
+            )
+        )
+    except HttpError as e:
+        if path and is_not_found(e):
+            folder_id_cache.invalidate(path, shared_drive_id)
+            folder_id_cache.save()
+        print(f"Can't list objects in: {path}")
+        print(e)
+        asset_list = []
+    return asset_list
+
+
+def build_list_query(
+    folder_id: Optional[str] = None,
+    mime_types: Optional[list] = None,
+    name_contains: Optional[str] = None,
+    include_folders: bool = False,
+) -> str:
+    """
+    Builds a Google Drive query that lists the files of a folder filtered by MIME
+    type and name, so files that are not needed are not returned by the API.
+
+    Args:
+        folder_id: Unique ID of the folder. If None, files in any folder are listed.
+        mime_types: MIME types of the files to list. All types if empty or None.
+        name_contains: Only list files with a name that contains this string. Drive
+            matches it as a prefix of the name or of any word in it.
+        include_folders: If True, sub-folders are listed regardless of the filters.
+
+    Returns:
+        str: The query to use as the q parameter of files().list.
+    """
+    file_filters = []
+    if mime_types:
+        file_filters.append(
+            "(" + " or ".join(f"mimeType = '{mime}'" for mime in mime_types) + ")"
+        )
+    if name_contains:
+        file_filters.append(f"name contains '{escape_query_value(name_contains)}'")
+
+    file_filter = " and ".join(file_filters)
+    if include_folders and file_filter:
+        file_filter = f"(mimeType = '{FOLDER_MIME_TYPE}' or ({file_filter}))"
+
+    conditions = ["trashed = false"]
     if folder_id:
-        query = f"'{folder_id}' in parents"
-    else:
-        # list everything
-        query = None
+        conditions.insert(0, f"'{folder_id}' in parents")
+    if file_filter:
+        conditions.append(file_filter)
+    return " and ".join(conditions)
+
+
+def list_folder_children(
+    drive_service,
+    folder_id: Optional[str] = None,
+    http=None,
+    mime_types: Optional[list] = None,
+    name_contains: Optional[str] = None,
+    include_folders: bool = False,
+) -> list[dict]:
+    """
+    Lists the files and folders inside a Google Drive folder.
+
+    Filters are applied by the API so only the items needed are returned, using the
+    maximum page size and only the id, name and mimeType fields.
+
+    Args:
+        drive_service: Google Drive API service.
+        folder_id: Unique ID of the folder. If None, everything is listed.
+        http: Http object used for the requests. The service's Http object if None.
+        mime_types: MIME types of the files to list. All types if empty or None.
+        name_contains: Only list files with a name that contains this string.
+        include_folders: If True, sub-folders are listed regardless of the filters.
+
+    Returns:
+        A list of dictionaries with the id, name and mimeType of each item.
+
+    Raises:
+        HttpError: An error occurred accessing the Google Drive API.
+    """
+    query = build_list_query(
+        folder_id=folder_id,
+        mime_types=mime_types,
+        name_contains=name_contains,
+        include_folders=include_folders,
+    )
 
-    asset_list = []
     child_assets = []
     page_token = None
-    try:
-        while True:
-            results = (
-                drive_service.files()
-                .list(
-                    q=query,
-                    pageSize=100,
-                    pageToken=page_token,
-                    fields="nextPageToken, files(id, name, parents, mimeType)",
-                )
-                .execute()
+    while True:
+        results = list_request(drive_service, query, page_token).execute(http=http)
+        child_assets.extend(results.get("files", []))
+        page_token = results.get("nextPageToken", None)
+        if page_token is None:
+            break
+    return child_assets
+
+
+def list_request(drive_service, query: str, page_token: Optional[str] = None):
+    """
+    Returns the files().list request for one page of a folder listing query.
+    """
+    return drive_service.files().list(
+        q=query,
+        pageSize=DRIVE_MAX_PAGE_SIZE,
+        pageToken=page_token,
+        fields=DRIVE_LIST_FIELDS,
+        **list_options(),
+    )
+
+
+def list_folders_children(
+    drive_service,
+    folder_ids: list[str],
+    mime_types: Optional[list] = None,
+    name_contains: Optional[str] = None,
+    include_folders: bool = False,
+) -> dict[str, list[dict] | HttpError]:
+    """
+    Lists the files and folders inside several Google Drive folders, requesting the
+    pages of all folders in batches instead of one request per folder and page.
+
+    Args:
+        drive_service: Google Drive API service.
+        folder_ids: Unique IDs of the folders.
+        mime_types: MIME types of the files to list. All types if empty or None.
+        name_contains: Only list files with a name that contains this string.
+        include_folders: If True, sub-folders are listed regardless of the filters.
+
+    Returns:
+        dict: The items in each folder by folder ID, as returned by
+        list_folder_children. Folders that couldn't be listed have the HttpError
+        raised instead.
+    """
+    queries = {
+        folder_id: build_list_query(
+            folder_id=folder_id,
+            mime_types=mime_types,
+            name_contains=name_contains,
+            include_folders=include_folders,
+        )
+        for folder_id in folder_ids
+    }
+    folders_children: dict[str, list[dict] | HttpError] = {
+        folder_id: [] for folder_id in folder_ids
+    }
+
+    # Request the next page of every folder that has one in the same batch
+    page_tokens: dict[str, Optional[str]] = {
+        folder_id: None for folder_id in folder_ids
+    }
+    while page_tokens:
+        responses = batch.execute_batch(
+            drive_service,
+            {
+                folder_id: list_request(drive_service, queries[folder_id], page_token)
+                for folder_id, page_token in page_tokens.items()
+            },
+        )
+        page_tokens = {}
+        for folder_id, response in responses.items():
+            if isinstance(response, HttpError):
+                folders_children[folder_id] = response
+                continue
+            folders_children[folder_id].extend(response.get("files", []))  # type: ignore
+            if response.get("nextPageToken"):
+                page_tokens[folder_id] = response["nextPageToken"]
+    return folders_children
+
+
+def walk_drive_tree(
+    drive_service,
+    folder_id: Optional[str] = None,
+    mime_types: Optional[list] = None,
+    name_contains: Optional[str] = None,
+    max_depth: Optional[int] = None,
+) -> Iterator[tuple[dict, tuple[str, ...]]]:
+    """
+    Walks a Google Drive folder tree breadth-first. All the folders of each level
+    are listed together with list_folders_children, so a level costs one batch
+    request per 100 folders and page instead of one request per folder.
+
+    Args:
+        drive_service: Google Drive API service.
+        folder_id: Unique ID of the folder to start from. If None, everything is
+            listed.
+        mime_types: MIME types of the files to list. All types if empty or None.
+        name_contains: Only list files with a name that contains this string.
+        max_depth: Maximum number of sub-folder levels to walk into. 0 only lists
+            the folder. None walks the whole tree.
+
+    Yields:
+        tuple: (file, path) where path has the names of the sub-folders between
+        the folder and the file.
+
+    Raises:
+        HttpError: An error occurred accessing the Google Drive API.
+    """
+    level: dict[Optional[str], tuple[str, ...]] = {folder_id: ()}
+    depth = 0
+    while level:
+        folders_children = list_folders_children(
+            drive_service,
+            list(level.keys()),  # type: ignore
+            mime_types=mime_types,
+            name_contains=name_contains,
+            include_folders=True,
+        )
+        next_level: dict[Optional[str], tuple[str, ...]] = {}
+        for parent_id, children in folders_children.items():
+            if isinstance(children, HttpError):
+                raise children
+            for child in children:
+                if child["mimeType"] != FOLDER_MIME_TYPE:
+                    yield child, level[parent_id]
+                elif max_depth is None or depth < max_depth:
+                    next_level[child["id"]] = level[parent_id] + (child["name"],)
+        level = next_level
+        depth += 1
+
+
+def iter_drive_files(
+    drive_service,
+    folder_id: Optional[str] = None,
+    asset_type: Optional[list] = None,
+    recursive: bool = False,
+    max_depth: Optional[int] = None,
+    name_contains: Optional[str] = None,
+) -> Iterator[str]:
+    """
+    Yields the names of the files in a Google Drive folder.
+
+    When recursive, sub-folders are listed level by level with batched requests and
+    names of files in sub-folders include their relative path, e.g.
+    "sub_folder/file.tif".
+
+    Args:
+        drive_service: Google Drive API service.
+        folder_id: Unique ID of the folder. If None, everything is listed.
+        asset_type: List of MIME types to consider. All types if empty or None.
+        recursive: If True, will also list files in sub-folders.
+        max_depth: Maximum number of sub-folder levels to list when recursive.
+            None lists all levels.
+        name_contains: Only list files with a name that contains this string.
+
+    Yields:
+        str: Name of each file found.
+
+    Raises:
+        HttpError: An error occurred accessing the Google Drive API.
+    """
+    asset_type = asset_type or []
+
+    if recursive:
+        child_assets = walk_drive_tree(
+            drive_service,
+            folder_id,
+            mime_types=asset_type,
+            name_contains=name_contains,
+            max_depth=max_depth,
+        )
+    else:
+        child_assets = (
+            (item, ())
+            for item in list_folder_children(
+                drive_service,
+                folder_id,
+                mime_types=asset_type,
+                name_contains=name_contains,
             )
-            child_assets.extend(results.get("files", []))
-            page_token = results.get("nextPageToken", None)
-            if page_token is None:
-                break
+            if item["mimeType"] != FOLDER_MIME_TYPE
+        )
+
+    for child_asset, child_path in child_assets:
+        # if asset_type is provided, return only items of that type
+        if child_asset["mimeType"] in asset_type or len(asset_type) == 0:
+            yield "/".join(child_path + (child_asset["name"],))
+
+
+def escape_query_value(value: str) -> str:
+    """
+    Escapes a string to be used as a value in a Google Drive query.
+
+    Args:
+        value (str): The string to escape. e.g. "Region's"
+
+    Returns:
+        str: The escaped string. e.g. "Region\\'s"
+    """
+    return value.replace("\\", "\\\\").replace("'", "\\'")
+
+
+def get_file_info(
+    drive_service, asset: str, asset_type: Optional[str] = None
+) -> Optional[dict]:
+    """
+    Returns the MIME type, size and last update time of a file in Google Drive
+    querying it by name, without listing its parent folder.
+
+    Args:
+        drive_service: Google Drive API service object
+        asset: Path to the asset in Google Drive
+        asset_type: MIME type of the file expected (optional)
+
+    Returns:
+        dict: {"id", "type", "size_bytes", "update_time"} or None if the file, or its
+        parent folder, doesn't exist.
+
+    Raises:
+        HttpError: An error occurred accessing the Google Drive API.
+    """
+    asset_path = Path(asset).parent.as_posix()
+    file_name = Path(asset).name
+
+    cached_parent = False
+    if asset_path in ["", "."]:
+        parent_id = shared_drive_id or "root"
+    else:
+        cached_parent = folder_id_cache.get(asset_path, shared_drive_id) is not None
+        parent_id = get_folder_id(drive_service=drive_service, path=asset_path)
+        if parent_id is None:
+            logger.debug(f"Folder not found: {asset_path}")
+            return None
+
+    try:
+        results = file_info_request(
+            drive_service, parent_id, file_name, asset_type
+        ).execute()
     except HttpError as e:
-        print(f"Can't list objects in: {path}")
-        print(e)
+        if cached_parent and is_not_found(e):
+            # Cached parent folder no longer exists, resolve it again
+            folder_id_cache.invalidate(asset_path, shared_drive_id)
+            return get_file_info(drive_service, asset, asset_type)
+        raise
+    return parse_file_info(results)
 
-    # iterate over items found. Jump into next folder if item is folder
-    for child_asset in child_assets:
-        child_id = child_asset["id"]
-        child_name = child_asset["name"]
-        child_type = child_asset["mimeType"]
-        if child_type in ["application/vnd.google-apps.folder"]:
-            if recursive:
-                # Recursively call function to jump in next folder
-                grandchild_assets = drive_list_files(
-                    drive_service=drive_service, folder_id=child_id
-                )
-                if grandchild_assets:
-                    grandchild_assets = [
-                        child_name + "/" + item for item in grandchild_assets
-                    ]
-                    asset_list.extend(grandchild_assets)
-            else:
-                pass
-        else:
-            # if asset_type is provided, return only items of that type
-            if child_type in asset_type or len(asset_type) == 0:
-                asset_list.append(child_name)
-            else:
-                pass
-    return asset_list
+
+def file_info_request(
+    drive_service, parent_id: str, file_name: str, asset_type: Optional[str] = None
+):
+    """
+    Returns the files().list request that queries a file by name in a folder.
+    """
+    query = f"name = '{escape_query_value(file_name)}' and '{parent_id}' in parents and trashed = false"
+    if asset_type:
+        query = query + " " + f"and mimeType = '{asset_type}'"
+
+    return drive_service.files().list(
+        q=query,
+        pageSize=1,
+        fields="files(id, mimeType, size, modifiedTime)",
+        **list_options(),
+    )
+
+
+def parse_file_info(results: dict) -> Optional[dict]:
+    """
+    Returns the file information from the response of a file_info_request, or None
+    if the file wasn't found.
+    """
+    items = results.get("files", [])
+    if not items:
+        return None
+
+    size_bytes = items[0].get("size")
+    return {
+        "id": items[0]["id"],
+        "type": items[0]["mimeType"],
+        "size_bytes": int(size_bytes) if size_bytes is not None else None,
+        "update_time": items[0].get("modifiedTime"),
+    }
 
 
 def check_asset_exists(
@@ -219,33 +691,74 @@ def check_asset_exists(
 
     Returns:
         True if asset is found, False if it isn't
+
+    Raises:
+        HttpError: An error occurred accessing the Google Drive API.
     """
-    asset_path = Path(asset).parent.as_posix()
-    file_name = Path(asset).name
     logger.debug(f"Searching for asset: {asset}")
+    asset_found = (
+        get_file_info(drive_service=drive_service, asset=asset, asset_type=asset_type)
+        is not None
+    )
+    logger.debug(f"Asset found: {asset_found}")
+    return asset_found
 
-    # Get list of assets in given path
-    try:
-        asset_list = drive_list_files(
-            drive_service=drive_service, path=asset_path, asset_type=asset_type
-        )
 
-        if asset_list is None:
-            raise
-        asset_list_len = len(asset_list)
-        logger.debug(f"Found {asset_list_len} assets in path: {asset_path}")
-    except:
-        logger.warning("Asset list could not be retrieved")
-        return False
+def trash_older_files(drive_service, path: str, name: str) -> int:
+    """
+    Moves to the trash the older copies of a file exported more than once to a
+    folder, keeping the most recently created one. Drive exports don't replace
+    files with the same name, so this completes the replacement of an asset.
 
-    # Check if asset is in asset list
-    asset_found = False
-    for asset_x in asset_list:
-        if file_name == asset_x:
-            asset_found = True
+    Args:
+        drive_service: Google Drive API service object
+        path: Path to the folder in Google Drive.
+        name: Name of the file without extension.
 
-    logger.debug(f"Asset found: {asset_found}")
-    return asset_found
+    Returns:
+        int: Number of files moved to the trash.
+
+    Raises:
+        HttpError: An error occurred accessing the Google Drive API.
+    """
+    folder_id = get_folder_id(drive_service=drive_service, path=path)
+    if folder_id is None:
+        return 0
+
+    copies = []
+    page_token = None
+    query = build_list_query(folder_id=folder_id, name_contains=name)
+    while True:
+        results = (
+            drive_service.files()
+            .list(
+                q=query,
+                pageSize=DRIVE_MAX_PAGE_SIZE,
+                pageToken=page_token,
+                fields="nextPageToken, files(id, name, mimeType, createdTime)",
+                **list_options(),
+            )
+            .execute()
+        )
+        copies.extend(
+            file
+            for file in results.get("files", [])
+            if remove_extension(file["name"]) == name
+            and file["mimeType"] != FOLDER_MIME_TYPE
+        )
+        page_token = results.get("nextPageToken")
+        if page_token is None:
+            break
+
+    copies.sort(key=lambda file: file.get("createdTime", ""), reverse=True)
+    for file in copies[1:]:
+        logger.debug(f"Moving replaced file to trash: {file['name']}")
+        drive_service.files().update(
+            fileId=file["id"],
+            body={"trashed": True},
+            supportsAllDrives=True,
+        ).execute()
+    return len(copies[1:])
 
 
 def check_folder_exists(drive_service, path: str) -> bool:
@@ -272,7 +785,10 @@ def remove_extension(file: str) -> str:
 
 
 def get_asset_list(
-    drive_service, path: str, asset_type: Optional[List[str] | str] = None
+    drive_service,
+    path: str,
+    asset_type: Optional[List[str] | str] = None,
+    name_prefix: Optional[str] = None,
 ) -> List[str]:
     """
     Returns a list of assets in a format similar to Google Earth Engine (GEE) Assets.
@@ -281,8 +797,10 @@ def get_asset_list(
         drive_service: An authenticated Google Drive API client service object.
         path: A string representing the path to the folder containing the assets.
         asset_type: An optional string or list of strings representing the type of assets to retrieve.
-            Valid values are "IMAGE", "TABLE", "FOLDER".
+            Valid values are "IMAGE", "TABLE".
             Defaults to None, which retrieves all asset types.
+        name_prefix: Only list assets whose name starts with name_prefix. The filter is
+            also sent to the API to avoid listing unrelated files.
 
     Returns:
         A list of strings representing the names of the assets in the specified folder,
@@ -304,12 +822,17 @@ def get_asset_list(
     else:
         asset_type = []
 
-    # Convert IMAGE type to something Google Drive can understand
-    drive_asset_type = ["image/tiff" for type in asset_type if type == "IMAGE"]
+    # Convert asset types to something Google Drive can understand
+    drive_asset_type = [
+        DRIVE_MIME_TYPES[type] for type in asset_type if type in DRIVE_MIME_TYPES
+    ]
 
     # Get list of assets
     asset_list = drive_list_files(
-        drive_service=drive_service, path=path, asset_type=drive_asset_type
+        drive_service=drive_service,
+        path=path,
+        asset_type=drive_asset_type,
+        name_contains=name_prefix,
     )
 
     # Remove suffix of file names
@@ -317,4 +840,8 @@ def get_asset_list(
         asset_list = list(map(remove_extension, asset_list))
     else:
         asset_list = []
+
+    # Drive also matches name_prefix at the start of words, keep only true prefixes
+    if name_prefix:
+        asset_list = [asset for asset in asset_list if asset.startswith(name_prefix)]
     return asset_list
@@ -0,0 +1,57 @@
+import logging
+from typing import Any, Hashable
+from googleapiclient.errors import HttpError
+
+logger = logging.getLogger(__name__)
+
+# Constants. Used as Defaults in case no alternative is provided.
+MAX_BATCH_SIZE = 100  # Maximum number of calls per batch in the Drive API
+
+
+def execute_batch(
+    drive_service,
+    requests: dict[Hashable, Any],
+    batch_size: int = MAX_BATCH_SIZE,
+) -> dict[Hashable, Any]:
+    """
+    Executes independent Google Drive API requests grouped in multipart batch
+    requests, one HTTP round trip per batch_size requests.
+
+    Errors are handled per request, a failed request doesn't stop the others.
+
+    Args:
+        drive_service: Google Drive API service.
+        requests: Requests to execute, e.g. drive_service.files().list(...), by key.
+        batch_size: Maximum number of requests per batch.
+
+    Returns:
+        dict: The response of each request by key. Requests that failed have the
+        HttpError raised instead of a response.
+
+    Example:
+        requests = {name: drive_service.files().get(fileId=id) for name, id in ids}
+        for name, response in execute_batch(drive_service, requests).items():
+            if isinstance(response, HttpError):
+                ...
+    """
+    results: dict[Hashable, Any] = {}
+    keys = list(requests.keys())
+
+    for start in range(0, len(keys), batch_size):
+        batch_keys = keys[start : start + batch_size]
+
+        def _callback(request_id: str, response: Any, exception: HttpError | None):
+            key = batch_keys[int(request_id)]
+            if exception is not None:
+                logger.warning(f"Batched request {key} failed: {exception}")
+                results[key] = exception
+            else:
+                results[key] = response
+
+        batch = drive_service.new_batch_http_request(callback=_callback)
+        for i, key in enumerate(batch_keys):
+            batch.add(requests[key], request_id=str(i))
+        batch.execute()
+        logger.debug(f"Executed batch of {len(batch_keys)} Google Drive requests")
+
+    return results
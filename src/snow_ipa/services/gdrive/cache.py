@@ -0,0 +1,120 @@
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Constants. Used as Defaults in case no alternative is provided.
+DEFAULT_TTL = 7 * 24 * 60 * 60  # seconds
+
+
+class FolderIdCache:
+    """
+    A cache of Google Drive folder IDs by path.
+
+    Entries are kept in memory for the run and, if cache_path is set, saved to a JSON
+    file so they can be reused across runs. Entries older than ttl seconds are
+    ignored.
+
+    The cache can be shared by threads. Changes are only written to the file when
+    save is called, once a path has been resolved, instead of on every change.
+    """
+
+    def __init__(
+        self, cache_path: Optional[str] = None, ttl: float = DEFAULT_TTL
+    ) -> None:
+        self.cache_path: Optional[Path] = Path(cache_path) if cache_path else None
+        self.ttl: float = ttl
+        self.entries: dict[str, dict] = {}
+        self.modified: bool = False
+        self.lock = threading.Lock()
+        self.load()
+
+    @staticmethod
+    def key(path: str, parent: Optional[str] = None) -> str:
+        """
+        Returns the cache key of a path. Paths relative to a parent folder other than
+        root are prefixed with the parent ID.
+        """
+        key = "/".join(Path(path.strip("/")).parts)
+        if parent:
+            key = f"{parent}:{key}"
+        return key
+
+    def get(self, path: str, parent: Optional[str] = None) -> Optional[str]:
+        """
+        Returns the cached folder ID of a path or None if not cached or expired.
+        """
+        with self.lock:
+            entry = self.entries.get(self.key(path, parent))
+        if entry is None:
+            return None
+        if time.time() - entry["cached_at"] > self.ttl:
+            logger.debug(f"Folder ID cache expired for: {path}")
+            return None
+        return entry["id"]
+
+    def set(self, path: str, folder_id: str, parent: Optional[str] = None) -> None:
+        """
+        Caches the folder ID of a path.
+        """
+        with self.lock:
+            self.entries[self.key(path, parent)] = {
+                "id": folder_id,
+                "cached_at": time.time(),
+            }
+            self.modified = True
+
+    def invalidate(self, path: str, parent: Optional[str] = None) -> None:
+        """
+        Removes a path and all the paths inside it from the cache.
+        """
+        key = self.key(path, parent)
+        with self.lock:
+            stale_keys = [
+                cached_key
+                for cached_key in self.entries
+                if cached_key == key or cached_key.startswith(key + "/")
+            ]
+            if not stale_keys:
+                return
+            logger.debug(f"Invalidating folder ID cache for: {path}")
+            for stale_key in stale_keys:
+                del self.entries[stale_key]
+            self.modified = True
+
+    def load(self) -> None:
+        """
+        Reads the cache file if it exists. A missing or unreadable file starts an
+        empty cache.
+        """
+        if self.cache_path is None or not self.cache_path.exists():
+            return
+        try:
+            self.entries = json.loads(self.cache_path.read_text(encoding="utf-8"))
+            logger.debug(
+                f"{len(self.entries)} folder IDs read from cache: {self.cache_path}"
+            )
+        except (OSError, ValueError) as e:
+            logger.warning(f"Can't read folder ID cache {self.cache_path}: {e}")
+            self.entries = {}
+
+    def save(self) -> None:
+        """
+        Writes the cache file if cache_path is set and the cache changed since it was
+        last saved.
+        """
+        if self.cache_path is None:
+            return
+        with self.lock:
+            if not self.modified:
+                return
+            try:
+                self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+                self.cache_path.write_text(json.dumps(self.entries), encoding="utf-8")
+                self.modified = False
+            except OSError as e:
+                logger.warning(f"Can't write folder ID cache {self.cache_path}: {e}")
@@ -0,0 +1,234 @@
+import json
+import logging
+import time
+from pathlib import Path
+from typing import List, Optional
+from googleapiclient.errors import HttpError
+
+from snow_ipa.services.gdrive import assets as gdrive_assets
+
+logger = logging.getLogger(__name__)
+
+# Constants. Used as Defaults in case no alternative is provided.
+CHANGES_FIELDS = (
+    "nextPageToken, newStartPageToken, "
+    "changes(fileId, removed, file(name, mimeType, parents, trashed))"
+)
+
+
+class DriveInventory:
+    """
+    A local inventory of the files in a Google Drive folder.
+
+    The inventory is seeded with a full listing of the folder and then kept up to
+    date with the Changes API, starting from the page token saved in the last sync.
+    In steady state a sync costs a single changes().list request. If the saved
+    token is missing, expired or belongs to another folder, the folder is listed
+    again from scratch.
+
+    The inventory is saved as a JSON file in store_path.
+    """
+
+    def __init__(self, drive_service, folder_id: str, store_path: str) -> None:
+        self.drive_service = drive_service
+        self.folder_id: str = folder_id
+        self.store_path: Path = Path(store_path)
+        self.start_page_token: Optional[str] = None
+        self.files: dict[str, dict] = {}
+        self.load()
+
+    def load(self) -> None:
+        """
+        Reads the inventory from store_path. The inventory is left empty if the file
+        doesn't exist, can't be read or belongs to another folder.
+        """
+        if not self.store_path.exists():
+            return
+        try:
+            store = json.loads(self.store_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Can't read Drive inventory {self.store_path}: {e}")
+            return
+        if store.get("folder_id") != self.folder_id:
+            logger.debug("Drive inventory belongs to another folder, ignoring it")
+            return
+        self.start_page_token = store.get("start_page_token")
+        self.files = store.get("files", {})
+
+    def save(self) -> None:
+        """
+        Writes the inventory to store_path.
+        """
+        store = {
+            "folder_id": self.folder_id,
+            "start_page_token": self.start_page_token,
+            "synced_at": time.time(),
+            "files": self.files,
+        }
+        self.store_path.parent.mkdir(parents=True, exist_ok=True)
+        self.store_path.write_text(json.dumps(store), encoding="utf-8")
+
+    def full_resync(self) -> None:
+        """
+        Lists the folder from scratch and saves the start page token to follow the
+        changes made after the listing.
+        """
+        logger.debug(f"Full resync of Drive inventory: {self.store_path}")
+        # Get the token before listing so changes made while listing are not lost
+        token_response = (
+            self.drive_service.changes()
+            .getStartPageToken(**self.changes_options())
+            .execute()
+        )
+        children = gdrive_assets.list_folder_children(
+            self.drive_service, self.folder_id
+        )
+        self.files = {
+            child["id"]: {"name": child["name"], "mimeType": child["mimeType"]}
+            for child in children
+            if child["mimeType"] != gdrive_assets.FOLDER_MIME_TYPE
+        }
+        self.start_page_token = token_response["startPageToken"]
+        self.save()
+
+    def apply_changes(self) -> int:
+        """
+        Updates the inventory with the changes made since start_page_token.
+
+        Returns:
+            int: Number of changes applied.
+
+        Raises:
+            HttpError: An error occurred accessing the Google Drive API.
+        """
+        total_changes = 0
+        page_token = self.start_page_token
+        while page_token:
+            response = (
+                self.drive_service.changes()
+                .list(
+                    pageToken=page_token,
+                    pageSize=gdrive_assets.DRIVE_MAX_PAGE_SIZE,
+                    fields=CHANGES_FIELDS,
+                    spaces="drive",
+                    **self.changes_options(),
+                )
+                .execute()
+            )
+            for change in response.get("changes", []):
+                self.apply_change(change)
+                total_changes += 1
+            page_token = response.get("nextPageToken")
+            if response.get("newStartPageToken"):
+                self.start_page_token = response["newStartPageToken"]
+        self.save()
+        return total_changes
+
+    def apply_change(self, change: dict) -> None:
+        """
+        Adds, updates or removes a file from the inventory given a change from the
+        Changes API.
+        """
+        file_id = change["fileId"]
+        file = change.get("file") or {}
+        in_folder = (
+            not change.get("removed")
+            and not file.get("trashed")
+            and self.folder_id in file.get("parents", [])
+            and file.get("mimeType") != gdrive_assets.FOLDER_MIME_TYPE
+        )
+        if in_folder:
+            self.files[file_id] = {"name": file["name"], "mimeType": file["mimeType"]}
+        else:
+            self.files.pop(file_id, None)
+
+    def sync(self) -> None:
+        """
+        Updates the inventory from the Changes API or with a full resync if there's
+        no valid start page token.
+        """
+        if not self.start_page_token:
+            self.full_resync()
+            return
+        try:
+            total_changes = self.apply_changes()
+            logger.debug(f"{total_changes} changes applied to Drive inventory")
+        except HttpError as e:
+            # Expired or invalid page tokens can't be recovered
+            if getattr(e.resp, "status", None) in [400, 404, 410]:
+                logger.warning(f"Drive changes token not valid, resyncing: {e}")
+                self.full_resync()
+            else:
+                raise
+
+    def changes_options(self) -> dict:
+        """
+        Returns the extra parameters needed to follow changes in a shared drive.
+        """
+        if not gdrive_assets.shared_drive_id:
+            return {}
+        return {
+            "driveId": gdrive_assets.shared_drive_id,
+            "supportsAllDrives": True,
+        }
+
+    def names(self, mime_types: Optional[list] = None) -> List[str]:
+        """
+        Returns the names of the files in the inventory.
+
+        Args:
+            mime_types: MIME types of the files to return. All types if empty or None.
+        """
+        return [
+            file["name"]
+            for file in self.files.values()
+            if not mime_types or file["mimeType"] in mime_types
+        ]
+
+
+def get_asset_list(
+    drive_service,
+    path: str,
+    store_path: str,
+    asset_type: Optional[List[str] | str] = None,
+    name_prefix: Optional[str] = None,
+) -> List[str]:
+    """
+    Same as gdrive.assets.get_asset_list but reads the assets from a DriveInventory
+    kept in store_path, which is synced before reading.
+
+    Args:
+        drive_service: An authenticated Google Drive API client service object.
+        path: A string representing the path to the folder containing the assets.
+        store_path: Path of the JSON file where the inventory is kept.
+        asset_type: "IMAGE", "TABLE" or a list of them. All types if None.
+        name_prefix: Only list assets whose name starts with name_prefix.
+
+    Returns:
+        A list with the names of the assets in the folder without extension.
+
+    Raises:
+        ValueError: If the folder doesn't exist.
+        HttpError: An error occurred accessing the Google Drive API.
+    """
+    if isinstance(asset_type, str):
+        asset_type = [asset_type]
+    mime_types = [
+        gdrive_assets.DRIVE_MIME_TYPES[type]
+        for type in asset_type or []
+        if type in gdrive_assets.DRIVE_MIME_TYPES
+    ]
+
+    folder_id = gdrive_assets.get_folder_id(drive_service=drive_service, path=path)
+    if folder_id is None:
+        raise ValueError(f"Google Drive folder not found: {path}")
+
+    inventory = DriveInventory(drive_service, folder_id, store_path)
+    inventory.sync()
+
+    asset_list = [
+        gdrive_assets.remove_extension(name) for name in inventory.names(mime_types)
+    ]
+    if name_prefix:
+        asset_list = [asset for asset in asset_list if asset.startswith(name_prefix)]
+    return asset_list
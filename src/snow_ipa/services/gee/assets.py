@@ -1,24 +1,80 @@
 import logging
-import pathlib
 import re
+import unicodedata
+from typing import Iterator
 import ee
 from ee import data as ee_data
+from snow_ipa.utils import traversal
 
 # cSpell:enableCompoundWords
 
 logger = logging.getLogger(__name__)
 # Constants. Used as Defaults in case no alternative is provided.
 GEE_LEGACY_PATHPREFIX = "projects/earthengine-legacy/assets/"
+DEFAULT_PAGE_SIZE = 1000
+GEE_FOLDER_TYPES = ["FOLDER", "IMAGE_COLLECTION"]
+TEMPORARY_SUFFIX = "_TMP"
+BACKUP_SUFFIX = "_BAK"
 
 
-def get_asset_list(parent: str, asset_type=None, recursive: bool = False):
+def iter_child_assets(
+    parent_id: str, page_size: int = DEFAULT_PAGE_SIZE
+) -> Iterator[dict]:
+    """
+    Yields the assets inside a folder or Image Collection in GEE, requesting one
+    page at a time.
+
+    Args:
+        parent_id: Full ID of the folder or Image Collection.
+        page_size: Maximum number of assets per request.
+
+    Yields:
+        dict: Asset information as returned by ee.data.listAssets.
+    """
+    page_token = None
+    while True:
+        params = {"parent": parent_id, "pageSize": page_size}
+        if page_token:
+            params["pageToken"] = page_token
+        response = ee_data.listAssets(params)
+        child_assets = response.get("assets", [])
+        if not isinstance(child_assets, list):
+            raise Exception(
+                f"Expecting a 'list' of assets but got '{type(child_assets)}' instead"
+            )
+        yield from child_assets
+        page_token = response.get("nextPageToken")
+        if not page_token:
+            break
+
+
+def get_asset_list(
+    parent: str,
+    asset_type=None,
+    recursive: bool = False,
+    name_prefix: str | None = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_depth: int | None = None,
+    max_workers: int = traversal.DEFAULT_MAX_WORKERS,
+) -> Iterator[str]:
     """
     lists assets from an assets folder or Image Collection in GEE. User can specify what type of assets to list.
 
+    Results are requested page by page and yielded as they are received. When
+    recursive, sub-folders are listed concurrently and filters apply to all levels.
+
     Args:
         parent: path to the parent folder of the assets
         asset_type: indicats asset types to list.
         recursive: Recursively search for assets in sub-folders
+        name_prefix: Only list assets whose name (excluding path) starts with name_prefix
+        page_size: Maximum number of assets per request.
+        max_depth: Maximum number of sub-folder levels to search when recursive.
+            None searches all levels.
+        max_workers: Maximum number of folders listed at the same time.
+
+    Yields:
+        str: Full ID of each asset found.
 
     reference: https://github.com/spatialthoughts/projects/blob/master/ee-python/list_all_assets.py
     """
@@ -43,57 +99,171 @@ def get_asset_list(parent: str, asset_type=None, recursive: bool = False):
         raise
 
     try:
-        asset_list = []
-        child_assets = ee_data.listAssets({"parent": parent_id})["assets"]
-        if type(child_assets) != list:
-            raise Exception(
-                f"Expecting a 'list' of assets but got '{type(asset_list)}' instead"
+        if recursive:
+            # Sub-folders are listed concurrently
+            child_assets = (
+                child_asset
+                for child_asset, _ in traversal.walk_tree(
+                    root=parent_id,
+                    list_children=lambda folder_id: iter_child_assets(
+                        folder_id, page_size=page_size
+                    ),
+                    is_folder=lambda asset: asset["type"] in GEE_FOLDER_TYPES,
+                    get_name=lambda asset: asset["name"].split("/")[-1],
+                    get_id=lambda asset: asset["name"],
+                    max_depth=max_depth,
+                    max_workers=max_workers,
+                )
             )
+        else:
+            child_assets = (
+                child_asset
+                for child_asset in iter_child_assets(parent_id, page_size=page_size)
+                if child_asset["type"] not in GEE_FOLDER_TYPES
+            )
+
+        # Get assets from list
+        for child_asset in child_assets:
+            child_id = child_asset["name"]
+            child_type = child_asset["type"]
+            if name_prefix and not child_id.split("/")[-1].startswith(name_prefix):
+                continue
+            if child_type in asset_type or len(asset_type) == 0:
+                yield child_id
     except Exception as e:
         logger.warning(f"Can't list objects in: {parent}")
         logger.warning(e)
         raise
 
-    # Get assets from list
-    for child_asset in child_assets:
-        child_id = child_asset["name"]
-        child_type = child_asset["type"]
-        # print(f"{child_id}:{child_type}")
-        if child_type in ["FOLDER", "IMAGE_COLLECTION"]:
-            # Recursively call the function to get child assets
-            if recursive:
-                asset_list.extend(get_asset_list(child_id))
-        else:
-            if child_type in asset_type or len(asset_type) == 0:
-                asset_list.append(child_id)
-    return asset_list
+
+def get_asset_info(asset: str) -> dict | None:
+    """
+    Returns the type, size and last update time of an asset in GEE with a single
+    ee.data.getAsset call, without listing its parent folder.
+
+    Args:
+        asset: path to the asset in GEE
+
+    Returns:
+        dict: {"id", "type", "size_bytes", "update_time"} or None if the asset
+        doesn't exist. size_bytes is None for folders and Image Collections.
+
+    Raises:
+        ee.EEException: If the asset information can't be retrieved for a reason
+        other than the asset not existing.
+    """
+    try:
+        asset_info = ee_data.getAsset(asset)
+    except ee.EEException as e:
+        if "not found" in str(e) or "does not exist" in str(e):
+            logger.debug(f"Asset not found: {asset}")
+            return None
+        logger.error(f"Can't get asset information: {asset}")
+        raise
+
+    size_bytes = asset_info.get("sizeBytes")
+    return {
+        "id": asset_info["name"],
+        "type": asset_info["type"],
+        "size_bytes": int(size_bytes) if size_bytes is not None else None,
+        "update_time": asset_info.get("updateTime"),
+    }
+
+
+def get_asset_properties(asset: str) -> dict | None:
+    """
+    Returns the properties of an asset in GEE with a single ee.data.getAsset call.
+
+    Args:
+        asset: path to the asset in GEE
+
+    Returns:
+        dict: The properties of the asset or None if the asset doesn't exist.
+
+    Raises:
+        ee.EEException: If the asset can't be read for a reason other than the asset
+        not existing.
+    """
+    try:
+        asset_info = ee_data.getAsset(asset)
+    except ee.EEException as e:
+        if "not found" in str(e) or "does not exist" in str(e):
+            logger.debug(f"Asset not found: {asset}")
+            return None
+        raise
+    return asset_info.get("properties", {})
 
 
-def check_asset_exists(asset: str, asset_type=None):
+def check_asset_exists(asset: str, asset_type=None) -> bool:
     """Test if an asset exists in GEE Assets for the user.
 
     Args:
         asset: path to the asset in GEE
-        asset_type: indicates type of asset expected
+        asset_type: indicates type or list of types of asset expected
 
     Returns:
         Returns True if asset is found, False if it isn't
-    """
 
-    asset_path = pathlib.Path(asset).parent.as_posix()
-    try:
-        asset_found = False
-        # Get list of assets in given path
-        asset_list = get_asset_list(asset_path, asset_type=asset_type)
-        if asset_list and isinstance(asset_list, list):
-            for asset_i in asset_list:
-                if (GEE_LEGACY_PATHPREFIX + asset == asset_i) or (asset == asset_i):
-                    asset_found = True
-                    break
-        return asset_found
+    Raises:
+        ee.EEException: If the asset information can't be retrieved for a reason
+        other than the asset not existing.
+    """
+    if isinstance(asset_type, str):
+        asset_type = [asset_type]
 
-    except Exception as e:
+    asset_info = get_asset_info(asset)
+    if asset_info is None:
+        return False
+    if asset_type and asset_info["type"] not in asset_type:
+        logger.debug(f"Asset {asset} is a {asset_info['type']}, not {asset_type}")
         return False
+    return True
+
+
+def temporary_asset_id(asset: str) -> str:
+    """
+    Returns the ID of the temporary asset used to replace an existing asset.
+    e.g. "path/MOD10A1_2024-01" -> "path/MOD10A1_2024-01_TMP"
+    """
+    return f"{asset}{TEMPORARY_SUFFIX}"
+
+
+def replace_asset(source: str, destination: str) -> None:
+    """
+    Replaces an asset with another one, renaming source to destination.
+
+    An existing destination is first renamed to a backup asset, which is restored
+    if source can't be moved into place and deleted otherwise, so the destination
+    is never lost when the replacement fails.
+
+    Args:
+        source: path to the new asset in GEE. e.g. a temporary asset
+        destination: path to the asset to replace
+
+    Raises:
+        ee.EEException: If the assets can't be renamed.
+    """
+    backup = f"{destination}{BACKUP_SUFFIX}"
+    if get_asset_info(destination) is None:
+        ee_data.renameAsset(source, destination)
+        logger.debug(f"Asset replaced: {destination}")
+        return
+
+    # Backup left by an interrupted replacement. The destination is the good copy
+    if get_asset_info(backup) is not None:
+        ee_data.deleteAsset(backup)
+    ee_data.renameAsset(destination, backup)
+    try:
+        ee_data.renameAsset(source, destination)
+    except Exception:
+        logger.error(f"Couldn't replace {destination}, restoring the backup")
+        ee_data.renameAsset(backup, destination)
+        raise
+    try:
+        ee_data.deleteAsset(backup)
+    except ee.EEException as e:
+        logger.warning(f"Couldn't delete the backup asset {backup}: {e}")
+    logger.debug(f"Asset replaced: {destination}")
 
 
 def check_folder_exists(path):
@@ -140,3 +310,26 @@ def get_trailing_ym(assets_list: list) -> list:
 
     assets_months.sort(reverse=True)
     return assets_months
+
+
+def to_asset_name(value: str) -> str:
+    """
+    Converts a string into a name that can be safely used as part of a GEE asset ID
+    or Google Drive file name.
+
+    Accents are removed and any run of characters other than letters and digits is
+    replaced with a single "-". Underscores are also replaced so they can be used as
+    separators in image names.
+
+    Args:
+        value (str): The string to convert. e.g. "Región de Valparaíso"
+
+    Returns:
+        str: The converted name. e.g. "Region-de-Valparaiso"
+    """
+    ascii_value = (
+        unicodedata.normalize("NFKD", str(value))
+        .encode("ascii", "ignore")
+        .decode("ascii")
+    )
+    return re.sub(r"[^A-Za-z0-9]+", "-", ascii_value).strip("-")
@@ -1,4 +1,8 @@
 from ee.image import Image
+from ee.feature import Feature
+from ee.featurecollection import FeatureCollection
+from ee.filter import Filter
+from ee.reducer import Reducer
 import logging
 
 logger = logging.getLogger(__name__)
@@ -37,3 +41,79 @@ def snow_cloud_mask(image: Image) -> Image:
     )
 
     return image.addBands(ee_snow).addBands(ee_cloud)  # type: ignore
+
+
+def dissolve_regions(
+    regions: FeatureCollection, name_property: str
+) -> FeatureCollection:
+    """
+    Returns one feature per region with the union of the geometries of all the
+    features that share its name, so a region made of several features (e.g. a
+    mainland area and its islands) is reduced as a single region.
+
+    Parameters:
+    -----------
+        regions (ee.FeatureCollection): Regions, possibly with several features each.
+        name_property (str): Property of the regions with the region name.
+
+    Returns:
+    --------
+        ee.FeatureCollection: One feature per distinct value of name_property, with
+        only that property.
+    """
+
+    def _dissolve(feature: Feature) -> Feature:
+        name = feature.get(name_property)
+        geometry = regions.filter(Filter.eq(name_property, name)).geometry().dissolve()  # type: ignore
+        return Feature(geometry, {name_property: name})
+
+    return regions.distinct(name_property).map(_dissolve)  # type: ignore
+
+
+def region_stats(
+    image: Image,
+    regions: FeatureCollection,
+    name_property: str,
+    month: str,
+    scale: float,
+) -> FeatureCollection:
+    """
+    Calculates the mean SCI, mean CCI and number of valid pixels of an image for each
+    region in a single reduceRegions pass. Features that share a region name are
+    dissolved first, so there's a single row per region.
+
+    Expects the image to have the bands "SCI" and "CCI".
+
+    Parameters:
+    -----------
+        image (ee.Image): Monthly SCI and CCI image.
+        regions (ee.FeatureCollection): Regions to reduce over.
+        name_property (str): Property of the regions with the region name.
+        month (str): Month of the image in the format YYYY-MM-DD.
+        scale (float): Scale in meters used for the reduction.
+
+    Returns:
+    --------
+        ee.FeatureCollection: One feature without geometry per region with the
+        properties region, month, sci_mean, cci_mean and valid_pixel_count.
+    """
+    reducer = Reducer.mean().combine(Reducer.count(), sharedInputs=True)  # type: ignore
+    ee_stats = image.select(["SCI", "CCI"]).reduceRegions(  # type: ignore
+        collection=dissolve_regions(regions, name_property),
+        reducer=reducer,
+        scale=scale,
+    )
+
+    def _to_row(feature: Feature) -> Feature:
+        return Feature(
+            None,
+            {
+                "region": feature.get(name_property),
+                "month": month[:7],
+                "sci_mean": feature.get("SCI_mean"),
+                "cci_mean": feature.get("CCI_mean"),
+                "valid_pixel_count": feature.get("SCI_count"),
+            },
+        )
+
+    return ee_stats.map(_to_row)  # type: ignore
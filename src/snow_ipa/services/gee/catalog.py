@@ -0,0 +1,499 @@
+import calendar
+import hashlib
+import json
+import logging
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Iterator
+from ee import data as ee_data
+
+logger = logging.getLogger(__name__)
+
+# Constants. Used as Defaults in case no alternative is provided.
+DEFAULT_PAGE_SIZE = 1000
+DEFAULT_REVALIDATE_DAYS = 30
+REFRESH_OVERLAP_DAYS = 31
+LATEST_LOOKBACK_DAYS = 62
+
+
+def get_latest_image_date(collection_path: str, since: str) -> str | None:
+    """
+    Returns the date of the latest image in an Image Collection that starts on or
+    after a given date.
+
+    Uses ee.data.listImages filtered by start time with the BASIC view, so only the
+    metadata of the few images added since the given date is requested.
+
+    Args:
+        collection_path: ID of the Image Collection. e.g. "MODIS/061/MOD10A1"
+        since: Minimum start date of the images in the format YYYY-MM-DD.
+
+    Returns:
+        The date of the latest image in the format YYYY-MM-DD or None if there are
+        no images after since.
+    """
+    params = {
+        "parent": collection_path,
+        "startTime": f"{since}T00:00:00Z",
+        "pageSize": DEFAULT_PAGE_SIZE,
+        "view": "BASIC",
+    }
+    latest_start_time = None
+    while True:
+        response = ee_data.listImages(params)
+        for image in response.get("images", []):
+            start_time = image.get("startTime")
+            if start_time and (
+                latest_start_time is None or start_time > latest_start_time
+            ):
+                latest_start_time = start_time
+        page_token = response.get("nextPageToken")
+        if not page_token:
+            break
+        params["pageToken"] = page_token
+
+    if latest_start_time is None:
+        return None
+    logger.debug(f"Latest image in {collection_path}: {latest_start_time}")
+    return latest_start_time[:10]
+
+
+def poll_latest_image_date(
+    collection_path: str,
+    last_known: str | None = None,
+    lookback_days: int = LATEST_LOOKBACK_DAYS,
+) -> str | None:
+    """
+    Returns the date of the latest image in an Image Collection without reducing the
+    collection. Only the images added since last_known are listed, or those of the
+    last lookback_days if the date of the latest image isn't known yet.
+
+    Args:
+        collection_path: ID of the Image Collection. e.g. "MODIS/061/MOD10A1"
+        last_known: Date of the latest image seen before, YYYY-MM-DD.
+        lookback_days: Days listed when last_known is None.
+
+    Returns:
+        The date of the latest image in the format YYYY-MM-DD. last_known if there
+        are no newer images, or None if it's unknown and the lookback window has no
+        images.
+    """
+    since = last_known or (date.today() - timedelta(days=lookback_days)).isoformat()
+    return get_latest_image_date(collection_path, since=since) or last_known
+
+
+def iter_images(
+    collection_path: str, start: str, end: str | None = None
+) -> Iterator[dict]:
+    """
+    Yields the metadata of each image in an Image Collection between two dates,
+    without running computations in GEE.
+
+    Images are requested with ee.data.listImages filtered by start time with the
+    BASIC view, one page at a time.
+
+    Args:
+        collection_path: ID of the Image Collection. e.g. "MODIS/061/MOD10A1"
+        start: Minimum start date of the images in the format YYYY-MM-DD (inclusive).
+        end: Maximum start date of the images in the format YYYY-MM-DD (exclusive).
+
+    Yields:
+        dict: The image metadata returned by ee.data.listImages. e.g. {"id",
+        "startTime", "updateTime", ...}
+    """
+    params = {
+        "parent": collection_path,
+        "startTime": f"{start}T00:00:00Z",
+        "pageSize": DEFAULT_PAGE_SIZE,
+        "view": "BASIC",
+    }
+    if end:
+        params["endTime"] = f"{end}T00:00:00Z"
+    while True:
+        response = ee_data.listImages(params)
+        for image in response.get("images", []):
+            yield image
+        page_token = response.get("nextPageToken")
+        if not page_token:
+            break
+        params["pageToken"] = page_token
+
+
+def iter_image_dates(
+    collection_path: str, start: str, end: str | None = None
+) -> Iterator[str]:
+    """
+    Yields the start date of each image in an Image Collection between two dates
+    using metadata only. See iter_images.
+
+    Yields:
+        str: Start date of each image in the format YYYY-MM-DD.
+    """
+    for image in iter_images(collection_path, start, end):
+        if image.get("startTime"):
+            yield image["startTime"][:10]
+
+
+def images_fingerprint(images: list[str]) -> str:
+    """
+    Returns the fingerprint of a group of images.
+
+    Args:
+        images: "<id>@<updateTime>" of each image.
+
+    Returns:
+        str: sha256 hash of the sorted images.
+    """
+    return hashlib.sha256("\n".join(sorted(images)).encode()).hexdigest()
+
+
+def scan_month_catalog(
+    collection_path: str, start: str, end: str | None = None
+) -> tuple[dict[str, bytearray], dict[str, str]]:
+    """
+    Returns the days with images and the fingerprint of the images of each month of
+    an Image Collection, with a single paged listing of the images.
+
+    Args:
+        collection_path: ID of the Image Collection. e.g. "MODIS/061/MOD10A1"
+        start: Minimum start date of the images in the format YYYY-MM-DD (inclusive).
+        end: Maximum start date of the images in the format YYYY-MM-DD (exclusive).
+
+    Returns:
+        tuple: The month coverage {YYYY-MM: bytearray}, where the item day - 1 of
+        each bytearray is 1 if there's an image for that day and 0 otherwise, and
+        the fingerprints {YYYY-MM: fingerprint}. See month_fingerprints.
+    """
+    coverage: dict[str, bytearray] = {}
+    month_images: dict[str, list[str]] = {}
+    total_images = 0
+    for image in iter_images(collection_path, start, end):
+        if not image.get("startTime"):
+            continue
+        image_date = image["startTime"][:10]
+        month = image_date[:7]
+        if month not in coverage:
+            year, month_number = int(month[:4]), int(month[5:])
+            days = calendar.monthrange(year, month_number)[1]
+            coverage[month] = bytearray(days)
+        coverage[month][int(image_date[8:]) - 1] = 1
+        month_images.setdefault(month, []).append(
+            f"{image.get('id')}@{image.get('updateTime')}"
+        )
+        total_images += 1
+    logger.debug(f"{total_images} images found in {collection_path} since {start}")
+    fingerprints = {
+        month: images_fingerprint(images) for month, images in month_images.items()
+    }
+    return coverage, fingerprints
+
+
+def scan_month_coverage(
+    collection_path: str, start: str, end: str | None = None
+) -> dict[str, bytearray]:
+    """
+    Returns the days with images for each month of an Image Collection. See
+    scan_month_catalog.
+
+    Returns:
+        dict: {YYYY-MM: bytearray} where the item day - 1 of each bytearray is 1 if
+        there's an image for that day and 0 otherwise.
+    """
+    return scan_month_catalog(collection_path, start, end)[0]
+
+
+def month_fingerprints(collection_path: str, months: list[str]) -> dict[str, str]:
+    """
+    Returns a fingerprint of the images of each month, so months reprocessed in the
+    collection after they were exported can be detected.
+
+    The fingerprint is a hash of the ID and update time of every image in the month.
+    All the months are read with a single paged listing from the first to the last
+    month, using metadata only. CatalogCache keeps the same fingerprints for every
+    month without listing the images again.
+
+    Args:
+        collection_path: ID of the Image Collection. e.g. "MODIS/061/MOD10A1"
+        months: Months in the format YYYY-MM-DD, any day of the month.
+
+    Returns:
+        dict: {YYYY-MM-01: fingerprint} for each month with images.
+    """
+    if not months:
+        return {}
+    first_month = min(months)[:7]
+    last_month = date.fromisoformat(f"{max(months)[:7]}-01")
+    end = (last_month + timedelta(days=32)).replace(day=1).isoformat()
+    wanted = {month[:7] for month in months}
+
+    _, fingerprints = scan_month_catalog(collection_path, f"{first_month}-01", end)
+    return {
+        f"{month}-01": fingerprint
+        for month, fingerprint in fingerprints.items()
+        if month in wanted
+    }
+
+
+def count_images(coverage: dict[str, bytearray]) -> int:
+    """
+    Returns the number of days with images in a month coverage.
+    """
+    return sum(sum(days) for days in coverage.values())
+
+
+def last_covered_date(
+    coverage: dict[str, bytearray], until: date | None = None
+) -> date | None:
+    """
+    Returns the last day with an image in a month coverage.
+
+    Args:
+        coverage: Month coverage returned by scan_month_coverage.
+        until: If set, only days on or before until are considered.
+
+    Returns:
+        The date of the last image or None if there are none.
+    """
+    for month in sorted(coverage.keys(), reverse=True):
+        days = coverage[month]
+        for day in range(len(days), 0, -1):
+            if not days[day - 1]:
+                continue
+            covered_date = date(int(month[:4]), int(month[5:]), day)
+            if until is None or covered_date <= until:
+                return covered_date
+    return None
+
+
+def last_complete_month(
+    coverage: dict[str, bytearray], last_expected_img_dt: date
+) -> date | None:
+    """
+    Returns the last day of the last complete month in a month coverage.
+
+    Same rule as imagecollection.ic_rm_incomplete_months: starting from the month of
+    last_expected_img_dt, a month is removed while the last image found is not the
+    last day of the month.
+
+    Args:
+        coverage: Month coverage returned by scan_month_coverage.
+        last_expected_img_dt: date of the last expected image.
+
+    Returns:
+        The last day of the last complete month or None if there are no complete
+        months.
+    """
+    first_month = min(coverage.keys(), default=None)
+    while first_month and last_expected_img_dt.strftime("%Y-%m") >= first_month:
+        if last_covered_date(coverage, until=last_expected_img_dt) == (
+            last_expected_img_dt
+        ):
+            return last_expected_img_dt
+        logger.debug(f"Incomplete month: {last_expected_img_dt.strftime('%Y-%m')}")
+        last_expected_img_dt = last_expected_img_dt.replace(day=1) - timedelta(days=1)
+    return None
+
+
+def available_months(
+    coverage: dict[str, bytearray], last_complete_dt: date | None
+) -> list[str]:
+    """
+    Returns the months up to last_complete_dt with an image on the first day of
+    the month, same as imagecollection.ic_get_distinct_months on a collection with
+    incomplete months removed.
+
+    Args:
+        coverage: Month coverage returned by scan_month_coverage.
+        last_complete_dt: Last day of the last complete month.
+
+    Returns:
+        Months represented by their first day (YYYY-MM-01) in descending order.
+    """
+    if last_complete_dt is None:
+        return []
+    last_month = last_complete_dt.strftime("%Y-%m")
+    months = [
+        f"{month}-01"
+        for month, days in coverage.items()
+        if month <= last_month and days[0]
+    ]
+    months.sort(reverse=True)
+    return months
+
+
+class CatalogCache:
+    """
+    A local cache of the days with images and of the fingerprint of the images in
+    each month of an Image Collection.
+
+    The first refresh scans the whole collection from start. Next refreshes only scan
+    the images since the month of the last scan minus REFRESH_OVERLAP_DAYS, so days
+    that arrive late are still picked up, and replace those months in the cache.
+    Every revalidate_days the whole collection is scanned again to catch days
+    reprocessed or removed from older months.
+
+    The cache is saved as a JSON file in store_path.
+    """
+
+    def __init__(
+        self,
+        collection_path: str,
+        start: str,
+        store_path: str,
+        revalidate_days: float = DEFAULT_REVALIDATE_DAYS,
+    ) -> None:
+        self.collection_path: str = collection_path
+        self.start: str = start
+        self.store_path: Path = Path(store_path)
+        self.revalidate_days: float = revalidate_days
+        self.scanned_until: str | None = None
+        self.validated_at: float = 0
+        self.coverage: dict[str, bytearray] = {}
+        self.fingerprints: dict[str, str] = {}
+        self.load()
+
+    def load(self) -> None:
+        """
+        Reads the cache from store_path. The cache is left empty if the file doesn't
+        exist, can't be read or belongs to another collection or start date.
+        """
+        if not self.store_path.exists():
+            return
+        try:
+            store = json.loads(self.store_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Can't read catalog cache {self.store_path}: {e}")
+            return
+        if (
+            store.get("collection") != self.collection_path
+            or store.get("start") != self.start
+        ):
+            logger.debug("Catalog cache belongs to another collection, ignoring it")
+            return
+        self.scanned_until = store.get("scanned_until")
+        # Caches saved without fingerprints are scanned again
+        self.validated_at = (
+            store.get("validated_at", 0) if "fingerprints" in store else 0
+        )
+        self.fingerprints = store.get("fingerprints", {})
+        self.coverage = {
+            month: bytearray(int(day) for day in days)
+            for month, days in store.get("coverage", {}).items()
+        }
+
+    def save(self) -> None:
+        """
+        Writes the cache to store_path. Each month is stored as a string of 0 and 1,
+        one character per day.
+        """
+        store = {
+            "collection": self.collection_path,
+            "start": self.start,
+            "scanned_until": self.scanned_until,
+            "validated_at": self.validated_at,
+            "coverage": {
+                month: "".join(str(day) for day in days)
+                for month, days in sorted(self.coverage.items())
+            },
+            "fingerprints": dict(sorted(self.fingerprints.items())),
+        }
+        self.store_path.parent.mkdir(parents=True, exist_ok=True)
+        self.store_path.write_text(json.dumps(store), encoding="utf-8")
+
+    def needs_revalidation(self) -> bool:
+        """
+        Returns True if the whole collection has to be scanned again.
+        """
+        return (
+            not self.scanned_until
+            or time.time() - self.validated_at > self.revalidate_days * 24 * 60 * 60
+        )
+
+    def refresh(self) -> dict[str, bytearray]:
+        """
+        Updates the cache with the images added since the last scan, or with a full
+        scan if a revalidation is due, and saves it.
+
+        Returns:
+            dict: The month coverage, same as scan_month_coverage.
+        """
+        today = date.today().isoformat()
+        if self.needs_revalidation():
+            logger.debug(f"Full scan of catalog: {self.collection_path}")
+            self.coverage, self.fingerprints = scan_month_catalog(
+                self.collection_path, self.start
+            )
+            self.validated_at = time.time()
+        else:
+            since = date.fromisoformat(self.scanned_until) - timedelta(  # type: ignore
+                days=REFRESH_OVERLAP_DAYS
+            )
+            since_month = max(since.replace(day=1).isoformat(), self.start)
+            logger.debug(f"Incremental scan of catalog since {since_month}")
+            recent, recent_fingerprints = scan_month_catalog(
+                self.collection_path, since_month
+            )
+            self.coverage = {
+                month: days
+                for month, days in self.coverage.items()
+                if month < since_month[:7]
+            }
+            self.coverage.update(recent)
+            self.fingerprints = {
+                month: fingerprint
+                for month, fingerprint in self.fingerprints.items()
+                if month < since_month[:7]
+            }
+            self.fingerprints.update(recent_fingerprints)
+        self.scanned_until = today
+        self.save()
+        return self.coverage
+
+
+def get_month_catalog(
+    collection_path: str,
+    start: str,
+    store_path: str | None = None,
+    revalidate_days: float = DEFAULT_REVALIDATE_DAYS,
+) -> tuple[dict[str, bytearray], dict[str, str]]:
+    """
+    Returns the days with images and the fingerprint of the images of each month of
+    an Image Collection. If store_path is set, they're read from a CatalogCache kept
+    in store_path, which is refreshed before reading, so the fingerprints of older
+    months are only updated when the cache is revalidated.
+
+    Args:
+        collection_path: ID of the Image Collection. e.g. "MODIS/061/MOD10A1"
+        start: Minimum start date of the images in the format YYYY-MM-DD (inclusive).
+        store_path: Path of the JSON file where the cache is kept.
+        revalidate_days: Days after which the whole collection is scanned again.
+
+    Returns:
+        tuple: The month coverage and fingerprints, same as scan_month_catalog.
+    """
+    if not store_path:
+        return scan_month_catalog(collection_path, start)
+    cache = CatalogCache(
+        collection_path, start, store_path, revalidate_days=revalidate_days
+    )
+    cache.refresh()
+    return cache.coverage, cache.fingerprints
+
+
+def get_month_coverage(
+    collection_path: str,
+    start: str,
+    store_path: str | None = None,
+    revalidate_days: float = DEFAULT_REVALIDATE_DAYS,
+) -> dict[str, bytearray]:
+    """
+    Returns the days with images for each month of an Image Collection. See
+    get_month_catalog.
+
+    Returns:
+        dict: The month coverage, same as scan_month_coverage.
+    """
+    return get_month_catalog(
+        collection_path, start, store_path=store_path, revalidate_days=revalidate_days
+    )[0]
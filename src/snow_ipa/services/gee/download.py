@@ -0,0 +1,230 @@
+import logging
+import math
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from xml.sax.saxutils import escape
+from ee import data as ee_data
+from ee.image import Image
+
+logger = logging.getLogger(__name__)
+
+# Constants. Used as Defaults in case no alternative is provided.
+METERS_PER_DEGREE = 111320
+DEFAULT_CRS = "EPSG:4326"
+DEFAULT_MAX_REQUEST_BYTES = 32 * 2**20  # computePixels responses are limited to 48MB
+DEFAULT_MAX_WORKERS = 4
+
+
+def get_pixel_grid(bounds: list, resolution: float) -> dict:
+    """
+    Returns the size and geotransform of a pixel grid covering a bounding box.
+
+    Args:
+        bounds (list): [xmin, ymin, xmax, ymax] in degrees.
+        resolution (float): Pixel size in degrees.
+
+    Returns:
+        dict: {"width": int, "height": int, "x": float, "y": float, "resolution": float}
+        where x, y is the upper left corner of the grid.
+    """
+    xmin, ymin, xmax, ymax = bounds
+    return {
+        "width": max(1, math.ceil((xmax - xmin) / resolution)),
+        "height": max(1, math.ceil((ymax - ymin) / resolution)),
+        "x": xmin,
+        "y": ymax,
+        "resolution": resolution,
+    }
+
+
+def split_grid(grid: dict, max_side: int) -> list[dict]:
+    """
+    Splits a pixel grid in chunks of at most max_side x max_side pixels.
+
+    Args:
+        grid (dict): A pixel grid returned by get_pixel_grid.
+        max_side (int): Maximum width and height of each chunk in pixels.
+
+    Returns:
+        list: Chunks {"row", "col", "x_offset", "y_offset", "width", "height", "grid"}
+        where grid is the computePixels grid of the chunk.
+    """
+    chunks = []
+    resolution = grid["resolution"]
+    for row, y_offset in enumerate(range(0, grid["height"], max_side)):
+        for col, x_offset in enumerate(range(0, grid["width"], max_side)):
+            width = min(max_side, grid["width"] - x_offset)
+            height = min(max_side, grid["height"] - y_offset)
+            chunks.append(
+                {
+                    "row": row,
+                    "col": col,
+                    "x_offset": x_offset,
+                    "y_offset": y_offset,
+                    "width": width,
+                    "height": height,
+                    "grid": {
+                        "dimensions": {"width": width, "height": height},
+                        "affineTransform": {
+                            "scaleX": resolution,
+                            "shearX": 0,
+                            "translateX": grid["x"] + x_offset * resolution,
+                            "shearY": 0,
+                            "scaleY": -resolution,
+                            "translateY": grid["y"] - y_offset * resolution,
+                        },
+                        "crsCode": DEFAULT_CRS,
+                    },
+                }
+            )
+    return chunks
+
+
+def write_vrt(path: Path, grid: dict, chunks: list[dict], bands: list[str]) -> None:
+    """
+    Writes a GDAL virtual raster (VRT) that mosaics GeoTIFF chunks into one image.
+
+    Args:
+        path (Path): Path of the VRT file. Chunks are referenced relative to it.
+        grid (dict): The pixel grid of the whole image.
+        chunks (list): Chunks returned by split_grid with the key "path" added.
+        bands (list): Band names, in the order they were downloaded.
+    """
+    resolution = grid["resolution"]
+    lines = [
+        f'<VRTDataset rasterXSize="{grid["width"]}" rasterYSize="{grid["height"]}">',
+        f"  <SRS>{DEFAULT_CRS}</SRS>",
+        f"  <GeoTransform>{grid['x']}, {resolution}, 0, {grid['y']}, 0, {-resolution}</GeoTransform>",
+    ]
+    for band_number, band in enumerate(bands, start=1):
+        lines.append(f'  <VRTRasterBand dataType="Float64" band="{band_number}">')
+        lines.append(f"    <Description>{escape(band)}</Description>")
+        for chunk in chunks:
+            size = f'xSize="{chunk["width"]}" ySize="{chunk["height"]}"'
+            lines.extend(
+                [
+                    "    <SimpleSource>",
+                    f'      <SourceFilename relativeToVRT="1">{escape(Path(chunk["path"]).name)}</SourceFilename>',
+                    f"      <SourceBand>{band_number}</SourceBand>",
+                    f'      <SrcRect xOff="0" yOff="0" {size}/>',
+                    f'      <DstRect xOff="{chunk["x_offset"]}" yOff="{chunk["y_offset"]}" {size}/>',
+                    "    </SimpleSource>",
+                ]
+            )
+        lines.append("  </VRTRasterBand>")
+    lines.append("</VRTDataset>")
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def download_image(
+    image: Image,
+    bounds: list,
+    path: str,
+    scale: float,
+    bands: list[str],
+    bytes_per_band: int,
+    max_request_bytes: int = DEFAULT_MAX_REQUEST_BYTES,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> str:
+    """
+    Downloads an image synchronously with ee.data.computePixels and saves it as a
+    GeoTIFF.
+
+    The area is split in chunks that fit in a single request and chunks are fetched
+    in parallel. If more than one chunk is needed, each chunk is saved as
+    <name>_<row>-<col>.tif next to a <name>.vrt file that mosaics them.
+
+    Args:
+        image: The image to download.
+        bounds: [xmin, ymin, xmax, ymax] in degrees.
+        path: Path of the file to write without extension.
+        scale: Pixel size in meters.
+        bands: Bands to download.
+        bytes_per_band: Size of each pixel value in bytes.
+        max_request_bytes: Maximum size of each request.
+        max_workers: Maximum number of chunks requested at the same time.
+
+    Returns:
+        str: Path of the GeoTIFF or VRT file written.
+    """
+    file_path = Path(path)
+    grid = get_pixel_grid(bounds, scale / METERS_PER_DEGREE)
+    max_side = max(1, math.isqrt(max_request_bytes // (len(bands) * bytes_per_band)))
+    chunks = split_grid(grid, max_side)
+    logger.debug(
+        f"Downloading {file_path.name}: {grid['width']}x{grid['height']} pixels in {len(chunks)} chunks"
+    )
+
+    if len(chunks) == 1:
+        chunks[0]["path"] = file_path.with_suffix(".tif")
+    else:
+        for chunk in chunks:
+            chunk["path"] = file_path.with_name(
+                f"{file_path.name}_{chunk['row']}-{chunk['col']}.tif"
+            )
+
+    def _fetch_chunk(chunk: dict) -> None:
+        data = ee_data.computePixels(
+            {
+                "expression": image,
+                "fileFormat": "GEO_TIFF",
+                "bandIds": bands,
+                "grid": chunk["grid"],
+            }
+        )
+        Path(chunk["path"]).write_bytes(data)
+
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # list() re-raises the first error found
+        list(executor.map(_fetch_chunk, chunks))
+
+    if len(chunks) == 1:
+        return Path(chunks[0]["path"]).as_posix()
+
+    vrt_path = file_path.with_suffix(".vrt")
+    write_vrt(vrt_path, grid, chunks, bands)
+    return vrt_path.as_posix()
+
+
+class DirectDownloadTask:
+    """
+    Downloads an image in a background thread with the same start() and status()
+    methods as ee.batch.Task, so it can be tracked by ExportTask and ExportList.
+    """
+
+    def __init__(self, image: Image, bounds: list, path: str, **download_args) -> None:
+        self.image = image
+        self.bounds = bounds
+        self.path = path
+        self.download_args = download_args
+        self.state: str = "UNSUBMITTED"
+        self.error_message: str | None = None
+        self.output: str | None = None
+        self._thread: threading.Thread | None = None
+
+    def _run(self) -> None:
+        try:
+            self.output = download_image(
+                image=self.image,
+                bounds=self.bounds,
+                path=self.path,
+                **self.download_args,
+            )
+            self.state = "COMPLETED"
+        except Exception as e:
+            logger.error(f"Direct download of {self.path} failed: {e}")
+            self.error_message = str(e)
+            self.state = "FAILED"
+
+    def start(self) -> None:
+        self.state = "RUNNING"
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def status(self) -> dict:
+        status = {"state": self.state}
+        if self.error_message:
+            status["error_message"] = self.error_message
+        return status
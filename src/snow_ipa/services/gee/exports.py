@@ -10,7 +10,13 @@ logger = logging.getLogger(__name__)
 # TODO: Add __iter__ method to ExportList to iterate over tasks
 
 GEE_TASK_STATUS = {
-    "EXCLUDED": ["EXCLUDED", "MOCK_CREATED", "MOCK_TASK_SKIPPED", "ALREADY_EXISTS"],
+    "EXCLUDED": [
+        "EXCLUDED",
+        "MOCK_CREATED",
+        "MOCK_TASK_SKIPPED",
+        "ALREADY_EXISTS",
+        "TOO_LARGE",
+    ],
     "NOT_STARTED": ["PLANNED", "CREATED", "UNSUBMITTED"],
     "PENDING": ["SUBMITTED", "PENDING", "STARTED", "READY", "RUNNING"],
     "COMPLETED": ["COMPLETED", "FINISHED", "CANCELLED"],
@@ -36,6 +42,7 @@ GEE_TASK_FINISHED_STATUS = GEE_TASK_STATUS["COMPLETED"] + GEE_TASK_STATUS["FAILE
 
 GEE_EXPORT_VALID_STATUS = [status for status in GEE_TASK_STATUS.keys()]
 MAX_STATUS_UPDATE_FAILURES = 3
+EXPORT_TARGETS = ["gee", "gdrive", "local"]
 
 
 class ExportTask:
@@ -52,10 +59,12 @@ class ExportTask:
         target: str,
         status: str,
         task: ee_batch.Task | None = None,
+        region: str | None = None,
     ) -> None:
         self.task: ee_batch.Task | None = task
         self.image: str = image
         self.date: str = date
+        self.region: str | None = region
         self.target = target
         self.status = status
         self.error: str | None = None
@@ -67,7 +76,7 @@ class ExportTask:
     @target.setter
     def target(self, value: str) -> None:
         value = value.lower()
-        if value not in ["gee", "gdrive"]:
+        if value not in EXPORT_TARGETS:
             raise ValueError(f"Can't create ExportTask, invalid target: {value}.")
         self._target = value
 
@@ -147,7 +156,7 @@ class ExportTask:
                 status = self.task.status()
                 self.status = status["state"]
                 self._status_update_failures = 0
-                self.error = None
+                self.error = status.get("error_message")
 
         except Exception as e:
             self._status_update_failures += 1
@@ -187,14 +196,14 @@ class ExportList:
     def export_summary(self, filter: str | None = None) -> dict[str, int]:
         """Count the number of tasks in each status.
         Args:
-            filter (str): Filter the tasks by target. Can be "gee" or "gdrive".
+            filter (str): Filter the tasks by target. Can be "gee", "gdrive" or "local".
                 If None, all tasks are included.
 
         returns:
             dict: A dictionary with the count of tasks in each status {status:count}.
         """
         filter = filter.lower() if filter else None
-        filter_target = ["gee", "gdrive"]
+        filter_target = EXPORT_TARGETS
         if filter is None:
             _filter = filter_target
         elif filter in filter_target:
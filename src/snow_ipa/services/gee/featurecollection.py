@@ -0,0 +1,111 @@
+import logging
+from ee.dictionary import Dictionary
+from ee.featurecollection import FeatureCollection
+from ee.filter import Filter
+from ee.geometry import Geometry
+
+logger = logging.getLogger(__name__)
+
+
+def fc_get_distinct_values(collection: FeatureCollection, property: str) -> list:
+    """
+    Returns a sorted list of the distinct values of a property in a FeatureCollection.
+
+    Args:
+        collection: An ee.FeatureCollection object.
+        property: Name of the property to read.
+
+    Returns:
+        A list with the distinct values of the property.
+
+    Raises:
+        ValueError: If the property is not present in any feature of the collection.
+    """
+    values = collection.aggregate_array(property).distinct().getInfo()  # type: ignore
+    if not values:
+        raise ValueError(f"Property '{property}' not found in FeatureCollection")
+    values.sort()
+    logger.debug(f"Distinct values of {property} in FeatureCollection: {len(values)}")
+    return values
+
+
+def fc_get_feature_geometry(
+    collection: FeatureCollection, property: str, value
+) -> Geometry:
+    """
+    Returns the geometry of the features in a FeatureCollection where property == value.
+
+    Args:
+        collection: An ee.FeatureCollection object.
+        property: Name of the property to filter by.
+        value: Value of the property to match.
+
+    Returns:
+        An ee.Geometry with the union of the matching features.
+    """
+    return collection.filter(Filter.eq(property, value)).geometry()  # type: ignore
+
+
+def geometry_bounds_info(geometry: Geometry, max_error: float = 1) -> Dictionary:
+    """
+    Returns a server-side dictionary with the area (m2) and coordinates of the
+    bounding box of a geometry.
+
+    Args:
+        geometry: An ee.Geometry object.
+        max_error: Maximum error tolerated (meters) when computing the bounds.
+
+    Returns:
+        An ee.Dictionary with the keys "area" and "coordinates".
+    """
+    ee_bounds = geometry.bounds(max_error)  # type: ignore
+    return Dictionary(
+        {
+            "area": ee_bounds.area(max_error),
+            "coordinates": ee_bounds.coordinates(),
+        }
+    )
+
+
+def fc_get_bounds_info(
+    collection: FeatureCollection, property: str | None = None, values: list = []
+) -> dict:
+    """
+    Returns the area and bounding box of a FeatureCollection, or of each group of
+    features sharing a property value, in a single request.
+
+    Args:
+        collection: An ee.FeatureCollection object.
+        property: Name of the property to group features by. If None, the whole
+            collection is measured.
+        values: Values of the property to measure.
+
+    Returns:
+        A dictionary {value: {"area": float, "bounds": [xmin, ymin, xmax, ymax]}}.
+        The key is None when property is None.
+    """
+    if property is None:
+        ee_info = Dictionary(
+            {"all": geometry_bounds_info(collection.geometry())}  # type: ignore
+        )
+        keys = {"all": None}
+    else:
+        keys = {str(value): value for value in values}
+        ee_info = Dictionary(
+            {
+                key: geometry_bounds_info(
+                    fc_get_feature_geometry(collection, property, value)
+                )
+                for key, value in keys.items()
+            }
+        )
+
+    bounds_info = {}
+    for key, info in ee_info.getInfo().items():  # type: ignore
+        xs = [point[0] for point in info["coordinates"][0]]
+        ys = [point[1] for point in info["coordinates"][0]]
+        bounds_info[keys[key]] = {
+            "area": info["area"],
+            "bounds": [min(xs), min(ys), max(xs), max(ys)],
+        }
+    return bounds_info
@@ -1,11 +1,13 @@
 import logging
 from datetime import datetime, timedelta, date
+from ee.image import Image
 from ee.imagecollection import ImageCollection
+from ee.reducer import Reducer
 from ee import ee_date, ee_list
 from snow_ipa.utils import dates
 from snow_ipa.services.gee import dates as gee_dates
 from snow_ipa.core.scripting import DEFAULT_CONFIG
-from snow_ipa.core.configs import MODIS
+from snow_ipa.core.configs import MODIS, EXPORT
 from snow_ipa.services.gee.image import get_date_ymd
 
 logger = logging.getLogger(__name__)
@@ -110,8 +112,61 @@ def ic_get_distinct_months(collection: ImageCollection) -> list:
     return distinct_months
 
 
+def statistics_reducer(statistics: list[str]) -> Reducer:
+    """
+    Returns a Reducer that calculates the mean and the given statistics in a single
+    pass over the images.
+
+    Args:
+        statistics: Names of the extra statistics. Any of EXPORT["statistics_options"].
+    """
+    reducers = {
+        "count": Reducer.count,
+        "stdDev": Reducer.stdDev,
+        "min": Reducer.min,
+        "max": Reducer.max,
+    }
+    reducer = Reducer.mean()
+    for statistic in statistics:
+        reducer = reducer.combine(reducers[statistic](), sharedInputs=True)  # type: ignore
+    return reducer
+
+
+def ic_reduce_statistics(
+    imagecollection: ImageCollection, bands: list[str], statistics: list[str]
+) -> Image:
+    """
+    Calculates the per-pixel mean and extra statistics of the bands of an
+    ImageCollection with a single combined reducer.
+
+    All bands are cast to Float64, same as the mean, so the image can be exported
+    as a single file.
+
+    Args:
+        imagecollection: An ImageCollection with the bands to reduce.
+        bands: Names of the bands to reduce. e.g. ["SCI", "CCI"]
+        statistics: Names of the extra statistics. e.g. ["count", "stdDev"]
+
+    Returns:
+        An Image with the mean of each band, named as the band, followed by the
+        bands <band>_<statistic> for each statistic.
+    """
+    statistic_bands = [
+        f"{band}_{statistic}" for statistic in statistics for band in bands
+    ]
+    ee_reduced = imagecollection.select(bands).reduce(statistics_reducer(statistics))  # type: ignore
+    return (
+        ee_reduced.select([f"{band}_mean" for band in bands] + statistic_bands)
+        .rename(bands + statistic_bands)
+        .toDouble()  # type: ignore
+    )
+
+
 def ic_monthly_mean(
-    months: list | str, imagecollection: ImageCollection
+    months: list | str,
+    imagecollection: ImageCollection,
+    statistics: list[str] | None = None,
+    bands: list[str] = EXPORT["bands"],
 ) -> ImageCollection:
     """
     Calculates the monthly mean of an ImageCollection.
@@ -119,6 +174,9 @@ def ic_monthly_mean(
     Args:
         months: A list of months in the format YYYY-MM-DD or a string representing a single month in the same format.
         collection: An ImageCollection containing images from one or more months.
+        statistics: Extra statistics calculated with the mean in the same reduction
+            and added as the bands <band>_<statistic>. e.g. ["count", "stdDev"]
+        bands: Names of the bands to reduce. Only used with statistics.
 
     Returns:
         An ImageCollection containing the monthly means.
@@ -175,7 +233,11 @@ def ic_monthly_mean(
         # )
 
         # Calculate the mean of the images in the collection for the target month
-        ee_image = imagecollection.filterDate(ee_target_ym, ee_post_target_ym).mean()  # type: ignore
+        ee_month_collection = imagecollection.filterDate(ee_target_ym, ee_post_target_ym)  # type: ignore
+        if statistics:
+            ee_image = ic_reduce_statistics(ee_month_collection, bands, statistics)
+        else:
+            ee_image = ee_month_collection.mean()  # type: ignore
 
         # Set the metadata for the resulting image
         ee_image = ee_image.set("month", ee_target_month)
@@ -188,3 +250,123 @@ def ic_monthly_mean(
     # Convert the list to an ImageCollection and return it
     ee_image_collection = ImageCollection(ee_image_list)
     return ee_image_collection
+
+
+def ic_sum_count(imagecollection: ImageCollection, bands: list[str]) -> Image:
+    """
+    Calculates the per-pixel sum and number of valid observations of the bands of an
+    ImageCollection. Sums and counts are additive, so the result for several periods
+    can be combined with Image.add and turned into a mean with sum_count_mean.
+
+    Pixels without valid observations have a sum and count of 0.
+
+    Args:
+        imagecollection: An ImageCollection with the bands to reduce.
+        bands: Names of the bands to reduce. e.g. ["SCI", "CCI"]
+
+    Returns:
+        An Image with the integer bands <band>_sum and <band>_count for each band.
+    """
+    ee_selected = imagecollection.select(bands)
+    ee_sums = (
+        ee_selected.sum()
+        .unmask(0)
+        .toInt32()
+        .rename([f"{band}_sum" for band in bands])  # type: ignore
+    )
+    ee_counts = (
+        ee_selected.count()
+        .unmask(0)
+        .toInt32()
+        .rename([f"{band}_count" for band in bands])  # type: ignore
+    )
+    return ee_sums.addBands(ee_counts)  # type: ignore
+
+
+def sum_count_mean(image: Image, bands: list[str]) -> Image:
+    """
+    Calculates the mean of each band from the sum and count bands returned by
+    ic_sum_count. Pixels without valid observations are masked, same as
+    ImageCollection.mean.
+
+    Args:
+        image: An Image with the bands <band>_sum and <band>_count.
+        bands: Names of the bands to calculate. e.g. ["SCI", "CCI"]
+
+    Returns:
+        An Image with the mean of each band, named as the band.
+    """
+    ee_sums = image.select([f"{band}_sum" for band in bands]).toDouble()  # type: ignore
+    ee_counts = image.select([f"{band}_count" for band in bands])  # type: ignore
+    return (
+        ee_sums.divide(ee_counts).updateMask(ee_counts.gt(0)).rename(bands)  # type: ignore
+    )
+
+
+def ic_period_mean(intermediates: ImageCollection | list, bands: list[str]) -> Image:
+    """
+    Calculates the mean of each band for a period of several months from monthly
+    intermediates with the sum and count bands returned by ic_sum_count, without
+    reading the daily images again. e.g. a season, a year or a hydrological year.
+
+    Args:
+        intermediates: An ImageCollection, or a list of Images or asset IDs, with one
+            intermediate per month of the period.
+        bands: Names of the bands to calculate. e.g. ["SCI", "CCI"]
+
+    Returns:
+        An Image with the mean of each band for the whole period, named as the band.
+
+    Example:
+        # Mean SCI and CCI of the 2023 hydrological year (April to March)
+        months = dates.months_between("2023-04-01", "2024-03-01")
+        ee_image = ic_period_mean(
+            [f"{gee_assets_path}/MOD10A1_SCI_CCI_ACC_{month[:7]}" for month in months],
+            ["SCI", "CCI"],
+        )
+    """
+    if isinstance(intermediates, list):
+        intermediates = ImageCollection(intermediates)
+    sum_count_bands = [f"{band}_sum" for band in bands] + [
+        f"{band}_count" for band in bands
+    ]
+    ee_sum_count = intermediates.select(sum_count_bands).sum()
+    return sum_count_mean(ee_sum_count, bands)  # type: ignore
+
+
+def running_mean_add(
+    climatology: Image | None, image: Image, bands: list[str]
+) -> Image:
+    """
+    Adds an image to a running per-pixel mean, updating the mean and the number of
+    images included only where the image has valid values.
+
+    Args:
+        climatology: An Image with the mean of each band, named as the band, and the
+            number of images of each band, named <band>_count. None to start a new
+            running mean.
+        image: An Image with the bands to add.
+        bands: Names of the bands to add. e.g. ["SCI", "CCI"]
+
+    Returns:
+        An Image with the updated mean and <band>_count bands. Pixels without valid
+        values are masked in the mean bands.
+    """
+    count_bands = [f"{band}_count" for band in bands]
+    ee_image = image.select(bands)  # type: ignore
+    ee_valid = ee_image.mask().gt(0)  # type: ignore
+    ee_values = ee_image.unmask(0).toDouble()  # type: ignore
+
+    if climatology is None:
+        ee_counts = ee_valid.toInt32().rename(count_bands)
+        ee_means = ee_values
+    else:
+        ee_counts = climatology.select(count_bands).unmask(0).toInt32().add(ee_valid)  # type: ignore
+        ee_means = climatology.select(bands).unmask(0).toDouble()  # type: ignore
+        ee_means = ee_means.add(
+            ee_values.subtract(ee_means).multiply(ee_valid).divide(ee_counts.max(1))
+        )
+
+    return (
+        ee_means.updateMask(ee_counts.gt(0)).rename(bands).addBands(ee_counts)  # type: ignore
+    )
@@ -0,0 +1,199 @@
+import json
+import logging
+import re
+import time
+from pathlib import Path
+from typing import Iterator
+
+from snow_ipa.services.gee import assets as gee_assets
+
+logger = logging.getLogger(__name__)
+
+# Constants. Used as Defaults in case no alternative is provided.
+DEFAULT_MAX_AGE = 24 * 60 * 60  # seconds
+
+
+class GeeInventory:
+    """
+    A local inventory of the assets in a GEE folder or Image Collection.
+
+    Stores the name, type, trailing month and updateTime of each asset together with
+    the updateTime of the folder. A sync first reads the folder with a single
+    getAsset call and only lists its assets again if the folder's updateTime
+    changed, or if the last listing is older than max_age seconds.
+
+    Assets exported by a run are added with add_asset, so the next run finds them
+    even if the folder's updateTime didn't change. Runs that submitted or replaced
+    assets mark the inventory as stale, so the next run lists the folder again.
+
+    The inventory is saved as a JSON file in store_path.
+    """
+
+    def __init__(
+        self, folder: str, store_path: str, max_age: float = DEFAULT_MAX_AGE
+    ) -> None:
+        self.folder: str = folder
+        self.folder_id: str | None = None
+        self.store_path: Path = Path(store_path)
+        self.max_age: float = max_age
+        self.folder_update_time: str | None = None
+        self.listed_at: float = 0
+        self.assets: dict[str, dict] = {}
+        self.load()
+
+    def load(self) -> None:
+        """
+        Reads the inventory from store_path. The inventory is left empty if the file
+        doesn't exist, can't be read or belongs to another folder.
+        """
+        if not self.store_path.exists():
+            return
+        try:
+            store = json.loads(self.store_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Can't read GEE inventory {self.store_path}: {e}")
+            return
+        if store.get("folder") != self.folder:
+            logger.debug("GEE inventory belongs to another folder, ignoring it")
+            return
+        self.folder_id = store.get("folder_id")
+        self.folder_update_time = store.get("folder_update_time")
+        self.listed_at = store.get("listed_at", 0)
+        self.assets = store.get("assets", {})
+
+    def save(self) -> None:
+        """
+        Writes the inventory to store_path.
+        """
+        store = {
+            "folder": self.folder,
+            "folder_id": self.folder_id,
+            "folder_update_time": self.folder_update_time,
+            "listed_at": self.listed_at,
+            "assets": self.assets,
+        }
+        self.store_path.parent.mkdir(parents=True, exist_ok=True)
+        self.store_path.write_text(json.dumps(store), encoding="utf-8")
+
+    def is_stale(self, folder_update_time: str | None) -> bool:
+        """
+        Returns True if the folder has to be listed again.
+        """
+        return (
+            not self.listed_at
+            or folder_update_time is None
+            or folder_update_time != self.folder_update_time
+            or time.time() - self.listed_at > self.max_age
+        )
+
+    def mark_stale(self) -> None:
+        """
+        Forces the next sync to list the folder again.
+        """
+        self.listed_at = 0
+
+    def full_listing(self, folder_id: str) -> None:
+        """
+        Lists the assets of the folder and replaces the inventory.
+        """
+        logger.debug(f"Listing GEE folder for inventory: {self.folder}")
+        self.assets = {}
+        for asset in gee_assets.iter_child_assets(folder_id):
+            if asset["type"] in gee_assets.GEE_FOLDER_TYPES:
+                continue
+            month = re.search(r"(\d{4}-\d{2})$", asset["name"])
+            self.assets[asset["name"]] = {
+                "type": asset["type"],
+                "month": month.group(1) if month else None,
+                "update_time": asset.get("updateTime"),
+            }
+        self.listed_at = time.time()
+
+    def sync(self) -> bool:
+        """
+        Updates the inventory if the folder changed since the last listing.
+
+        Returns:
+            bool: True if the folder was listed, False if the inventory was reused.
+
+        Raises:
+            ValueError: If the folder doesn't exist.
+        """
+        folder_info = gee_assets.get_asset_info(self.folder)
+        if (
+            folder_info is None
+            or folder_info["type"] not in gee_assets.GEE_FOLDER_TYPES
+        ):
+            raise ValueError(f"GEE folder not found: {self.folder}")
+
+        if not self.is_stale(folder_info["update_time"]):
+            logger.debug(f"GEE folder unchanged, reusing inventory: {self.folder}")
+            return False
+
+        self.folder_id = folder_info["id"]
+        self.full_listing(folder_info["id"])
+        self.folder_update_time = folder_info["update_time"]
+        self.save()
+        return True
+
+    def add_asset(self, name: str, asset_type: str) -> None:
+        """
+        Adds an asset saved in the folder, or updates it if it was replaced.
+
+        Args:
+            name: Name of the asset excluding path.
+            asset_type: "IMAGE" or "TABLE".
+        """
+        month = re.search(r"(\d{4}-\d{2})$", name)
+        self.assets[f"{self.folder_id or self.folder}/{name}"] = {
+            "type": asset_type,
+            "month": month.group(1) if month else None,
+            "update_time": None,
+        }
+
+    def iter_assets(
+        self, asset_type: list | None = None, name_prefix: str | None = None
+    ) -> Iterator[str]:
+        """
+        Yields the full ID of the assets in the inventory.
+
+        Args:
+            asset_type: Asset types to return. All types if empty or None.
+            name_prefix: Only return assets whose name (excluding path) starts with
+                name_prefix.
+        """
+        for asset_id, asset in self.assets.items():
+            if asset_type and asset["type"] not in asset_type:
+                continue
+            if name_prefix and not asset_id.split("/")[-1].startswith(name_prefix):
+                continue
+            yield asset_id
+
+
+def get_asset_list(
+    parent: str,
+    store_path: str,
+    asset_type=None,
+    name_prefix: str | None = None,
+    max_age: float = DEFAULT_MAX_AGE,
+) -> list[str]:
+    """
+    Same as gee.assets.get_asset_list but reads the assets from a GeeInventory kept
+    in store_path, which is synced before reading.
+
+    Args:
+        parent: path to the parent folder of the assets
+        store_path: Path of the JSON file where the inventory is kept.
+        asset_type: indicates asset types to list.
+        name_prefix: Only list assets whose name (excluding path) starts with name_prefix
+        max_age: Seconds after which the folder is listed again even if unchanged.
+
+    Returns:
+        list: Full ID of each asset found.
+    """
+    if isinstance(asset_type, str):
+        asset_type = [asset_type]
+
+    inventory = GeeInventory(parent, store_path, max_age=max_age)
+    inventory.sync()
+    return list(inventory.iter_assets(asset_type=asset_type, name_prefix=name_prefix))
@@ -0,0 +1,197 @@
+import csv
+import logging
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator
+from ee import data as ee_data
+from ee import ee_date
+from ee.featurecollection import FeatureCollection
+from ee.imagecollection import ImageCollection
+
+from snow_ipa.core.configs import EXPORT
+from snow_ipa.services.gee import calculations
+
+logger = logging.getLogger(__name__)
+
+# Constants. Used as Defaults in case no alternative is provided.
+DEFAULT_PAGE_SIZE = 1000
+DEFAULT_MAX_WORKERS = 4
+_MONTH_DONE = object()
+
+
+def fetch_feature_pages(
+    collection: FeatureCollection, page_size: int = DEFAULT_PAGE_SIZE
+) -> Iterator[list[dict]]:
+    """
+    Computes a FeatureCollection with ee.data.computeFeatures and yields the
+    properties of its features one page at a time.
+
+    Args:
+        collection: The FeatureCollection to compute.
+        page_size: Maximum number of features per page.
+
+    Yields:
+        A list with the properties of the features in each page.
+    """
+    page_token = None
+    while True:
+        params = {"expression": collection, "pageSize": page_size}
+        if page_token:
+            params["pageToken"] = page_token
+        response = ee_data.computeFeatures(params)
+        yield [feature["properties"] for feature in response.get("features", [])]
+        page_token = response.get("nextPageToken")
+        if not page_token:
+            break
+
+
+def iter_region_stats(
+    imagecollection: ImageCollection,
+    months: list[str],
+    regions: FeatureCollection,
+    name_property: str,
+    scale: float = EXPORT["scale"],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> Iterator[dict]:
+    """
+    Calculates the mean SCI, mean CCI and number of valid pixels per region for each
+    month and yields the rows as they are received, without creating export tasks.
+
+    Months are fetched concurrently in a thread pool of max_workers. Rows of
+    different months can be interleaved.
+
+    Args:
+        imagecollection: Daily images with the bands "SCI" and "CCI".
+        months: Months to calculate in the format YYYY-MM-DD.
+        regions: Regions to reduce over.
+        name_property: Property of the regions with the region name.
+        scale: Scale in meters used for the reduction.
+        max_workers: Maximum number of months requested at the same time.
+        page_size: Maximum number of rows per request.
+
+    Yields:
+        dict: {"region", "month", "sci_mean", "cci_mean", "valid_pixel_count"}
+
+    Example:
+        ee_sci_cci = ee_modis.map(calculations.snow_cloud_mask).select("SCI", "CCI")
+        for row in iter_region_stats(ee_sci_cci, ["2022-11-01"], ee_regions, "REGION"):
+            print(row)
+    """
+    rows_queue: queue.Queue = queue.Queue()
+
+    def _fetch_month(month: str) -> None:
+        try:
+            ee_month = ee_date.Date(month)
+            ee_image = imagecollection.filterDate(
+                ee_month, ee_month.advance(1, "month")  # type: ignore
+            ).mean()
+            ee_stats = calculations.region_stats(
+                image=ee_image,
+                regions=regions,
+                name_property=name_property,
+                month=month,
+                scale=scale,
+            )
+            for page in fetch_feature_pages(ee_stats, page_size=page_size):
+                rows_queue.put(page)
+            logger.debug(f"Region statistics received for {month[:7]}")
+        except Exception as e:
+            logger.error(f"Couldn't get region statistics for {month[:7]}: {e}")
+            rows_queue.put(e)
+        finally:
+            rows_queue.put(_MONTH_DONE)
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        for month in months:
+            executor.submit(_fetch_month, month)
+
+        pending_months = len(months)
+        while pending_months:
+            item = rows_queue.get()
+            if item is _MONTH_DONE:
+                pending_months -= 1
+            elif isinstance(item, Exception):
+                raise item
+            else:
+                yield from item
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def write_region_stats(
+    rows: Iterable[dict],
+    path: str,
+    file_format: str = "csv",
+    batch_size: int = DEFAULT_PAGE_SIZE,
+) -> int:
+    """
+    Writes region statistics rows to a CSV or Parquet file as they are received.
+
+    Writing Parquet files requires the optional package pyarrow.
+
+    Args:
+        rows: Rows with the keys in EXPORT["stats_columns"].
+        path: Path of the file to write.
+        file_format: "csv" or "parquet".
+        batch_size: Number of rows written to a Parquet file at a time.
+
+    Returns:
+        int: Number of rows written.
+
+    Raises:
+        ValueError: If file_format is not supported.
+        ImportError: If writing Parquet and pyarrow is not installed.
+    """
+    columns = EXPORT["stats_columns"]
+    total_rows = 0
+
+    if file_format == "csv":
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=columns, extrasaction="ignore")
+            writer.writeheader()
+            for row in rows:
+                writer.writerow(row)
+                total_rows += 1
+                if total_rows % batch_size == 0:
+                    f.flush()
+
+    elif file_format == "parquet":
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("pyarrow is required to write Parquet files") from e
+
+        schema = pa.schema(
+            [
+                ("region", pa.string()),
+                ("month", pa.string()),
+                ("sci_mean", pa.float64()),
+                ("cci_mean", pa.float64()),
+                ("valid_pixel_count", pa.int64()),
+            ]
+        )
+        with pq.ParquetWriter(path, schema) as writer:
+            batch: list[dict] = []
+            for row in rows:
+                parquet_row = {column: row.get(column) for column in columns}
+                if parquet_row["region"] is not None:
+                    parquet_row["region"] = str(parquet_row["region"])
+                batch.append(parquet_row)
+                if len(batch) >= batch_size:
+                    writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+                    total_rows += len(batch)
+                    batch = []
+            if batch:
+                writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+                total_rows += len(batch)
+
+    else:
+        raise ValueError(
+            f"Invalid file format: {file_format}. Must be one of ['csv', 'parquet']."
+        )
+
+    logger.debug(f"{total_rows} region statistics rows written to {path}")
+    return total_rows
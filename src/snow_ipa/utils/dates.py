@@ -1,4 +1,4 @@
-from datetime import date, datetime, timedelta
+from datetime import date, datetime, time, timedelta
 import logging
 
 logger = logging.getLogger(__name__)
@@ -55,3 +55,71 @@ def prev_month_last_date() -> date:
         Returns a datetime.date object
     """
     return datetime.today().date().replace(day=1) - timedelta(days=1)
+
+
+def months_between(start: str, end: str) -> list[str]:
+    """
+    Returns the months between two dates, both included.
+
+    Args:
+        start: First month in the format YYYY-MM-DD, any day of the month.
+        end: Last month in the format YYYY-MM-DD, any day of the month.
+
+    Returns:
+        A list of months represented by their first day (YYYY-MM-01) in ascending
+        order. e.g. ["2023-11-01", "2023-12-01", "2024-01-01"]
+    """
+    month = date.fromisoformat(start).replace(day=1)
+    last_month = date.fromisoformat(end).replace(day=1)
+    months = []
+    while month <= last_month:
+        months.append(month.isoformat())
+        month = (month + timedelta(days=32)).replace(day=1)
+    return months
+
+
+def parse_quiet_hours(quiet_hours: str) -> tuple[time, time]:
+    """
+    Parses a range of hours in the format HH:MM-HH:MM or HH-HH.
+
+    Args:
+        quiet_hours: Range of hours. e.g. "22:00-06:30" or "22-6"
+
+    Returns:
+        Returns a tuple with the start and end of the range as datetime.time objects
+
+    Raises:
+        ValueError: If the range is not in a valid format.
+    """
+
+    def _parse_hour(value: str) -> time:
+        value = value.strip()
+        if ":" not in value:
+            value = f"{int(value)}:00"
+        return time.fromisoformat(value.zfill(5))
+
+    try:
+        start, end = quiet_hours.split("-")
+        start_time, end_time = _parse_hour(start), _parse_hour(end)
+    except ValueError as e:
+        raise ValueError(
+            f"Invalid quiet hours: {quiet_hours}. Must be in the format HH:MM-HH:MM"
+        ) from e
+    return start_time, end_time
+
+
+def in_quiet_hours(now: time, start: time, end: time) -> bool:
+    """
+    Checks if a time is inside a range of hours. Ranges can cross midnight.
+
+    Args:
+        now: The time to check
+        start: Start of the range (inclusive)
+        end: End of the range (exclusive)
+
+    Returns:
+        Returns TRUE if now is inside the range
+    """
+    if start <= end:
+        return start <= now < end
+    return now >= start or now < end
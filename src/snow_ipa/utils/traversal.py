@@ -0,0 +1,63 @@
+import logging
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Iterable, Iterator
+
+logger = logging.getLogger(__name__)
+
+# Constants. Used as Defaults in case no alternative is provided.
+DEFAULT_MAX_WORKERS = 8
+
+
+def walk_tree(
+    root: Any,
+    list_children: Callable[[Any], Iterable[Any]],
+    is_folder: Callable[[Any], bool],
+    get_name: Callable[[Any], str],
+    get_id: Callable[[Any], Any],
+    max_depth: int | None = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> Iterator[tuple[Any, tuple[str, ...]]]:
+    """
+    Walks a folder tree breadth-first listing folders concurrently and yields the
+    items that are not folders as soon as their folder is listed.
+
+    Sub-folders are listed as soon as they are found, so the time to walk the tree
+    is close to the time needed to list its deepest path.
+
+    Args:
+        root: ID of the folder to start from.
+        list_children: Function that receives a folder ID and returns its children.
+            It runs in worker threads.
+        is_folder: Function that returns True if a child is a folder to walk into.
+        get_name: Function that returns the name of a child.
+        get_id: Function that returns the ID of a child folder to pass to list_children.
+        max_depth: Maximum number of sub-folder levels to walk into. 0 only lists
+            root. None walks the whole tree.
+        max_workers: Maximum number of folders listed at the same time.
+
+    Yields:
+        tuple: (child, path) where path has the names of the sub-folders between
+        root and the child.
+    """
+
+    def _list(folder_id: Any) -> list:
+        return list(list_children(folder_id))
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        pending: dict[Future, tuple[int, tuple[str, ...]]] = {
+            executor.submit(_list, root): (0, ())
+        }
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                depth, path = pending.pop(future)
+                for child in future.result():
+                    if not is_folder(child):
+                        yield child, path
+                    elif max_depth is None or depth < max_depth:
+                        child_path = path + (get_name(child),)
+                        child_future = executor.submit(_list, get_id(child))
+                        pending[child_future] = (depth + 1, child_path)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,100 @@
+"""
+Watches the MODIS collection and runs the export script when a new month becomes complete.
+
+Polls the date of the latest MODIS image with a cheap metadata request every
+watch_interval minutes, except during watch_quiet_hours, and runs snow_ipa.main in the
+same process when the latest image completes a month that hasn't been processed yet.
+The script also runs once when the watcher starts.
+"""
+
+# libraries
+import sys
+import time
+from datetime import datetime
+
+from snow_ipa import main
+from snow_ipa.core import state
+from snow_ipa.core.configs import MODIS
+from snow_ipa.core.exporting import ExportManager
+from snow_ipa.core.scripting import init_script_config
+from snow_ipa.utils import logs, dates
+from snow_ipa.services import connections
+from snow_ipa.services.gee import catalog as gee_catalog
+
+
+def poll_last_image(last_image: str | None) -> str | None:
+    """
+    Returns the date of the last MODIS image. Only images added since last_image are
+    requested if it's known.
+    """
+    return gee_catalog.poll_latest_image_date(MODIS["path"], last_known=last_image)
+
+
+def run_succeeded(export_manager: ExportManager | None) -> bool:
+    """
+    Returns True if a run of main saved or skipped every export. Runs with failed or
+    cancelled exports are retried.
+    """
+    if export_manager is None:
+        return False
+    statuses = [task.status for task in export_manager.export_tasks.export_tasks]
+    return state.run_outcome(statuses) == "COMPLETED"
+
+
+def watch():
+    script_manager = init_script_config()
+    logger = logs.init_logging_config(config=script_manager.config)
+    logger.info("------ STARTING WATCHER ------")
+    script_manager.run_complete_config()
+
+    interval = float(script_manager.config["watch_interval"]) * 60
+    quiet_hours = (
+        dates.parse_quiet_hours(script_manager.config["watch_quiet_hours"])
+        if script_manager.config["watch_quiet_hours"]
+        else None
+    )
+
+    runtime_service_account = connections.GoogleServiceAccount(
+        script_manager.config["service_credentials_file"]
+    )
+    connections.connect_to_gee(runtime_service_account)
+
+    last_image: str | None = None
+    processed_month: str | None = None
+    while True:
+        if quiet_hours and dates.in_quiet_hours(datetime.now().time(), *quiet_hours):
+            logger.debug("Quiet hours, skipping MODIS check")
+            time.sleep(interval)
+            continue
+
+        try:
+            last_image = poll_last_image(last_image)
+            if last_image:
+                complete_month = state.latest_possible_complete_month(last_image)
+                if processed_month is None or complete_month > processed_month:
+                    logger.info(
+                        f"MODIS complete up to {complete_month} (last image: {last_image}). Running exports"
+                    )
+                    export_manager = main.main()
+                    # main resets logging, restore the watcher's configuration
+                    logger = logs.init_logging_config(config=script_manager.config)
+                    if run_succeeded(export_manager):
+                        processed_month = complete_month
+                    else:
+                        logger.warning(
+                            f"Exports failed, {complete_month} is retried in the next poll"
+                        )
+        except Exception as e:
+            # Keep watching, the month is retried in the next poll
+            logger.exception(e)
+
+        time.sleep(interval)
+
+
+if __name__ == "__main__":
+
+    try:
+        watch()
+    except Exception as e:
+        print(f"An error occurred: {e}")
+        sys.exit(1)
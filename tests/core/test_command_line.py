@@ -295,3 +295,9 @@ class TestParseListArg:
     def test_parse_list_arg_with_numbers(self):
         result = parse_list_arg("123, 456, 789")
         assert result == ["123", "456", "789"]
+
+
+def test_monthly_statistics_from_env(monkeypatch):
+    monkeypatch.setenv("SNOW_MONTHLY_STATISTICS", "count, stdDev")
+    args = set_argument_parser().parse_args([])
+    assert args.monthly_statistics == ["count", "stdDev"]
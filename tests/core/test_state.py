@@ -0,0 +1,89 @@
+import pytest
+from snow_ipa.core import state
+
+CONFIG = {"export_to_gee": True, "gee_assets_path": "projects/p/assets/f"}
+
+
+@pytest.mark.parametrize(
+    "last_image, expected",
+    [
+        ("2024-10-31", "2024-10"),
+        ("2024-10-30", "2024-09"),
+        ("2024-02-29", "2024-02"),
+        ("2024-12-31", "2024-12"),
+    ],
+)
+def test_latest_possible_complete_month(last_image, expected):
+    assert state.latest_possible_complete_month(last_image) == expected
+
+
+class TestCanSkipRun:
+    @pytest.fixture
+    def saved_state(self):
+        modis_status = {"last_image": "2024-10-15", "last_complete_month": "2024-09"}
+        return state.build_state(CONFIG, modis_status, "UP_TO_DATE")
+
+    def test_skip_without_new_month(self, saved_state):
+        assert state.can_skip_run(saved_state, CONFIG, "2024-10-30") is True
+
+    def test_run_with_new_month(self, saved_state):
+        assert state.can_skip_run(saved_state, CONFIG, "2024-10-31") is False
+
+    def test_run_after_failures(self, saved_state):
+        saved_state["outcome"] = "FAILED"
+        assert state.can_skip_run(saved_state, CONFIG, "2024-10-30") is False
+
+    def test_run_with_new_config(self, saved_state):
+        config = {**CONFIG, "export_to_gdrive": True}
+        assert state.can_skip_run(saved_state, config, "2024-10-30") is False
+
+    @pytest.mark.parametrize(
+        "key, value",
+        [
+            ("fingerprints_path", "state/fingerprints.json"),
+            ("export_intermediates", True),
+            ("export_climatology", True),
+            ("monthly_statistics", ["count"]),
+        ],
+    )
+    def test_run_with_new_export_option(self, saved_state, key, value):
+        config = {**CONFIG, key: value}
+        assert state.can_skip_run(saved_state, config, "2024-10-30") is False
+
+    def test_run_with_months_list(self, saved_state):
+        config = {**CONFIG, "months_list": ["2024-09-01"]}
+        assert state.can_skip_run(saved_state, config, "2024-10-30") is False
+
+    def test_run_with_refresh_months(self, saved_state):
+        config = {**CONFIG, "refresh_months": 3}
+        assert state.can_skip_run(saved_state, config, "2024-10-30") is False
+
+    def test_run_with_fingerprints(self):
+        config = {**CONFIG, "fingerprints_path": "state/fingerprints.json"}
+        modis_status = {"last_image": "2024-10-15", "last_complete_month": "2024-09"}
+        saved_state = state.build_state(config, modis_status, "UP_TO_DATE")
+        assert state.can_skip_run(saved_state, config, "2024-10-30") is False
+
+    def test_run_without_state(self):
+        assert state.can_skip_run({}, CONFIG, "2024-10-30") is False
+
+
+@pytest.mark.parametrize(
+    "statuses, expected",
+    [
+        ([], "COMPLETED"),
+        (["COMPLETED", "ALREADY_EXISTS", "FINISHED"], "COMPLETED"),
+        (["COMPLETED", "CANCELLED"], "FAILED"),
+        (["COMPLETED", "FAILED_TO_START"], "FAILED"),
+        (["RUNNING"], "FAILED"),
+    ],
+)
+def test_run_outcome(statuses, expected):
+    assert state.run_outcome(statuses) == expected
+
+
+def test_read_write_state(tmp_path):
+    state_path = str(tmp_path / "state" / "snow.json")
+    assert state.read_state(state_path) == {}
+    state.write_state(state_path, {"outcome": "COMPLETED"})
+    assert state.read_state(state_path) == {"outcome": "COMPLETED"}
@@ -0,0 +1,552 @@
+import math
+import re
+import pytest
+from snow_ipa.core.exporting import ExportManager
+from snow_ipa.services.gee.exports import ExportTask
+from snow_ipa.core.workflows import (
+    calculate_export_size,
+    create_climatology_tasks,
+    exported_months,
+    record_gee_exports,
+    export_asset_id,
+    get_gee_saved_assets,
+    saved_accumulators_pattern,
+    saved_assets_pattern,
+    filter_saved_tables,
+    next_month,
+    plan_intermediates,
+    plan_provisional,
+    split_bounds,
+    target_export_plan,
+    target_table_plan,
+)
+
+
+class TestSavedAssetsPattern:
+    @pytest.mark.parametrize(
+        "image, expected",
+        [
+            ("MOD10A1_SCI_CCI_2022-11", True),
+            ("MOD10A1_SCI_CCI_Region-de-Valparaiso_2022-11", True),
+            ("MOD10A1_SCI_CCI_2022-11.tif", False),
+            ("OTHER_2022-11", False),
+            ("MOD10A1_SCI_CCI_ACC_2022-11", False),
+            ("MOD10A1_SCI_CCI_ANOM_2022-11", False),
+            ("MOD10A1_SCI_CCI_CLIM_2022-11", False),
+            ("MOD10A1_SCI_CCI_STATS_2022-11", False),
+            ("MOD10A1_SCI_CCI_ACC-Norte_2022-11", True),
+        ],
+    )
+    def test_saved_assets_pattern(self, image, expected):
+        pattern = saved_assets_pattern("MOD10A1_SCI_CCI")
+        assert bool(re.fullmatch(pattern, image)) is expected
+
+    @pytest.mark.parametrize(
+        "image, expected",
+        [
+            ("MOD10A1_SCI_CCI_ACC_2022-11", True),
+            ("MOD10A1_SCI_CCI_2022-11", False),
+            ("MOD10A1_SCI_CCI_ACC-Norte_2022-11", False),
+            ("MOD10A1_SCI_CCI_ANOM_2022-11", False),
+        ],
+    )
+    def test_saved_accumulators_pattern(self, image, expected):
+        pattern = saved_accumulators_pattern("MOD10A1_SCI_CCI")
+        assert bool(re.fullmatch(pattern, image)) is expected
+
+
+def list_saved_assets(mocker, export_manager, names):
+    """Fills the saved GEE assets of export_manager from a mocked folder listing"""
+    mocker.patch(
+        "snow_ipa.core.workflows.gee_assets.get_asset_list",
+        return_value=[f"assets/{name}" for name in names],
+    )
+    get_gee_saved_assets(export_manager, "assets")
+
+
+def test_get_gee_saved_assets(mocker):
+    export_manager = ExportManager(
+        export_to_gee=True, gee_asset_path="assets", image_prefix="SCI"
+    )
+    list_saved_assets(
+        mocker, export_manager, ["SCI_2024-09", "SCI_ACC_2024-09", "SCI_CLIM_09"]
+    )
+    assert export_manager.gee_saved_assets == ["SCI_2024-09"]
+    assert export_manager.gee_saved_assets_months == ["2024-09-01"]
+    assert export_manager.gee_saved_accumulators == ["SCI_ACC_2024-09"]
+
+
+class TestTargetExportPlan:
+    @pytest.fixture
+    def export_manager(self):
+        return ExportManager(
+            export_to_gee=True,
+            gee_asset_path="assets",
+            months_to_save=["2022-11-01", "2022-10-01"],
+            image_prefix="SCI",
+        )
+
+    def test_target_export_plan(self, export_manager):
+        target_export_plan(
+            export_manager=export_manager,
+            target="gee",
+            export_plan=["2022-11-01", "2022-10-01"],
+            existing_imgs=["SCI_2022-10"],
+            image_prefix="SCI",
+        )
+        assert export_manager.gee_assets_to_save == ["2022-11-01"]
+        assert export_manager.gee_regions_to_save == {"2022-11-01": [None]}
+        assert [t.status for t in export_manager.export_tasks.export_tasks] == [
+            "ALREADY_EXISTS"
+        ]
+
+    def test_target_export_plan_reprocessed(self, export_manager):
+        export_manager.modis_fingerprints = {"2022-10-01": "new", "2022-09-01": "b"}
+        export_manager.saved_fingerprints = {"gee": {"SCI_2022-10": "old"}}
+        target_export_plan(
+            export_manager=export_manager,
+            target="gee",
+            export_plan=["2022-10-01", "2022-09-01"],
+            existing_imgs=["SCI_2022-10", "SCI_2022-09"],
+            image_prefix="SCI",
+        )
+        assert export_manager.gee_assets_to_save == ["2022-10-01"]
+        assert export_manager.assets_to_overwrite["gee"] == {"SCI_2022-10"}
+        # Assets without a saved fingerprint take the current one
+        assert export_manager.saved_fingerprints["gee"]["SCI_2022-09"] == "b"
+
+    def test_target_export_plan_new_images(self, export_manager):
+        export_manager.modis_image_counts = {"2022-10-01": 31, "2022-09-01": 30}
+        export_manager.saved_image_counts = {
+            "gee": {"SCI_2022-10": 29, "SCI_2022-09": 30}
+        }
+        target_export_plan(
+            export_manager=export_manager,
+            target="gee",
+            export_plan=["2022-10-01", "2022-09-01"],
+            existing_imgs=["SCI_2022-10", "SCI_2022-09"],
+            image_prefix="SCI",
+        )
+        assert export_manager.gee_assets_to_save == ["2022-10-01"]
+        assert (
+            export_asset_id(export_manager, "SCI_2022-10") == "assets/SCI_2022-10_TMP"
+        )
+        assert export_asset_id(export_manager, "SCI_2022-09") == "assets/SCI_2022-09"
+
+    def test_target_export_plan_by_region(self, export_manager):
+        export_manager.export_by_region = True
+        export_manager.regions = {"Arica": "Arica", "Maule": "Maule"}
+        target_export_plan(
+            export_manager=export_manager,
+            target="gdrive",
+            export_plan=["2022-11-01", "2022-10-01"],
+            existing_imgs=[
+                "SCI_Arica_2022-11",
+                "SCI_Arica_2022-10",
+                "SCI_Maule_2022-10",
+            ],
+            image_prefix="SCI",
+        )
+        assert export_manager.gdrive_assets_to_save == ["2022-11-01"]
+        assert export_manager.gdrive_regions_to_save == {"2022-11-01": ["Maule"]}
+        assert len(export_manager.export_tasks.export_tasks) == 3
+
+    def test_target_export_plan_with_parts_and_rejected(self, export_manager):
+        export_manager.export_by_region = True
+        export_manager.regions = {"Arica": "Arica", "Maule": "Maule"}
+        export_manager.export_estimates = {
+            "Arica": {"pixels": 10, "bytes": 160, "rejected": True},
+            "Maule": {
+                "pixels": 10,
+                "bytes": 160,
+                "parts": ["Maule-part1", "Maule-part2"],
+            },
+        }
+        export_manager.export_parts = {
+            "Maule-part1": {"region": "Maule", "bounds": [0, 0, 1, 1]},
+            "Maule-part2": {"region": "Maule", "bounds": [0, 1, 1, 2]},
+        }
+        target_export_plan(
+            export_manager=export_manager,
+            target="gee",
+            export_plan=["2022-11-01"],
+            existing_imgs=["SCI_Maule-part1_2022-11"],
+            image_prefix="SCI",
+        )
+        assert export_manager.gee_regions_to_save == {"2022-11-01": ["Maule-part2"]}
+        statuses = {t.image: t.status for t in export_manager.export_tasks.export_tasks}
+        assert statuses == {
+            "SCI_Arica_2022-11": "TOO_LARGE",
+            "SCI_Maule-part1_2022-11": "ALREADY_EXISTS",
+        }
+        assert export_manager.base_region("Maule-part2") == "Maule"
+
+
+class TestExportSize:
+    def test_calculate_export_size(self):
+        estimate = calculate_export_size(
+            [0, 0, 1, 1], scale=111320 / 2, n_bands=2, bytes_per_band=8
+        )
+        assert estimate == {"pixels": 4, "bytes": 64}
+
+    def test_calculate_export_size_latitude(self):
+        # Pixels of the EPSG:4326 grid are counted from the degrees of the bounds,
+        # the same at any latitude
+        equator = calculate_export_size([-71, 0, -70, 1])
+        south = calculate_export_size([-71, -40, -70, -39])
+        assert south["pixels"] == equator["pixels"]
+        assert south["pixels"] > 111320**2 * math.cos(math.radians(39.5)) / 500**2
+
+    def test_split_bounds_tall(self):
+        assert split_bounds([0, 0, 1, 4], 2) == [[0, 0, 1, 2.0], [0, 2.0, 1, 4.0]]
+
+    def test_split_bounds_wide(self):
+        assert split_bounds([0, 0, 4, 1], 2) == [[0, 0, 2.0, 1], [2.0, 0, 4.0, 1]]
+
+
+class TestTablePlan:
+    @pytest.fixture
+    def export_manager(self):
+        return ExportManager(
+            export_to_gdrive=True,
+            months_to_save=["2022-11-01", "2022-10-01"],
+            image_prefix="SCI",
+            export_region_stats=True,
+        )
+
+    def test_filter_saved_tables(self, export_manager):
+        tables = ["SCI_STATS_2022-10", "SCI_2022-10", "SCI_STATS_2022-10_old"]
+        assert filter_saved_tables(export_manager, tables) == ["SCI_STATS_2022-10"]
+
+    def test_target_table_plan(self, export_manager):
+        target_table_plan(
+            export_manager=export_manager,
+            target="gdrive",
+            export_plan=["2022-11-01", "2022-10-01"],
+            existing_tables=["SCI_STATS_2022-10"],
+        )
+        assert export_manager.gdrive_tables_to_save == ["2022-11-01"]
+        tasks = export_manager.export_tasks.export_tasks
+        assert [(t.image, t.status) for t in tasks] == [
+            ("SCI_STATS_2022-10", "ALREADY_EXISTS")
+        ]
+
+
+class TestLocalPlan:
+    def test_target_export_plan_local(self):
+        export_manager = ExportManager(
+            image_prefix="SCI",
+            export_by_region=True,
+            local_assets_path="/tmp/snow",
+            direct_download_max_bytes=100,
+        )
+        export_manager.regions = {"Arica": "Arica", "Maule": "Maule"}
+        export_manager.export_estimates = {
+            "Arica": {"pixels": 5, "bytes": 80, "bounds": [0, 0, 1, 1]},
+            "Maule": {"pixels": 10, "bytes": 160, "bounds": [0, 0, 2, 2]},
+        }
+        target_export_plan(
+            export_manager=export_manager,
+            target="local",
+            export_plan=["2022-11-01"],
+            existing_imgs=[],
+            image_prefix="SCI",
+        )
+        assert export_manager.local_regions_to_save == {"2022-11-01": ["Arica"]}
+        tasks = export_manager.export_tasks.export_tasks
+        assert [(t.image, t.status) for t in tasks] == [
+            ("SCI_Maule_2022-11", "TOO_LARGE")
+        ]
+
+
+class TestFingerprints:
+    def test_record_exported_months(self):
+        export_manager = ExportManager(export_to_gee=True, image_prefix="SCI")
+        export_manager.modis_fingerprints = {"2022-10-01": "a", "2022-11-01": "b"}
+        export_manager.modis_image_counts = {"2022-10-01": 31, "2022-11-01": 30}
+        export_manager.export_tasks.add_task(
+            ExportTask(
+                image="SCI_2022-10", date="2022-10-01", target="gee", status="COMPLETED"
+            )
+        )
+        export_manager.export_tasks.add_task(
+            ExportTask(
+                image="SCI_2022-11", date="2022-11-01", target="gee", status="FAILED"
+            )
+        )
+        export_manager.record_exported_months()
+        assert export_manager.saved_months == {
+            "fingerprints": {"gee": {"SCI_2022-10": "a"}},
+            "image_counts": {"gee": {"SCI_2022-10": 31}},
+        }
+
+    def test_reprocessed_months(self):
+        export_manager = ExportManager(export_to_gee=True, image_prefix="SCI")
+        export_manager.saved_months = {
+            "fingerprints": {
+                "gee": {"SCI_2020-01": "a", "SCI_2020-02": "b"},
+                "gdrive": {"SCI_STATS_2020-03": "c"},
+            },
+            "image_counts": {"gee": {"SCI_2020-04": 29}},
+        }
+        assert export_manager.recorded_months == [
+            "2020-04-01",
+            "2020-03-01",
+            "2020-02-01",
+            "2020-01-01",
+        ]
+        export_manager.modis_fingerprints = {
+            "2020-01-01": "a",
+            "2020-02-01": "new",
+            "2020-03-01": "c",
+        }
+        export_manager.modis_image_counts = {"2020-04-01": 30}
+        assert export_manager.reprocessed_months() == ["2020-04-01", "2020-02-01"]
+
+
+class TestProvisional:
+    @pytest.fixture
+    def export_manager(self):
+        export_manager = ExportManager(
+            export_to_gee=True,
+            gee_asset_path="assets",
+            months_to_save=["2024-09-01"],
+            image_prefix="SCI",
+            provisional=True,
+        )
+        export_manager.export_plan["final_plan"] = ["2024-09-01"]
+        export_manager.modis_distinct_months = ["2024-09-01", "2024-08-01"]
+        export_manager.modis_status = {"last_image": "2024-10-15"}
+        return export_manager
+
+    def test_next_month(self):
+        assert next_month("2024-01-31") == "2024-02-01"
+        assert next_month("2024-12-01") == "2025-01-01"
+
+    def test_plan_provisional_new_month(self, export_manager, mocker):
+        get_properties = mocker.patch(
+            "snow_ipa.core.workflows.gee_assets.get_asset_properties",
+            return_value=None,
+        )
+        plan_provisional(export_manager)
+        assert export_manager.provisional_month == "2024-10-01"
+        assert export_manager.accumulators == {}
+        assert export_manager.assets_to_overwrite["gee"] == set()
+        get_properties.assert_called_once_with("assets/SCI_ACC_2024-10")
+
+    def test_plan_provisional_update(self, export_manager, mocker):
+        list_saved_assets(
+            mocker, export_manager, ["SCI_ACC_2024-09", "SCI_ACC_2024-10"]
+        )
+        properties = {
+            "assets/SCI_ACC_2024-09": {"last_day": "2024-09-30"},
+            "assets/SCI_ACC_2024-10": {"last_day": "2024-10-14"},
+        }
+        mocker.patch(
+            "snow_ipa.core.workflows.gee_assets.get_asset_properties",
+            side_effect=properties.get,
+        )
+        plan_provisional(export_manager)
+        assert export_manager.provisional_month == "2024-10-01"
+        assert export_manager.accumulators == {
+            "2024-09-01": {"id": "assets/SCI_ACC_2024-09", "last_day": "2024-09-30"},
+            "2024-10-01": {"id": "assets/SCI_ACC_2024-10", "last_day": "2024-10-14"},
+        }
+        assert export_manager.assets_to_overwrite["gee"] == {"SCI_ACC_2024-10"}
+
+    def test_plan_provisional_up_to_date(self, export_manager, mocker):
+        mocker.patch(
+            "snow_ipa.core.workflows.gee_assets.get_asset_properties",
+            return_value={"last_day": "2024-10-15"},
+        )
+        plan_provisional(export_manager)
+        assert export_manager.provisional_month is None
+
+
+class TestIntermediates:
+    def test_plan_intermediates(self, mocker):
+        export_manager = ExportManager(
+            export_to_gee=True,
+            gee_asset_path="assets",
+            image_prefix="SCI",
+            export_intermediates=True,
+        )
+        export_manager.export_plan["final_plan"] = [
+            "2024-09-01",
+            "2024-08-01",
+            "2024-07-01",
+        ]
+        list_saved_assets(
+            mocker, export_manager, ["SCI_ACC_2024-09", "SCI_ACC_2024-08"]
+        )
+        properties = {
+            # Provisional accumulator missing the last day of the month
+            "assets/SCI_ACC_2024-09": {"last_day": "2024-09-29"},
+            "assets/SCI_ACC_2024-08": {"last_day": "2024-08-31"},
+        }
+        mocker.patch(
+            "snow_ipa.core.workflows.gee_assets.get_asset_properties",
+            side_effect=properties.get,
+        )
+        plan_intermediates(export_manager)
+        assert export_manager.intermediates_to_save == ["2024-09-01", "2024-07-01"]
+        assert export_manager.assets_to_overwrite["gee"] == {"SCI_ACC_2024-09"}
+        assert export_manager.accumulators["2024-09-01"]["last_day"] == "2024-09-29"
+
+    def test_plan_intermediates_saved(self, mocker):
+        export_manager = ExportManager(
+            export_to_gee=True,
+            gee_asset_path="assets",
+            image_prefix="SCI",
+            export_intermediates=True,
+        )
+        export_manager.export_plan["final_plan"] = ["2024-08-01"]
+        list_saved_assets(mocker, export_manager, ["SCI_2024-08", "SCI_ACC_2024-08"])
+        mocker.patch(
+            "snow_ipa.core.workflows.gee_assets.get_asset_properties",
+            return_value={"last_day": "2024-08-31"},
+        )
+        plan_intermediates(export_manager)
+        assert export_manager.intermediates_to_save == []
+        assert export_manager.assets_to_overwrite["gee"] == set()
+
+
+class TestClimatology:
+    @pytest.fixture
+    def export_manager(self):
+        export_manager = ExportManager(
+            export_to_gee=True,
+            gee_asset_path="assets",
+            image_prefix="SCI",
+            export_climatology=True,
+        )
+        for month, status in [
+            ("2024-01-01", "COMPLETED"),
+            ("2023-01-01", "ALREADY_EXISTS"),
+            ("2024-02-01", "FAILED"),
+        ]:
+            export_manager.export_tasks.add_task(
+                ExportTask(
+                    image=export_manager.image_name(month),
+                    date=month,
+                    target="gee",
+                    status=status,
+                )
+            )
+        return export_manager
+
+    def test_names(self, export_manager):
+        assert export_manager.climatology_name("2024-01-01") == "SCI_CLIM_01"
+        assert export_manager.climatology_name("01") == "SCI_CLIM_01"
+        assert export_manager.anomaly_name("2024-01-01") == "SCI_ANOM_2024-01"
+
+    def test_create_climatology_tasks(self, export_manager, mocker):
+        mocker.patch(
+            "snow_ipa.core.workflows.gee_assets.get_asset_properties",
+            return_value={"months": "2023-01", "month_count": 1},
+        )
+        running_mean_add = mocker.patch(
+            "snow_ipa.core.workflows.gee_imagecollection.running_mean_add"
+        )
+        mocker.patch("snow_ipa.core.workflows.Image")
+        mocker.patch("snow_ipa.core.workflows.get_export_geometry")
+        export = mocker.patch("snow_ipa.core.workflows.batch.Export.image.toAsset")
+
+        create_climatology_tasks(export_manager, mocker.MagicMock(), mocker.MagicMock())
+
+        # 2023-01 is already in the climatology, only 2024-01 is added
+        running_mean_add.assert_called_once()
+        running_mean_add.return_value.set.assert_called_once_with(
+            {"months": "2023-01,2024-01", "month_count": 2}
+        )
+        asset_ids = [call.kwargs["assetId"] for call in export.call_args_list]
+        assert asset_ids == ["assets/SCI_CLIM_01_TMP", "assets/SCI_ANOM_2024-01"]
+        assert export_manager.assets_to_overwrite["gee"] == {"SCI_CLIM_01"}
+
+    def test_exported_months(self, export_manager):
+        # Months already saved are read from their asset, not the monthly collection
+        assert exported_months(export_manager) == {
+            "2023-01-01": "assets/SCI_2023-01",
+            "2024-01-01": None,
+        }
+
+    def test_create_climatology_tasks_saved_month(self, export_manager, mocker):
+        mocker.patch(
+            "snow_ipa.core.workflows.gee_assets.get_asset_properties",
+            return_value=None,
+        )
+        running_mean_add = mocker.patch(
+            "snow_ipa.core.workflows.gee_imagecollection.running_mean_add"
+        )
+        image = mocker.patch("snow_ipa.core.workflows.Image")
+        mocker.patch("snow_ipa.core.workflows.get_export_geometry")
+        mocker.patch("snow_ipa.core.workflows.batch.Export.image.toAsset")
+        ee_monthly = mocker.MagicMock()
+
+        create_climatology_tasks(export_manager, ee_monthly, mocker.MagicMock())
+
+        image.assert_any_call("assets/SCI_2023-01")
+        ee_monthly.filterDate.assert_any_call("2024-01-01")
+        assert "2023-01-01" not in [
+            call.args[0] for call in ee_monthly.filterDate.call_args_list
+        ]
+        assert running_mean_add.call_count == 2
+
+
+class TestMonthlyStatistics:
+    def test_image_bands(self):
+        export_manager = ExportManager(monthly_statistics=["count", "stdDev"])
+        assert export_manager.image_bands == [
+            "SCI",
+            "CCI",
+            "SCI_count",
+            "CCI_count",
+            "SCI_stdDev",
+            "CCI_stdDev",
+        ]
+
+    def test_image_bands_mean_only(self):
+        assert ExportManager().image_bands == ["SCI", "CCI"]
+
+    def test_export_size_with_statistics(self):
+        export_manager = ExportManager(monthly_statistics=["count"])
+        estimate = calculate_export_size(
+            [0, 0, 10, 1], scale=111320, n_bands=len(export_manager.image_bands)
+        )
+        assert estimate == {"pixels": 10, "bytes": 10 * 4 * 8}
+
+
+def test_record_gee_exports(mocker):
+    export_manager = ExportManager(export_to_gee=True, image_prefix="SCI")
+    for image, status in [
+        ("SCI_2022-10", "COMPLETED"),
+        ("SCI_STATS_2022-10", "COMPLETED"),
+        ("SCI_2022-11", "FAILED"),
+    ]:
+        export_manager.export_tasks.add_task(
+            ExportTask(image=image, date="2022-10-01", target="gee", status=status)
+        )
+    inventory = mocker.MagicMock()
+    record_gee_exports(export_manager, inventory)
+    assert inventory.add_asset.call_args_list == [
+        mocker.call("SCI_2022-10", "IMAGE"),
+        mocker.call("SCI_STATS_2022-10", "TABLE"),
+    ]
+    inventory.mark_stale.assert_called_once()
+    inventory.save.assert_called_once()
+
+
+def test_record_gee_exports_nothing_submitted(mocker):
+    export_manager = ExportManager(export_to_gee=True, image_prefix="SCI")
+    export_manager.export_tasks.add_task(
+        ExportTask(
+            image="SCI_2022-10",
+            date="2022-10-01",
+            target="gee",
+            status="ALREADY_EXISTS",
+        )
+    )
+    inventory = mocker.MagicMock()
+    record_gee_exports(export_manager, inventory)
+    inventory.add_asset.assert_not_called()
+    inventory.mark_stale.assert_not_called()
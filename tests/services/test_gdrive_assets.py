@@ -0,0 +1,284 @@
+import threading
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+from snow_ipa.services.gdrive import assets as gdrive_assets
+from snow_ipa.services.gdrive.batch import execute_batch
+from snow_ipa.services.gdrive.cache import FolderIdCache
+
+FOLDERS = {
+    ("root", "snow"): "id_snow",
+    ("drive", "snow"): "id_drive_snow",
+    ("id_snow", "raster_sci_cci"): "id_raster",
+}
+
+
+@pytest.fixture
+def drive_service(mocker):
+    """Drive service that finds the folders in FOLDERS by name and parent."""
+    service = mocker.MagicMock()
+
+    def list_files(q, **kwargs):
+        name = q.split("name = '")[1].split("'")[0]
+        parent = q.split(" in parents")[0].split("'")[-2] if "in parents" in q else None
+        folder_id = FOLDERS.get((parent, name))
+        request = mocker.MagicMock()
+        request.execute.return_value = {
+            "files": [{"id": folder_id, "name": name}] if folder_id else []
+        }
+        return request
+
+    service.files.return_value.list.side_effect = list_files
+    return service
+
+
+@pytest.fixture
+def folder_id_cache(tmp_path):
+    cache_path = tmp_path / "folder_ids.json"
+    yield gdrive_assets.set_folder_id_cache(cache_path=str(cache_path))
+    gdrive_assets.set_folder_id_cache()
+
+
+class TestGetFolderId:
+    def test_get_folder_id_cached(self, drive_service, folder_id_cache):
+        path = "snow/raster_sci_cci"
+        assert gdrive_assets.get_folder_id(drive_service, path) == "id_raster"
+        assert drive_service.files.return_value.list.call_count == 2
+
+        # A new run reads the cache file and doesn't call the API
+        gdrive_assets.set_folder_id_cache(cache_path=str(folder_id_cache.cache_path))
+        assert gdrive_assets.get_folder_id(drive_service, path) == "id_raster"
+        assert drive_service.files.return_value.list.call_count == 2
+
+    def test_get_folder_id_partially_cached(self, drive_service, folder_id_cache):
+        folder_id_cache.set("snow", "id_snow")
+        assert gdrive_assets.get_folder_id(drive_service, "snow/raster_sci_cci")
+        assert drive_service.files.return_value.list.call_count == 1
+
+    def test_get_folder_id_stale_cache(self, drive_service, folder_id_cache):
+        folder_id_cache.set("snow", "id_deleted")
+        assert gdrive_assets.get_folder_id(drive_service, "snow/raster_sci_cci")
+        assert folder_id_cache.get("snow") == "id_snow"
+
+    def test_get_folder_id_not_found(self, drive_service, folder_id_cache):
+        assert gdrive_assets.get_folder_id(drive_service, "snow/missing") is None
+        assert folder_id_cache.get("snow/missing") is None
+
+    def test_get_folder_id_root_scoped(self, drive_service, folder_id_cache):
+        gdrive_assets.get_folder_id(drive_service, "snow")
+        query = drive_service.files.return_value.list.call_args.kwargs["q"]
+        assert "'root' in parents" in query
+
+    def test_get_folder_id_shared_drive(self, drive_service, folder_id_cache):
+        gdrive_assets.set_shared_drive_id("drive")
+        try:
+            assert gdrive_assets.get_folder_id(drive_service, "snow") == "id_drive_snow"
+        finally:
+            gdrive_assets.set_shared_drive_id(None)
+        list_kwargs = drive_service.files.return_value.list.call_args.kwargs
+        assert list_kwargs["driveId"] == "drive"
+        assert list_kwargs["supportsAllDrives"] is True
+        assert folder_id_cache.get("snow", "drive") == "id_drive_snow"
+        assert folder_id_cache.get("snow") is None
+
+    def test_get_folder_id_shared_with_me(self, drive_service, folder_id_cache):
+        FOLDERS[(None, "shared")] = "id_shared"
+        try:
+            assert gdrive_assets.get_folder_id(drive_service, "shared") == "id_shared"
+        finally:
+            del FOLDERS[(None, "shared")]
+        query = drive_service.files.return_value.list.call_args.kwargs["q"]
+        assert "sharedWithMe = true" in query
+
+
+class TestFolderIdCache:
+    def test_ttl(self, mocker):
+        folder_id_cache = FolderIdCache(ttl=10)
+        mocker.patch("snow_ipa.services.gdrive.cache.time.time", return_value=100)
+        folder_id_cache.set("snow", "id_snow")
+        assert folder_id_cache.get("/snow/") == "id_snow"
+        mocker.patch("snow_ipa.services.gdrive.cache.time.time", return_value=111)
+        assert folder_id_cache.get("snow") is None
+
+    def test_invalidate_sub_paths(self):
+        folder_id_cache = FolderIdCache()
+        folder_id_cache.set("snow", "id_snow")
+        folder_id_cache.set("snow/raster", "id_raster")
+        folder_id_cache.set("snowfall", "id_snowfall")
+        folder_id_cache.invalidate("snow")
+        assert list(folder_id_cache.entries) == ["snowfall"]
+
+    def test_save_once(self, tmp_path):
+        cache_path = tmp_path / "folder_ids.json"
+        folder_id_cache = FolderIdCache(cache_path=str(cache_path))
+        threads = [
+            threading.Thread(target=folder_id_cache.set, args=(f"f{i}", f"id_{i}"))
+            for i in range(20)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # Changes are only written when saved
+        assert not cache_path.exists()
+        folder_id_cache.save()
+        assert len(FolderIdCache(cache_path=str(cache_path)).entries) == 20
+
+    def test_get_folder_id_saves_cache(self, mocker, tmp_path):
+        cache_path = tmp_path / "folder_ids.json"
+        mocker.patch.object(
+            gdrive_assets, "folder_id_cache", FolderIdCache(cache_path=str(cache_path))
+        )
+        mocker.patch.object(
+            gdrive_assets, "find_child_folder", side_effect=["id_snow", "id_raster"]
+        )
+        save = mocker.spy(gdrive_assets.folder_id_cache, "save")
+        assert gdrive_assets.get_folder_id(mocker.MagicMock(), "snow/raster") == (
+            "id_raster"
+        )
+        save.assert_called_once()
+        assert FolderIdCache(cache_path=str(cache_path)).get("snow/raster") == (
+            "id_raster"
+        )
+
+    def test_unreadable_file(self, tmp_path):
+        cache_path = tmp_path / "folder_ids.json"
+        cache_path.write_text("not json")
+        assert FolderIdCache(cache_path=str(cache_path)).entries == {}
+
+
+class TestBuildListQuery:
+    def test_build_list_query(self):
+        query = gdrive_assets.build_list_query(
+            folder_id="id_raster", mime_types=["image/tiff"], name_contains="SCI_"
+        )
+        assert query == (
+            "'id_raster' in parents and trashed = false"
+            " and (mimeType = 'image/tiff') and name contains 'SCI_'"
+        )
+
+    def test_build_list_query_include_folders(self):
+        query = gdrive_assets.build_list_query(
+            folder_id="id_raster", mime_types=["image/tiff"], include_folders=True
+        )
+        assert query == (
+            "'id_raster' in parents and trashed = false and (mimeType = "
+            "'application/vnd.google-apps.folder' or ((mimeType = 'image/tiff')))"
+        )
+
+    def test_build_list_query_no_filters(self):
+        assert gdrive_assets.build_list_query() == "trashed = false"
+
+
+def test_get_asset_list_name_prefix(mocker, folder_id_cache):
+    folder_id_cache.set("raster_sci_cci", "id_raster")
+    drive_service = mocker.MagicMock()
+    files_list = drive_service.files.return_value.list
+    files_list.return_value.execute.return_value = {
+        "files": [
+            {"id": "1", "name": "SCI_2022-10.tif", "mimeType": "image/tiff"},
+            {"id": "2", "name": "OLD_SCI_2022-10.tif", "mimeType": "image/tiff"},
+        ]
+    }
+    assets = gdrive_assets.get_asset_list(
+        drive_service, "raster_sci_cci", "IMAGE", name_prefix="SCI_"
+    )
+    assert assets == ["SCI_2022-10"]
+    assert "name contains 'SCI_'" in files_list.call_args.kwargs["q"]
+    assert files_list.call_args.kwargs["pageSize"] == gdrive_assets.DRIVE_MAX_PAGE_SIZE
+
+
+class FakeBatch:
+    """BatchHttpRequest that answers each request with request.execute()."""
+
+    def __init__(self, callback):
+        self.callback = callback
+        self.requests = []
+
+    def add(self, request, request_id):
+        self.requests.append((request_id, request))
+
+    def execute(self):
+        for request_id, request in self.requests:
+            try:
+                self.callback(request_id, request.execute(), None)
+            except HttpError as e:
+                self.callback(request_id, None, e)
+
+
+@pytest.fixture
+def batch_service(mocker):
+    service = mocker.MagicMock()
+    service.new_batch_http_request.side_effect = lambda callback: FakeBatch(callback)
+    return service
+
+
+def http_error(status):
+    resp = httplib2.Response({"status": status})
+    resp.reason = "error"
+    return HttpError(resp, b"error")
+
+
+def test_execute_batch(mocker, batch_service):
+    requests = {}
+    for i in range(5):
+        requests[i] = mocker.MagicMock()
+        requests[i].execute.return_value = {"id": i}
+    requests[3].execute.side_effect = http_error(404)
+
+    results = execute_batch(batch_service, requests, batch_size=2)
+    assert batch_service.new_batch_http_request.call_count == 3
+    assert results[4] == {"id": 4}
+    assert isinstance(results[3], HttpError)
+
+
+def test_list_folders_children(mocker, batch_service):
+    pages = {
+        (None, "a"): {"files": [{"name": "a1"}], "nextPageToken": "t"},
+        ("t", "a"): {"files": [{"name": "a2"}]},
+        (None, "b"): {"files": [{"name": "b1"}]},
+    }
+
+    def list_files(q, pageToken, **kwargs):
+        request = mocker.MagicMock()
+        request.execute.return_value = pages[(pageToken, q.split("'")[1])]
+        return request
+
+    batch_service.files.return_value.list.side_effect = list_files
+    children = gdrive_assets.list_folders_children(batch_service, ["a", "b"])
+    assert children == {"a": [{"name": "a1"}, {"name": "a2"}], "b": [{"name": "b1"}]}
+    assert batch_service.new_batch_http_request.call_count == 2
+
+
+def test_iter_drive_files_recursive(mocker, batch_service):
+    folders = {
+        "root": [
+            {"id": "a", "name": "a", "mimeType": gdrive_assets.FOLDER_MIME_TYPE},
+            {"id": "b", "name": "b", "mimeType": gdrive_assets.FOLDER_MIME_TYPE},
+            {"id": "1", "name": "f1.tif", "mimeType": "image/tiff"},
+        ],
+        "a": [
+            {"id": "c", "name": "c", "mimeType": gdrive_assets.FOLDER_MIME_TYPE},
+            {"id": "2", "name": "f2.tif", "mimeType": "image/tiff"},
+        ],
+        "b": [{"id": "3", "name": "f3.tif", "mimeType": "image/tiff"}],
+        "c": [{"id": "4", "name": "f4.tif", "mimeType": "image/tiff"}],
+    }
+
+    def list_files(q, pageToken, **kwargs):
+        request = mocker.MagicMock()
+        request.execute.return_value = {"files": folders[q.split("'")[1]]}
+        return request
+
+    batch_service.files.return_value.list.side_effect = list_files
+    files = list(gdrive_assets.iter_drive_files(batch_service, "root", recursive=True))
+    assert files == ["f1.tif", "a/f2.tif", "b/f3.tif", "a/c/f4.tif"]
+    # One batch per level: root, [a, b], [c]
+    assert batch_service.new_batch_http_request.call_count == 3
+
+    files = list(
+        gdrive_assets.iter_drive_files(
+            batch_service, "root", recursive=True, max_depth=1
+        )
+    )
+    assert files == ["f1.tif", "a/f2.tif", "b/f3.tif"]
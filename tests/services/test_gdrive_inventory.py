@@ -0,0 +1,131 @@
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+from snow_ipa.services.gdrive import assets as gdrive_assets
+from snow_ipa.services.gdrive.inventory import DriveInventory, get_asset_list
+
+
+class Request:
+    def __init__(self, response):
+        self.response = response
+
+    def execute(self, http=None):
+        if isinstance(self.response, Exception):
+            raise self.response
+        return self.response
+
+
+class FakeDrive:
+    """In-memory Drive with the files().list and changes() calls used by inventories."""
+
+    def __init__(self):
+        self.files_ = {}
+        self.changes_ = []
+        self.calls = {"files.list": 0, "changes.list": 0}
+        self.expired_tokens = set()
+
+    def add(self, file_id, name, mime="image/tiff", parents=("folder",)):
+        self.files_[file_id] = {
+            "id": file_id,
+            "name": name,
+            "mimeType": mime,
+            "parents": list(parents),
+        }
+        self.changes_.append({"fileId": file_id, "file": dict(self.files_[file_id])})
+
+    def remove(self, file_id):
+        del self.files_[file_id]
+        self.changes_.append({"fileId": file_id, "removed": True})
+
+    def files(self):
+        return self
+
+    def changes(self):
+        return FakeChanges(self)
+
+    def list(self, q, **kwargs):
+        self.calls["files.list"] += 1
+        folder_id = q.split("'")[1]
+        return Request(
+            {
+                "files": [
+                    file
+                    for file in self.files_.values()
+                    if folder_id in file["parents"]
+                ]
+            }
+        )
+
+
+class FakeChanges:
+    def __init__(self, drive):
+        self.drive = drive
+
+    def getStartPageToken(self, **kwargs):
+        return Request({"startPageToken": str(len(self.drive.changes_))})
+
+    def list(self, pageToken, **kwargs):
+        self.drive.calls["changes.list"] += 1
+        if pageToken in self.drive.expired_tokens:
+            return Request(HttpError(httplib2.Response({"status": 410}), b"expired"))
+        changes = self.drive.changes_[int(pageToken) :]
+        return Request(
+            {"changes": changes, "newStartPageToken": str(len(self.drive.changes_))}
+        )
+
+
+@pytest.fixture
+def drive():
+    drive = FakeDrive()
+    drive.add("1", "SCI_2022-10.tif")
+    drive.add("2", "SCI_STATS_2022-10.csv", mime="text/csv")
+    drive.add("3", "OTHER.tif", parents=("other_folder",))
+    return drive
+
+
+def test_inventory_seed_and_incremental_sync(drive, tmp_path):
+    store_path = tmp_path / "inventory.json"
+    DriveInventory(drive, "folder", store_path).sync()
+    assert drive.calls == {"files.list": 1, "changes.list": 0}
+
+    drive.add("4", "SCI_2022-11.tif")
+    drive.add("5", "SCI_2022-12.tif", parents=("other_folder",))
+    drive.remove("1")
+
+    inventory = DriveInventory(drive, "folder", store_path)
+    inventory.sync()
+    assert drive.calls == {"files.list": 1, "changes.list": 1}
+    assert inventory.names(["image/tiff"]) == ["SCI_2022-11.tif"]
+
+    # No changes, a single changes().list request
+    inventory = DriveInventory(drive, "folder", store_path)
+    inventory.sync()
+    assert drive.calls == {"files.list": 1, "changes.list": 2}
+    assert sorted(inventory.names()) == ["SCI_2022-11.tif", "SCI_STATS_2022-10.csv"]
+
+
+def test_inventory_full_resync(drive, tmp_path):
+    store_path = tmp_path / "inventory.json"
+    inventory = DriveInventory(drive, "folder", store_path)
+    inventory.sync()
+    drive.expired_tokens.add(inventory.start_page_token)
+    drive.add("4", "SCI_2022-11.tif")
+
+    inventory = DriveInventory(drive, "folder", store_path)
+    inventory.sync()
+    assert drive.calls["files.list"] == 2
+    assert "SCI_2022-11.tif" in inventory.names()
+
+    # Inventories of other folders are not reused
+    assert DriveInventory(drive, "other_folder", store_path).files == {}
+
+
+def test_get_asset_list(drive, tmp_path):
+    gdrive_assets.folder_id_cache.set("raster", "folder")
+    try:
+        assets = get_asset_list(
+            drive, "raster", str(tmp_path / "inventory.json"), "IMAGE", "SCI_"
+        )
+    finally:
+        gdrive_assets.folder_id_cache.invalidate("raster")
+    assert assets == ["SCI_2022-10"]
@@ -0,0 +1,147 @@
+import pytest
+from unittest.mock import call
+import ee
+from snow_ipa.services.gee.assets import (
+    check_asset_exists,
+    get_asset_info,
+    get_asset_list,
+    get_trailing_ym,
+    replace_asset,
+    temporary_asset_id,
+    to_asset_name,
+)
+
+
+class TestToAssetName:
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("Región de Valparaíso", "Region-de-Valparaiso"),
+            ("Aysén del Gral. C. Ibáñez", "Aysen-del-Gral-C-Ibanez"),
+            ("Los_Ríos", "Los-Rios"),
+            (5, "5"),
+        ],
+    )
+    def test_to_asset_name(self, value, expected):
+        assert to_asset_name(value) == expected
+
+
+def test_get_trailing_ym():
+    assets = ["SCI_2022-10", "SCI_Maule_2022-11", "SCI_2022-13", "SCI"]
+    assert get_trailing_ym(assets) == ["2022-11", "2022-10"]
+
+
+class TestGetAssetList:
+    @pytest.fixture
+    def mock_ee_data(self, mocker):
+        ee_data = mocker.patch("snow_ipa.services.gee.assets.ee_data")
+        ee_data.getAsset.return_value = {
+            "name": "projects/p/assets/f",
+            "type": "FOLDER",
+        }
+        ee_data.listAssets.side_effect = [
+            {
+                "assets": [
+                    {"name": "projects/p/assets/f/SCI_2022-10", "type": "IMAGE"},
+                    {"name": "projects/p/assets/f/OTHER_2022-10", "type": "IMAGE"},
+                ],
+                "nextPageToken": "t1",
+            },
+            {
+                "assets": [
+                    {"name": "projects/p/assets/f/SCI_2022-11", "type": "IMAGE"},
+                    {"name": "projects/p/assets/f/SCI_STATS_2022-11", "type": "TABLE"},
+                ]
+            },
+        ]
+        return ee_data
+
+    def test_get_asset_list_paginated(self, mock_ee_data):
+        assets = get_asset_list("f", "IMAGE", page_size=2)
+        assert list(assets) == [
+            "projects/p/assets/f/SCI_2022-10",
+            "projects/p/assets/f/OTHER_2022-10",
+            "projects/p/assets/f/SCI_2022-11",
+        ]
+        assert mock_ee_data.listAssets.call_args_list[1].args[0]["pageToken"] == "t1"
+
+    def test_get_asset_list_name_prefix(self, mock_ee_data):
+        assets = get_asset_list("f", name_prefix="SCI_")
+        assert list(assets) == [
+            "projects/p/assets/f/SCI_2022-10",
+            "projects/p/assets/f/SCI_2022-11",
+            "projects/p/assets/f/SCI_STATS_2022-11",
+        ]
+
+
+class TestGetAssetInfo:
+    @pytest.fixture
+    def mock_ee_data(self, mocker):
+        ee_data = mocker.patch("snow_ipa.services.gee.assets.ee_data")
+        ee_data.getAsset.return_value = {
+            "name": "projects/p/assets/regions",
+            "type": "TABLE",
+            "sizeBytes": "2048",
+            "updateTime": "2024-01-01T00:00:00Z",
+        }
+        return ee_data
+
+    def test_get_asset_info(self, mock_ee_data):
+        assert get_asset_info("regions") == {
+            "id": "projects/p/assets/regions",
+            "type": "TABLE",
+            "size_bytes": 2048,
+            "update_time": "2024-01-01T00:00:00Z",
+        }
+        mock_ee_data.getAsset.assert_called_once_with("regions")
+        mock_ee_data.listAssets.assert_not_called()
+
+    def test_get_asset_info_not_found(self, mock_ee_data):
+        mock_ee_data.getAsset.side_effect = ee.EEException("Asset 'x' not found.")
+        assert get_asset_info("x") is None
+        assert check_asset_exists("x") is False
+
+    def test_get_asset_info_raises_other_errors(self, mock_ee_data):
+        mock_ee_data.getAsset.side_effect = ee.EEException("Too many requests")
+        with pytest.raises(ee.EEException):
+            get_asset_info("regions")
+
+    def test_replace_asset(self, mock_ee_data):
+        mock_ee_data.getAsset.side_effect = [
+            {"name": "assets/A", "type": "IMAGE"},
+            ee.EEException("Asset 'assets/MOD10A1_2024-01_BAK' not found."),
+        ]
+        tmp_id = temporary_asset_id("assets/MOD10A1_2024-01")
+        assert tmp_id == "assets/MOD10A1_2024-01_TMP"
+        replace_asset(tmp_id, "assets/MOD10A1_2024-01")
+        assert mock_ee_data.renameAsset.call_args_list == [
+            call("assets/MOD10A1_2024-01", "assets/MOD10A1_2024-01_BAK"),
+            call(tmp_id, "assets/MOD10A1_2024-01"),
+        ]
+        mock_ee_data.deleteAsset.assert_called_once_with("assets/MOD10A1_2024-01_BAK")
+
+    def test_replace_asset_new(self, mock_ee_data):
+        mock_ee_data.getAsset.side_effect = ee.EEException("Asset not found.")
+        replace_asset("assets/A_TMP", "assets/A")
+        mock_ee_data.renameAsset.assert_called_once_with("assets/A_TMP", "assets/A")
+        mock_ee_data.deleteAsset.assert_not_called()
+
+    def test_replace_asset_restores_backup(self, mock_ee_data):
+        mock_ee_data.getAsset.side_effect = [
+            {"name": "assets/A", "type": "IMAGE"},
+            ee.EEException("Asset not found."),
+        ]
+        mock_ee_data.renameAsset.side_effect = [
+            None,
+            ee.EEException("Quota exceeded"),
+            None,
+        ]
+        with pytest.raises(ee.EEException):
+            replace_asset("assets/A_TMP", "assets/A")
+        mock_ee_data.renameAsset.assert_called_with("assets/A_BAK", "assets/A")
+        mock_ee_data.deleteAsset.assert_not_called()
+
+    def test_check_asset_exists_type(self, mock_ee_data):
+        assert check_asset_exists("regions", "TABLE") is True
+        assert check_asset_exists("regions", ["IMAGE", "TABLE"]) is True
+        assert check_asset_exists("regions", "IMAGE") is False
@@ -0,0 +1,36 @@
+from snow_ipa.services.gee import calculations
+
+
+def test_dissolve_regions(mocker):
+    mocker.patch.object(calculations, "Filter")
+    feature = mocker.patch.object(calculations, "Feature")
+    regions = mocker.MagicMock()
+
+    calculations.dissolve_regions(regions, "REGION")
+
+    regions.distinct.assert_called_once_with("REGION")
+    dissolve = regions.distinct.return_value.map.call_args.args[0]
+
+    # A region made of several features becomes one feature with their union
+    region = mocker.MagicMock()
+    region.get.return_value = "Valparaiso"
+    dissolve(region)
+    calculations.Filter.eq.assert_called_once_with("REGION", "Valparaiso")
+    regions.filter.assert_called_once_with(calculations.Filter.eq.return_value)
+    union = regions.filter.return_value.geometry.return_value.dissolve.return_value
+    feature.assert_called_once_with(union, {"REGION": "Valparaiso"})
+
+
+def test_region_stats_one_row_per_region(mocker):
+    dissolve_regions = mocker.patch.object(calculations, "dissolve_regions")
+    mocker.patch.object(calculations, "Reducer")
+    image = mocker.MagicMock()
+    regions = mocker.MagicMock()
+
+    calculations.region_stats(image, regions, "REGION", "2022-10-01", 500)
+
+    dissolve_regions.assert_called_once_with(regions, "REGION")
+    reduce_regions = image.select.return_value.reduceRegions
+    assert reduce_regions.call_args.kwargs["collection"] is (
+        dissolve_regions.return_value
+    )
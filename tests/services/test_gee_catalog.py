@@ -0,0 +1,234 @@
+from datetime import date, timedelta
+from snow_ipa.services.gee.catalog import (
+    get_latest_image_date,
+    poll_latest_image_date,
+    scan_month_coverage,
+    count_images,
+    last_covered_date,
+    last_complete_month,
+    available_months,
+    CatalogCache,
+    get_month_catalog,
+    get_month_coverage,
+    month_fingerprints,
+)
+
+
+def daily_images(start: str, end: str) -> list[dict]:
+    """Returns listImages items for each day between start and end (inclusive)."""
+    day = date.fromisoformat(start)
+    images = []
+    while day <= date.fromisoformat(end):
+        images.append({"startTime": f"{day.isoformat()}T00:00:00Z"})
+        day += timedelta(days=1)
+    return images
+
+
+def test_get_latest_image_date(mocker):
+    ee_data = mocker.patch("snow_ipa.services.gee.catalog.ee_data")
+    ee_data.listImages.side_effect = [
+        {
+            "images": [
+                {"startTime": "2024-10-30T00:00:00Z"},
+                {"startTime": "2024-10-31T00:00:00Z"},
+            ],
+            "nextPageToken": "t1",
+        },
+        {"images": [{"startTime": "2024-10-29T00:00:00Z"}]},
+    ]
+    assert get_latest_image_date("MODIS/061/MOD10A1", since="2024-10-29") == (
+        "2024-10-31"
+    )
+    params = ee_data.listImages.call_args_list[0].args[0]
+    assert params["startTime"] == "2024-10-29T00:00:00Z"
+    assert params["view"] == "BASIC"
+
+
+def test_get_latest_image_date_no_new_images(mocker):
+    ee_data = mocker.patch("snow_ipa.services.gee.catalog.ee_data")
+    ee_data.listImages.return_value = {"images": []}
+    assert get_latest_image_date("MODIS/061/MOD10A1", since="2024-10-31") is None
+
+
+def test_poll_latest_image_date_known(mocker):
+    ee_data = mocker.patch("snow_ipa.services.gee.catalog.ee_data")
+    ee_data.listImages.return_value = {"images": []}
+    assert poll_latest_image_date("MODIS/061/MOD10A1", "2024-10-31") == "2024-10-31"
+    params = ee_data.listImages.call_args.args[0]
+    assert params["startTime"] == "2024-10-31T00:00:00Z"
+
+
+def test_poll_latest_image_date_unknown(mocker):
+    ee_data = mocker.patch("snow_ipa.services.gee.catalog.ee_data")
+    ee_data.listImages.return_value = {
+        "images": [{"startTime": "2024-10-31T00:00:00Z"}]
+    }
+    assert poll_latest_image_date("MODIS/061/MOD10A1", lookback_days=10) == (
+        "2024-10-31"
+    )
+    params = ee_data.listImages.call_args.args[0]
+    since = (date.today() - timedelta(days=10)).isoformat()
+    assert params["startTime"] == f"{since}T00:00:00Z"
+
+
+def test_scan_month_coverage(mocker):
+    ee_data = mocker.patch("snow_ipa.services.gee.catalog.ee_data")
+    ee_data.listImages.side_effect = [
+        {"images": daily_images("2024-01-01", "2024-01-31"), "nextPageToken": "t1"},
+        {"images": daily_images("2024-02-01", "2024-02-10")},
+    ]
+    coverage = scan_month_coverage("MODIS/061/MOD10A1", start="2024-01-01")
+    assert sorted(coverage.keys()) == ["2024-01", "2024-02"]
+    assert len(coverage["2024-02"]) == 29
+    assert sum(coverage["2024-02"]) == 10
+    assert count_images(coverage) == 41
+    assert last_covered_date(coverage) == date(2024, 2, 10)
+    assert ee_data.listImages.call_args_list[1].args[0]["pageToken"] == "t1"
+
+
+def test_last_complete_month(mocker):
+    ee_data = mocker.patch("snow_ipa.services.gee.catalog.ee_data")
+    ee_data.listImages.return_value = {
+        "images": daily_images("2024-01-01", "2024-03-30")
+    }
+    coverage = scan_month_coverage("MODIS/061/MOD10A1", start="2024-01-01")
+    # March is missing its last day
+    assert last_complete_month(coverage, date(2024, 3, 31)) == date(2024, 2, 29)
+    assert last_complete_month(coverage, date(2023, 12, 31)) is None
+    assert last_complete_month({}, date(2024, 3, 31)) is None
+
+
+def test_available_months(mocker):
+    ee_data = mocker.patch("snow_ipa.services.gee.catalog.ee_data")
+    ee_data.listImages.return_value = {
+        "images": daily_images("2024-01-01", "2024-01-31")
+        + daily_images("2024-02-02", "2024-03-31")
+        + daily_images("2024-04-01", "2024-04-15")
+    }
+    coverage = scan_month_coverage("MODIS/061/MOD10A1", start="2024-01-01")
+    # Months without an image on the first day are not available
+    assert available_months(coverage, date(2024, 3, 31)) == [
+        "2024-03-01",
+        "2024-01-01",
+    ]
+    assert available_months(coverage, None) == []
+
+
+def test_catalog_cache_incremental_refresh(mocker, tmp_path):
+    mocker.patch(
+        "snow_ipa.services.gee.catalog.date", wraps=date
+    ).today.return_value = date(2024, 3, 10)
+    ee_data = mocker.patch("snow_ipa.services.gee.catalog.ee_data")
+    ee_data.listImages.return_value = {
+        "images": daily_images("2023-12-01", "2024-03-09")
+    }
+    store_path = str(tmp_path / "catalog.json")
+
+    coverage = get_month_coverage("MODIS/061/MOD10A1", "2023-12-01", store_path)
+    assert count_images(coverage) == 100
+    assert ee_data.listImages.call_args.args[0]["startTime"] == ("2023-12-01T00:00:00Z")
+
+    # Only the months since the last scan minus the overlap are scanned again
+    ee_data.listImages.return_value = {
+        "images": daily_images("2024-02-01", "2024-03-10")
+    }
+    coverage = get_month_coverage("MODIS/061/MOD10A1", "2023-12-01", store_path)
+    assert ee_data.listImages.call_args.args[0]["startTime"] == ("2024-02-01T00:00:00Z")
+    assert count_images(coverage) == 101
+    assert last_covered_date(coverage) == date(2024, 3, 10)
+
+
+def test_catalog_cache_revalidation(mocker, tmp_path):
+    ee_data = mocker.patch("snow_ipa.services.gee.catalog.ee_data")
+    ee_data.listImages.return_value = {
+        "images": daily_images("2024-01-01", "2024-01-31")
+    }
+    store_path = str(tmp_path / "catalog.json")
+    cache = CatalogCache("MODIS/061/MOD10A1", "2024-01-01", store_path)
+    cache.refresh()
+    assert not CatalogCache(
+        "MODIS/061/MOD10A1", "2024-01-01", store_path
+    ).needs_revalidation()
+
+    cache = CatalogCache("MODIS/061/MOD10A1", "2024-01-01", store_path)
+    cache.validated_at -= 31 * 24 * 60 * 60
+    assert cache.needs_revalidation()
+    # A cache for another collection is ignored
+    assert CatalogCache("OTHER", "2024-01-01", store_path).coverage == {}
+
+
+def test_month_fingerprints(mocker):
+    ee_data = mocker.patch("snow_ipa.services.gee.catalog.ee_data")
+    images = [
+        {
+            "id": "MODIS/061/MOD10A1/2024_01_01",
+            "startTime": "2024-01-01T00:00:00Z",
+            "updateTime": "t1",
+        },
+        {
+            "id": "MODIS/061/MOD10A1/2024_02_01",
+            "startTime": "2024-02-01T00:00:00Z",
+            "updateTime": "t1",
+        },
+        {
+            "id": "MODIS/061/MOD10A1/2024_03_01",
+            "startTime": "2024-03-01T00:00:00Z",
+            "updateTime": "t1",
+        },
+    ]
+    ee_data.listImages.return_value = {"images": images}
+    fingerprints = month_fingerprints("MODIS/061/MOD10A1", ["2024-03-01", "2024-01-01"])
+    assert sorted(fingerprints.keys()) == ["2024-01-01", "2024-03-01"]
+    params = ee_data.listImages.call_args.args[0]
+    assert params["startTime"] == "2024-01-01T00:00:00Z"
+    assert params["endTime"] == "2024-04-01T00:00:00Z"
+
+    # A reprocessed image changes the fingerprint of its month only
+    images[2] = {**images[2], "updateTime": "t2"}
+    reprocessed = month_fingerprints("MODIS/061/MOD10A1", ["2024-03-01", "2024-01-01"])
+    assert reprocessed["2024-01-01"] == fingerprints["2024-01-01"]
+    assert reprocessed["2024-03-01"] != fingerprints["2024-03-01"]
+    assert month_fingerprints("MODIS/061/MOD10A1", []) == {}
+
+
+def test_catalog_cache_fingerprints(mocker, tmp_path):
+    mocker.patch(
+        "snow_ipa.services.gee.catalog.date", wraps=date
+    ).today.return_value = date(2024, 3, 10)
+    ee_data = mocker.patch("snow_ipa.services.gee.catalog.ee_data")
+    images = [
+        {**image, "id": f"MODIS/{image['startTime'][:10]}", "updateTime": "t1"}
+        for image in daily_images("2023-12-01", "2024-03-09")
+    ]
+    ee_data.listImages.return_value = {"images": images}
+    store_path = str(tmp_path / "catalog.json")
+    _, fingerprints = get_month_catalog("MODIS/061/MOD10A1", "2023-12-01", store_path)
+    assert sorted(fingerprints.keys()) == ["2023-12", "2024-01", "2024-02", "2024-03"]
+    # Same fingerprints as a listing of the months
+    assert month_fingerprints("MODIS/061/MOD10A1", ["2024-01-01"]) == {
+        "2024-01-01": fingerprints["2024-01"]
+    }
+
+    # The incremental scan updates the fingerprints of the months scanned again
+    # and keeps the older ones from the cache
+    ee_data.listImages.return_value = {
+        "images": [
+            {**image, "updateTime": "t2"}
+            for image in images
+            if image["startTime"] >= "2024-02"
+        ]
+    }
+    _, refreshed = get_month_catalog("MODIS/061/MOD10A1", "2023-12-01", store_path)
+    assert refreshed["2023-12"] == fingerprints["2023-12"]
+    assert refreshed["2024-01"] == fingerprints["2024-01"]
+    assert refreshed["2024-02"] != fingerprints["2024-02"]
+
+
+def test_catalog_cache_without_fingerprints(tmp_path):
+    store_path = tmp_path / "catalog.json"
+    store_path.write_text(
+        '{"collection": "MODIS/061/MOD10A1", "start": "2024-01-01", '
+        '"scanned_until": "2024-03-10", "validated_at": 1e12, "coverage": {}}'
+    )
+    cache = CatalogCache("MODIS/061/MOD10A1", "2024-01-01", str(store_path))
+    assert cache.needs_revalidation()
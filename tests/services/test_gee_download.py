@@ -0,0 +1,63 @@
+import pytest
+from pathlib import Path
+from snow_ipa.services.gee import download
+
+
+class TestPixelGrid:
+    def test_get_pixel_grid(self):
+        grid = download.get_pixel_grid([-72, -34, -71, -33], 0.25)
+        assert grid == {"width": 4, "height": 4, "x": -72, "y": -33, "resolution": 0.25}
+
+    def test_split_grid(self):
+        grid = download.get_pixel_grid([0, 0, 5, 3], 1)
+        chunks = download.split_grid(grid, max_side=2)
+        assert len(chunks) == 6
+        last = chunks[-1]
+        assert (last["row"], last["col"]) == (1, 2)
+        assert (last["width"], last["height"]) == (1, 1)
+        assert last["grid"]["affineTransform"]["translateX"] == 4
+        assert last["grid"]["affineTransform"]["translateY"] == 1
+
+
+class TestDownloadImage:
+    @pytest.fixture
+    def mock_compute_pixels(self, mocker):
+        return mocker.patch.object(
+            download.ee_data, "computePixels", return_value=b"tiff"
+        )
+
+    def test_download_single_chunk(self, tmp_path, mock_compute_pixels):
+        output = download.download_image(
+            image=None,
+            bounds=[0, 0, 0.01, 0.01],
+            path=str(tmp_path / "SCI_2022-11"),
+            scale=500,
+            bands=["SCI", "CCI"],
+            bytes_per_band=8,
+        )
+        assert output == (tmp_path / "SCI_2022-11.tif").as_posix()
+        assert Path(output).read_bytes() == b"tiff"
+        assert mock_compute_pixels.call_count == 1
+
+    def test_download_multiple_chunks(self, tmp_path, mock_compute_pixels):
+        output = download.download_image(
+            image=None,
+            bounds=[0, 0, 0.1, 0.1],
+            path=str(tmp_path / "SCI_2022-11"),
+            scale=500,
+            bands=["SCI", "CCI"],
+            bytes_per_band=8,
+            max_request_bytes=16 * 10 * 10,
+        )
+        assert output.endswith("SCI_2022-11.vrt")
+        assert mock_compute_pixels.call_count == 9
+        assert "SCI_2022-11_2-2.tif" in Path(output).read_text()
+
+
+def test_direct_download_task(mocker):
+    mocker.patch.object(download, "download_image", side_effect=RuntimeError("quota"))
+    task = download.DirectDownloadTask(image=None, bounds=[0, 0, 1, 1], path="x")
+    assert task.status()["state"] == "UNSUBMITTED"
+    task.start()
+    task._thread.join()
+    assert task.status() == {"state": "FAILED", "error_message": "quota"}
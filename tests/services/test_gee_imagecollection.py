@@ -0,0 +1,54 @@
+import pytest
+from snow_ipa.services.gee import imagecollection
+
+
+@pytest.fixture
+def reducer(mocker):
+    return mocker.patch.object(imagecollection, "Reducer")
+
+
+def test_statistics_reducer(reducer):
+    imagecollection.statistics_reducer(["count", "stdDev"])
+
+    # A single combined reducer with the mean and each statistic
+    reducer.mean.return_value.combine.assert_called_once_with(
+        reducer.count.return_value, sharedInputs=True
+    )
+    reducer.mean.return_value.combine.return_value.combine.assert_called_once_with(
+        reducer.stdDev.return_value, sharedInputs=True
+    )
+    reducer.min.assert_not_called()
+    reducer.max.assert_not_called()
+
+
+def test_ic_reduce_statistics(mocker, reducer):
+    collection = mocker.MagicMock()
+
+    imagecollection.ic_reduce_statistics(collection, ["SCI", "CCI"], ["count", "max"])
+
+    collection.select.assert_called_once_with(["SCI", "CCI"])
+    ee_reduced = collection.select.return_value.reduce.return_value
+    ee_reduced.select.assert_called_once_with(
+        ["SCI_mean", "CCI_mean", "SCI_count", "CCI_count", "SCI_max", "CCI_max"]
+    )
+    ee_reduced.select.return_value.rename.assert_called_once_with(
+        ["SCI", "CCI", "SCI_count", "CCI_count", "SCI_max", "CCI_max"]
+    )
+    ee_reduced.select.return_value.rename.return_value.toDouble.assert_called_once()
+
+
+def test_ic_monthly_mean_mean_only(mocker):
+    mocker.patch.object(imagecollection, "ee_date")
+    mocker.patch.object(imagecollection, "ee_list")
+    mocker.patch.object(imagecollection, "ImageCollection")
+    reduce_statistics = mocker.patch.object(imagecollection, "ic_reduce_statistics")
+    collection = mocker.MagicMock()
+
+    imagecollection.ic_monthly_mean(["2022-10-01"], collection)
+    reduce_statistics.assert_not_called()
+    collection.filterDate.return_value.mean.assert_called_once()
+
+    imagecollection.ic_monthly_mean(["2022-10-01"], collection, statistics=["count"])
+    reduce_statistics.assert_called_once_with(
+        collection.filterDate.return_value, ["SCI", "CCI"], ["count"]
+    )
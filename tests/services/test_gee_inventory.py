@@ -0,0 +1,95 @@
+import pytest
+from snow_ipa.services.gee.inventory import GeeInventory, get_asset_list
+
+FOLDER = "projects/p/assets/f"
+
+
+class FakeEEData:
+    """Fake ee.data with a single folder of assets."""
+
+    def __init__(self):
+        self.folder_update_time = "2024-01-01T00:00:00Z"
+        self.assets = [
+            {"name": f"{FOLDER}/SCI_2022-10", "type": "IMAGE", "updateTime": "t1"},
+            {
+                "name": f"{FOLDER}/SCI_STATS_2022-10",
+                "type": "TABLE",
+                "updateTime": "t1",
+            },
+            {"name": f"{FOLDER}/sub", "type": "FOLDER"},
+        ]
+        self.list_calls = 0
+
+    def getAsset(self, path):
+        return {"name": FOLDER, "type": "FOLDER", "updateTime": self.folder_update_time}
+
+    def listAssets(self, params):
+        self.list_calls += 1
+        return {"assets": self.assets}
+
+
+@pytest.fixture
+def ee_data(mocker):
+    fake = FakeEEData()
+    mocker.patch("snow_ipa.services.gee.assets.ee_data", fake)
+    return fake
+
+
+def test_inventory_skips_listing_when_folder_unchanged(ee_data, tmp_path):
+    store_path = str(tmp_path / "inventory.json")
+    assert get_asset_list("f", store_path, "IMAGE") == [f"{FOLDER}/SCI_2022-10"]
+    assert ee_data.list_calls == 1
+
+    assert get_asset_list("f", store_path, "TABLE") == [f"{FOLDER}/SCI_STATS_2022-10"]
+    assert ee_data.list_calls == 1
+
+    ee_data.folder_update_time = "2024-02-01T00:00:00Z"
+    ee_data.assets.append(
+        {"name": f"{FOLDER}/SCI_2022-11", "type": "IMAGE", "updateTime": "t2"}
+    )
+    assert get_asset_list("f", store_path, "IMAGE", name_prefix="SCI_2") == [
+        f"{FOLDER}/SCI_2022-10",
+        f"{FOLDER}/SCI_2022-11",
+    ]
+    assert ee_data.list_calls == 2
+
+
+def test_inventory_max_age(ee_data, tmp_path):
+    store_path = str(tmp_path / "inventory.json")
+    GeeInventory("f", store_path).sync()
+    inventory = GeeInventory("f", store_path, max_age=0)
+    assert inventory.sync() is True
+    assert inventory.assets[f"{FOLDER}/SCI_2022-10"]["month"] == "2022-10"
+
+
+def test_inventory_mark_stale(ee_data, tmp_path):
+    store_path = str(tmp_path / "inventory.json")
+    inventory = GeeInventory("f", store_path)
+    inventory.sync()
+    inventory.mark_stale()
+    inventory.save()
+    assert GeeInventory("f", store_path).sync() is True
+    assert ee_data.list_calls == 2
+
+
+def test_inventory_folder_not_found(ee_data, tmp_path, mocker):
+    mocker.patch(
+        "snow_ipa.services.gee.inventory.gee_assets.get_asset_info", return_value=None
+    )
+    with pytest.raises(ValueError):
+        GeeInventory("f", str(tmp_path / "inventory.json")).sync()
+
+
+def test_inventory_add_asset(ee_data, tmp_path):
+    store_path = str(tmp_path / "inventory.json")
+    inventory = GeeInventory("f", store_path)
+    inventory.sync()
+    inventory.add_asset("SCI_2022-11", "IMAGE")
+    inventory.save()
+
+    # The folder is unchanged, the new asset is read from the inventory
+    assert get_asset_list("f", store_path, "IMAGE") == [
+        f"{FOLDER}/SCI_2022-10",
+        f"{FOLDER}/SCI_2022-11",
+    ]
+    assert ee_data.list_calls == 1
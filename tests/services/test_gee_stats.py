@@ -0,0 +1,80 @@
+import csv
+import pytest
+from snow_ipa.services.gee import stats
+
+
+class TestFetchFeaturePages:
+    def test_fetch_feature_pages(self, mocker):
+        responses = [
+            {"features": [{"properties": {"region": "A"}}], "nextPageToken": "t1"},
+            {"features": [{"properties": {"region": "B"}}]},
+        ]
+        compute = mocker.patch.object(
+            stats.ee_data, "computeFeatures", side_effect=responses
+        )
+        pages = list(stats.fetch_feature_pages("collection", page_size=1))
+        assert pages == [[{"region": "A"}], [{"region": "B"}]]
+        assert compute.call_args_list[1].args[0]["pageToken"] == "t1"
+
+
+class TestIterRegionStats:
+    @pytest.fixture
+    def mock_ee(self, mocker):
+        mocker.patch.object(stats.ee_date, "Date")
+        mocker.patch.object(
+            stats.calculations, "region_stats", side_effect=lambda **kw: kw["month"]
+        )
+
+    def test_iter_region_stats(self, mocker, mock_ee):
+        mocker.patch.object(
+            stats,
+            "fetch_feature_pages",
+            side_effect=lambda month, page_size: iter(
+                [
+                    [{"month": month[:7], "region": "A"}],
+                    [{"month": month[:7], "region": "B"}],
+                ]
+            ),
+        )
+        rows = list(
+            stats.iter_region_stats(
+                mocker.MagicMock(), ["2022-10-01", "2022-11-01"], None, "REGION"
+            )
+        )
+        assert len(rows) == 4
+        assert {row["month"] for row in rows} == {"2022-10", "2022-11"}
+
+    def test_iter_region_stats_error(self, mocker, mock_ee):
+        mocker.patch.object(
+            stats, "fetch_feature_pages", side_effect=RuntimeError("quota")
+        )
+        with pytest.raises(RuntimeError):
+            list(stats.iter_region_stats(mocker.MagicMock(), ["2022-10-01"], None, "R"))
+
+
+class TestWriteRegionStats:
+    def test_write_region_stats_csv(self, tmp_path):
+        rows = [
+            {
+                "region": "A",
+                "month": "2022-10",
+                "sci_mean": 1.5,
+                "cci_mean": 2.0,
+                "valid_pixel_count": 10,
+            },
+            {
+                "region": "B",
+                "month": "2022-10",
+                "sci_mean": 0.0,
+                "cci_mean": 0.0,
+                "valid_pixel_count": 0,
+            },
+        ]
+        path = tmp_path / "stats.csv"
+        assert stats.write_region_stats(iter(rows), str(path)) == 2
+        with open(path) as f:
+            assert [row["region"] for row in csv.DictReader(f)] == ["A", "B"]
+
+    def test_write_region_stats_invalid_format(self, tmp_path):
+        with pytest.raises(ValueError):
+            stats.write_region_stats([], str(tmp_path / "stats.xlsx"), "xlsx")
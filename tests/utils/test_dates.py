@@ -1,10 +1,13 @@
 import pytest
-from datetime import date, datetime, timedelta
+from datetime import date, datetime, time, timedelta
 import logging
 from snow_ipa.utils.dates import (
+    months_between,
     check_valid_date,
     check_valid_date_list,
     current_year_month,
+    in_quiet_hours,
+    parse_quiet_hours,
     prev_month_last_date,
 )
 
@@ -49,3 +52,29 @@ def test_prev_month_last_date(monkeypatch):
 
     monkeypatch.setattr("snow_ipa.utils.dates.datetime", MockDateTime)
     assert prev_month_last_date() == date(2022, 11, 30)
+
+
+def test_months_between():
+    assert months_between("2023-11-15", "2024-01-01") == [
+        "2023-11-01",
+        "2023-12-01",
+        "2024-01-01",
+    ]
+    assert months_between("2024-01-01", "2024-01-31") == ["2024-01-01"]
+    assert months_between("2024-02-01", "2024-01-01") == []
+
+
+class TestQuietHours:
+
+    def test_parse_quiet_hours(self):
+        assert parse_quiet_hours("22-6") == (time(22), time(6))
+        assert parse_quiet_hours("08:30 - 17:00") == (time(8, 30), time(17))
+        with pytest.raises(ValueError):
+            parse_quiet_hours("22")
+
+    def test_in_quiet_hours(self):
+        assert in_quiet_hours(time(23), time(22), time(6)) is True
+        assert in_quiet_hours(time(5, 59), time(22), time(6)) is True
+        assert in_quiet_hours(time(6), time(22), time(6)) is False
+        assert in_quiet_hours(time(12), time(8), time(17)) is True
+        assert in_quiet_hours(time(18), time(8), time(17)) is False
@@ -0,0 +1,49 @@
+import pytest
+from snow_ipa.utils.traversal import walk_tree
+
+TREE = {
+    "root": [("a.tif", False), ("sub", True)],
+    "sub": [("b.tif", False), ("deep", True)],
+    "deep": [("c.tif", False)],
+}
+
+
+def walk(max_depth=None):
+    items = walk_tree(
+        root="root",
+        list_children=lambda folder: TREE[folder],
+        is_folder=lambda child: child[1],
+        get_name=lambda child: child[0],
+        get_id=lambda child: child[0],
+        max_depth=max_depth,
+    )
+    return sorted("/".join(path + (child[0],)) for child, path in items)
+
+
+@pytest.mark.parametrize(
+    "max_depth, expected",
+    [
+        (None, ["a.tif", "sub/b.tif", "sub/deep/c.tif"]),
+        (0, ["a.tif"]),
+        (1, ["a.tif", "sub/b.tif"]),
+    ],
+)
+def test_walk_tree(max_depth, expected):
+    assert walk(max_depth) == expected
+
+
+def test_walk_tree_raises_listing_errors():
+    def list_children(folder):
+        if folder == "sub":
+            raise RuntimeError("listing failed")
+        return TREE[folder]
+
+    items = walk_tree(
+        root="root",
+        list_children=list_children,
+        is_folder=lambda child: child[1],
+        get_name=lambda child: child[0],
+        get_id=lambda child: child[0],
+    )
+    with pytest.raises(RuntimeError):
+        list(items)